@@ -391,6 +391,7 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
                     success=not is_error,
                     session_id=session_id,
                     retry_code=RetryCode.NONE,  # No retry needed for successful or non-retryable errors
+                    usage=result_message.get("usage"),
                 )
             else:
                 # No result message found, try to extract meaningful error
@@ -1,7 +1,7 @@
 """Data types for GitHub API responses and Claude Code agent."""
 
 from datetime import datetime
-from typing import Optional, List, Literal
+from typing import Any, Dict, Optional, List, Literal
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -64,6 +64,9 @@ SlashCommand = Literal[
     "/patch",
     "/document",
     "/track_agentic_kpis",
+    # Optimized (single planning call) workflow commands
+    "/plan_complete_workflow",
+    "/validate_workflow",
     # Installation/setup commands
     "/install_worktree",
 ]
@@ -163,6 +166,7 @@ class AgentPromptResponse(BaseModel):
     success: bool
     session_id: Optional[str] = None
     retry_code: RetryCode = RetryCode.NONE
+    usage: Optional[Dict[str, Any]] = None  # Token usage from the result message
 
 
 class AgentTemplateRequest(BaseModel):
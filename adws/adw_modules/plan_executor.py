@@ -14,6 +14,11 @@ from typing import Dict, Any, Tuple, Optional
 
 from .plan_parser import WorkflowConfig
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
 
 class ExecutionResult:
     """Result of plan execution."""
@@ -47,6 +52,12 @@ class ExecutionResult:
 
     def save_to_file(self, file_path: str):
         """Save execution result to JSON file."""
+        if orjson is not None:
+            Path(file_path).write_bytes(
+                orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+            )
+            return
+
         with open(file_path, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
 
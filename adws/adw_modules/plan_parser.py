@@ -4,13 +4,58 @@ Plan parser for ADW workflows.
 Extracts structured YAML configuration from AI-generated comprehensive plans.
 """
 
+import copy
+import hashlib
+import os
+import pickle
 import re
-import yaml
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+# yaml is imported on first parse so importing this module (e.g. during test
+# collection or for validate_workflow_config alone) doesn't pay for it.
+_yaml = None
+_Loader = None
+
+
+def _get_yaml():
+    """Import yaml and pick the fastest available safe loader, once."""
+    global _yaml, _Loader
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:  # PyYAML built without LibYAML
+            from yaml import SafeLoader as loader
+        _yaml, _Loader = yaml, loader
+    return _yaml
+
+
+# Patterns are compiled once at import; extract_* run on every AI response.
+_YAML_FENCE_RE = re.compile(r'```yaml\s*\n(.*?)\n```', re.DOTALL)
+_WORKFLOW_HEADER_RE = re.compile(
+    r'# WORKFLOW CONFIGURATION.*?\n(.*?)(?=\n#[^#]|\n```|\Z)', re.DOTALL
+)
+
+# One pass over the text: group 1 is a path after a "Plan file:" / "Created
+# file at" / "Saved to" label, group 2 a bare specs/ plan path
+_PLAN_FILE_RE = re.compile(
+    r'(?:Plan file:|Created file at|Saved to)\s*`?([^`\n]+\.md)`?'
+    r'|(specs/issue-\d+-adw-[a-z0-9]+-sdlc_planner-[^\.]+\.md)',
+    re.IGNORECASE,
+)
+
+# Groups: 1 type prefix, 2 issue number, 3 ADW id, 4 slug
+BRANCH_NAME_RE = re.compile(r'^(feat|fix|chore)-issue-(\d+)-adw-([a-f0-9]{8})-(.+)$')
+
+_VALID_ISSUE_TYPES = frozenset({'feature', 'bug', 'chore'})
+_VALID_CONTEXTS = frozenset({'tac-7-root', 'tac-webbuilder'})
+_VALID_CONFIDENCE = frozenset({'high', 'medium', 'low'})
+
+
+@dataclass(slots=True)
 class WorkflowConfig:
     """Parsed workflow configuration from comprehensive plan."""
 
@@ -33,15 +78,11 @@ class WorkflowConfig:
     commit_message: str = ""
 
     # Validation criteria
-    validation_criteria: list = None
+    validation_criteria: list = field(default_factory=list)
 
     # Plan file path
     plan_file_path: str = ""
 
-    def __post_init__(self):
-        if self.validation_criteria is None:
-            self.validation_criteria = []
-
 
 def extract_yaml_block(text: str) -> Optional[str]:
     """
@@ -54,16 +95,25 @@ def extract_yaml_block(text: str) -> Optional[str]:
 
     Returns the YAML content without the fence markers.
     """
-    # Pattern to match ```yaml ... ```
-    pattern = r'```yaml\s*\n(.*?)\n```'
-    match = re.search(pattern, text, re.DOTALL)
+    # Both patterns need a literal marker; skip the regex scan without one
+    if '```yaml' not in text and '# WORKFLOW CONFIGURATION' not in text:
+        return None
+
+    # Fast path for the usual "```yaml\n ... \n```" fence: two C-level scans
+    _, fence, rest = text.partition('```yaml\n')
+    if fence:
+        body, end, _ = rest.partition('\n```')
+        if end:
+            return body.strip()
+
+    # Fences with trailing whitespace or \r\n after the opener
+    match = _YAML_FENCE_RE.search(text)
 
     if match:
         return match.group(1).strip()
 
     # Fallback: look for WORKFLOW CONFIGURATION header
-    pattern = r'# WORKFLOW CONFIGURATION.*?\n(.*?)(?=\n#[^#]|\n```|\Z)'
-    match = re.search(pattern, text, re.DOTALL)
+    match = _WORKFLOW_HEADER_RE.search(text)
 
     if match:
         return match.group(1).strip()
@@ -80,24 +130,14 @@ def extract_plan_file_path(text: str) -> Optional[str]:
     - Created file at specs/...
     - Saved to specs/...
     """
-    patterns = [
-        r'Plan file:\s*`?([^`\n]+\.md)`?',
-        r'Created file at\s*`?([^`\n]+\.md)`?',
-        r'Saved to\s*`?([^`\n]+\.md)`?',
-        r'specs/issue-\d+-adw-[a-f0-9]+-sdlc_planner-[^\.]+\.md'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            if pattern == patterns[-1]:
-                # Full match
-                return match.group(0)
-            else:
-                # Capture group
-                return match.group(1).strip()
+    # Every pattern ends in a (case-insensitive) .md literal
+    if '.md' not in text.lower():
+        return None
 
-    return None
+    match = _PLAN_FILE_RE.search(text)
+    if not match:
+        return None
+    return (match.group(1) or match.group(2)).strip()
 
 
 def parse_plan(plan_text: str) -> WorkflowConfig:
@@ -115,9 +155,64 @@ def parse_plan(plan_text: str) -> WorkflowConfig:
     Raises:
         ValueError: If YAML block is missing or invalid
     """
-    # Extract YAML block
-    yaml_text = extract_yaml_block(plan_text)
+    if os.getenv("ADW_PARSE_CACHE"):
+        return _parse_plan_disk_cached(plan_text)
+
+    # Identical plan text parses to an identical config, so reuse the cached
+    # parse and hand each caller its own copy to mutate.
+    return copy.deepcopy(_parse_plan_cached(plan_text))
+
+
+# Bump when WorkflowConfig's fields change so stale pickles are not reused
+_DISK_CACHE_VERSION = 1
+
+
+def _parse_plan_disk_cached(plan_text: str) -> WorkflowConfig:
+    """
+    parse_plan backed by pickles under ~/.cache/adw/plan_parse.
+
+    Opt-in via ADW_PARSE_CACHE so repeated pipeline runs on the same plan
+    skip YAML parsing across processes. Unreadable or unwritable cache
+    files fall back to a normal parse.
+    """
+    key = hashlib.sha256(f"{_DISK_CACHE_VERSION}\0{plan_text}".encode()).hexdigest()
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "adw", "plan_parse")
+    cache_file = os.path.join(cache_dir, f"config.{key}.cache")
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, WorkflowConfig):
+            return cached
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    config = copy.deepcopy(_parse_plan_cached(plan_text))
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return config
+
+
+@lru_cache(maxsize=128)
+def _parse_plan_cached(plan_text: str) -> WorkflowConfig:
+    """Parse plan text into a WorkflowConfig; memoized on the text itself."""
+    return _build_workflow_config(
+        extract_yaml_block(plan_text), extract_plan_file_path(plan_text)
+    )
 
+
+def _build_workflow_config(
+    yaml_text: Optional[str], plan_file_path: Optional[str]
+) -> WorkflowConfig:
+    """Load the extracted YAML block and build a validated WorkflowConfig."""
     if not yaml_text:
         raise ValueError(
             "No YAML configuration block found in plan. "
@@ -125,14 +220,12 @@ def parse_plan(plan_text: str) -> WorkflowConfig:
         )
 
     # Parse YAML
+    yaml = _get_yaml()
     try:
-        config_dict = yaml.safe_load(yaml_text)
+        config_dict = yaml.load(yaml_text, Loader=_Loader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML syntax in configuration block: {e}")
 
-    # Extract plan file path
-    plan_file_path = extract_plan_file_path(plan_text)
-
     # Build WorkflowConfig
     try:
         workflow_config = WorkflowConfig(
@@ -144,7 +237,7 @@ def parse_plan(plan_text: str) -> WorkflowConfig:
             branch_name=config_dict.get('branch_name', ''),
             worktree_setup=config_dict.get('worktree_setup'),
             commit_message=config_dict.get('commit_message', ''),
-            validation_criteria=config_dict.get('validation_criteria', []),
+            validation_criteria=config_dict.get('validation_criteria') or [],
             plan_file_path=plan_file_path or ""
         )
     except Exception as e:
@@ -160,53 +253,116 @@ def parse_plan(plan_text: str) -> WorkflowConfig:
     return workflow_config
 
 
-def validate_workflow_config(config: WorkflowConfig) -> list[str]:
+def parse_plan_from_file(path: str) -> WorkflowConfig:
     """
-    Validate workflow configuration for correctness.
+    Parse a comprehensive plan saved to disk without reading it whole.
 
-    Returns list of validation errors (empty if valid).
-    """
-    errors = []
+    Streams the file line by line, buffering only the ```yaml fence body and
+    stopping once both the fence and the plan file path have been seen.
+    Plans without a closed ```yaml fence (e.g. the bare WORKFLOW
+    CONFIGURATION header form) fall back to parse_plan on the full text.
 
-    # Validate issue_type
-    if config.issue_type not in ['feature', 'bug', 'chore']:
-        errors.append(f"Invalid issue_type: {config.issue_type}. Must be feature, bug, or chore.")
+    Args:
+        path: Path to a saved AI response
 
-    # Validate project_context
-    if config.project_context not in ['tac-7-root', 'tac-webbuilder']:
-        errors.append(
-            f"Invalid project_context: {config.project_context}. "
-            f"Must be tac-7-root or tac-webbuilder."
-        )
+    Returns:
+        WorkflowConfig object with all parsed configuration
 
-    # Validate confidence
-    if config.confidence not in ['high', 'medium', 'low']:
-        errors.append(f"Invalid confidence: {config.confidence}. Must be high, medium, or low.")
+    Raises:
+        ValueError: If YAML block is missing or invalid
+        OSError: If the file cannot be read
+    """
+    yaml_lines = []
+    plan_file_path = None
+    in_fence = fence_closed = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if plan_file_path is None:
+                match = _PLAN_FILE_RE.search(line)
+                if match:
+                    plan_file_path = (match.group(1) or match.group(2)).strip()
+
+            if in_fence:
+                if line.startswith('```'):
+                    in_fence, fence_closed = False, True
+                else:
+                    yaml_lines.append(line)
+            elif not fence_closed:
+                _, fence, tail = line.partition('```yaml')
+                in_fence = bool(fence) and not tail.strip()
+
+            if fence_closed and plan_file_path is not None:
+                break
+
+    if not fence_closed:
+        with open(path, 'r', encoding='utf-8') as f:
+            return parse_plan(f.read())
+
+    return _build_workflow_config(''.join(yaml_lines).strip(), plan_file_path)
+
+
+# (attribute, check, message) rows applied by validate_workflow_config;
+# message is formatted with the attribute's value as {v}
+_FIELD_VALIDATIONS = (
+    ('issue_type', _VALID_ISSUE_TYPES.__contains__,
+     "Invalid issue_type: {v}. Must be feature, bug, or chore."),
+    ('project_context', _VALID_CONTEXTS.__contains__,
+     "Invalid project_context: {v}. Must be tac-7-root or tac-webbuilder."),
+    ('confidence', _VALID_CONFIDENCE.__contains__,
+     "Invalid confidence: {v}. Must be high, medium, or low."),
+    ('branch_name', BRANCH_NAME_RE.match,
+     "Invalid branch_name format: {v}. Expected: {{type}}-issue-{{num}}-adw-{{id}}-{{slug}}"),
+)
+
+_WORKTREE_REQUIRED_FIELDS = ('backend_port', 'frontend_port', 'steps')
 
-    # Validate branch name format
-    branch_pattern = r'^(feat|fix|chore)-issue-\d+-adw-[a-f0-9]{8}-.+$'
-    if not re.match(branch_pattern, config.branch_name):
-        errors.append(
-            f"Invalid branch_name format: {config.branch_name}. "
-            f"Expected: {{type}}-issue-{{num}}-adw-{{id}}-{{slug}}"
-        )
+
+def validate_workflow_config(config: WorkflowConfig) -> list[str]:
+    """
+    Validate workflow configuration for correctness.
+
+    Returns list of validation errors (empty if valid).
+    """
+    errors = [
+        message.format(v=value)
+        for attr, check, message in _FIELD_VALIDATIONS
+        if not check(value := getattr(config, attr))
+    ]
 
     # Validate worktree_setup if requires_worktree is True
     if config.requires_worktree:
         if not config.worktree_setup:
             errors.append("requires_worktree is true but worktree_setup is missing")
         else:
-            # Check required fields
-            if 'backend_port' not in config.worktree_setup:
-                errors.append("worktree_setup missing required field: backend_port")
-            if 'frontend_port' not in config.worktree_setup:
-                errors.append("worktree_setup missing required field: frontend_port")
-            if 'steps' not in config.worktree_setup:
-                errors.append("worktree_setup missing required field: steps")
+            errors.extend(
+                f"worktree_setup missing required field: {name}"
+                for name in _WORKTREE_REQUIRED_FIELDS
+                if name not in config.worktree_setup
+            )
 
     return errors
 
 
+def parse_and_validate_plan(plan_text: str) -> WorkflowConfig:
+    """
+    Parse a comprehensive plan and reject it if validation fails.
+
+    parse_plan only checks that required fields are present; use this where
+    the plan comes from an untrusted source (e.g. a fresh AI response).
+
+    Raises:
+        ValueError: If parsing fails or validate_workflow_config reports errors
+    """
+    config = parse_plan(plan_text)
+    errors = validate_workflow_config(config)
+    if errors:
+        raise ValueError(
+            "Plan validation errors:\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+    return config
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test with sample YAML
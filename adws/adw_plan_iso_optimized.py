@@ -43,7 +43,7 @@ from adw_modules.workflow_ops import (
 from adw_modules.utils import setup_logger, check_env_vars
 from adw_modules.data_types import GitHubIssue, AgentTemplateRequest
 from adw_modules.agent import execute_template
-from adw_modules.plan_parser import parse_plan, validate_workflow_config, WorkflowConfig
+from adw_modules.plan_parser import parse_and_validate_plan, WorkflowConfig
 from adw_modules.plan_executor import execute_plan, ExecutionResult
 
 
@@ -91,16 +91,22 @@ def create_comprehensive_plan(
     if not plan_response.success:
         raise ValueError(f"Planning failed: {plan_response.output}")
 
+    # The template's static instructions precede the per-issue variables, so
+    # repeat runs should read most of the prompt from Claude's prompt cache
+    if plan_response.usage:
+        logger.info(
+            f"Planning tokens: {plan_response.usage.get('input_tokens', 0):,} input, "
+            f"{plan_response.usage.get('cache_read_input_tokens', 0):,} cache read, "
+            f"{plan_response.usage.get('cache_creation_input_tokens', 0):,} cache write"
+        )
+
     # Parse YAML configuration from response
     logger.info("Parsing plan configuration...")
-    config = parse_plan(plan_response.output)
-
-    # Validate configuration
-    errors = validate_workflow_config(config)
-    if errors:
-        error_msg = "Plan validation errors:\n" + "\n".join(f"  - {e}" for e in errors)
-        logger.error(error_msg)
-        raise ValueError(error_msg)
+    try:
+        config = parse_and_validate_plan(plan_response.output)
+    except ValueError as e:
+        logger.error(str(e))
+        raise
 
     logger.info("Plan created successfully!")
     logger.info(f"  Issue type: {config.issue_type}")
@@ -0,0 +1,54 @@
+"""
+Shared pytest fixtures for ADW optimization tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Make adw_modules and tests.fixtures importable once for every test module.
+_ADWS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ADWS_DIR not in sys.path:
+    sys.path.insert(0, _ADWS_DIR)
+
+from adw_modules.plan_parser import parse_plan
+from tests.fixtures import SAMPLE_PLAN_TAC7_ROOT, SAMPLE_PLAN_WEBBUILDER
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group regression tests by class so pytest-xdist's ``--dist loadgroup``
+    keeps tests that share a class-scoped fixture (e.g. ``seeded_repo``) on
+    one worker. Without xdist the marker is inert."""
+    for item in items:
+        if item.get_closest_marker("regression") is None:
+            continue
+        group = item.cls.__name__ if item.cls else item.module.__name__
+        item.add_marker(pytest.mark.xdist_group(name=group))
+
+
+class _NullLogger:
+    """Logger stand-in whose methods accept anything and do nothing."""
+
+    info = warning = error = debug = staticmethod(lambda *args, **kwargs: None)
+
+
+@pytest.fixture(scope="session")
+def logger():
+    """Session-wide no-op logger for code under test that only emits logs.
+
+    Tests that need to assert on log calls should build their own Mock.
+    """
+    return _NullLogger()
+
+
+@pytest.fixture(scope="session")
+def tac7_config():
+    """SAMPLE_PLAN_TAC7_ROOT parsed once per session. Treat as read-only."""
+    return parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+
+
+@pytest.fixture(scope="session")
+def webbuilder_config():
+    """SAMPLE_PLAN_WEBBUILDER parsed once per session. Treat as read-only."""
+    return parse_plan(SAMPLE_PLAN_WEBBUILDER)
@@ -7,6 +7,7 @@ Provides mock data, sample plans, and helper utilities.
 import json
 import tempfile
 import os
+import subprocess
 from pathlib import Path
 from typing import Dict, Any
 
@@ -330,6 +331,41 @@ class MockTempRepo:
         return str(worktree_path)
 
 
+def fast_init(repo_path: Path, refs: Dict[str, str]) -> None:
+    """
+    Seed an initialized repo with commits using one ``git fast-import`` stream.
+
+    Creates an initial commit on ``main`` (containing a README) and, for each
+    entry in ``refs``, a branch named by the key with an empty commit whose
+    message is the value, parented on the initial commit. HEAD is pointed at
+    ``main``. Replaces the per-command ``git checkout -b`` / ``git commit``
+    spawns with a single subprocess.
+    """
+    def data(payload: str) -> str:
+        return f"data {len(payload.encode())}\n{payload}\n"
+
+    committer = "committer Test <test@test.com> 0 +0000\n"
+    stream = [
+        "blob\n", "mark :1\n", data("# Test repo\n"),
+        "commit refs/heads/main\n", "mark :2\n", committer, data("Initial commit"),
+        "M 100644 :1 README.md\n\n",
+    ]
+    for mark, (branch, message) in enumerate(refs.items(), start=3):
+        stream += [
+            f"commit refs/heads/{branch}\n", f"mark :{mark}\n", committer,
+            data(message), "from :2\n\n",
+        ]
+
+    subprocess.run(
+        ["git", "-C", str(repo_path), "fast-import", "--quiet"],
+        input="".join(stream),
+        text=True,
+        capture_output=True,
+        check=True
+    )
+    (Path(repo_path) / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+
+
 def create_mock_issue_json(issue_dict: Dict[str, Any]) -> str:
     """Convert issue dict to JSON string."""
     return json.dumps(issue_dict, indent=2)
@@ -355,5 +391,6 @@ __all__ = [
     'SAMPLE_PLAN_WEBBUILDER',
     'create_mock_execution_result',
     'MockTempRepo',
+    'fast_init',
     'create_mock_issue_json'
 ]
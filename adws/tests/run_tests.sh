@@ -23,7 +23,7 @@ echo ""
 if ! command -v pytest &> /dev/null; then
     echo -e "${RED}✗ pytest not found${NC}"
     echo "Installing pytest..."
-    pip install pytest pytest-cov pyyaml
+    pip install pytest pytest-cov pyyaml pyfakefs
 fi
 
 # Change to project root
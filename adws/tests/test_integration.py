@@ -10,18 +10,13 @@ These tests use mocks for AI calls but test real file operations.
 """
 
 import pytest
-import sys
-import os
 import json
 import subprocess
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch, MagicMock
 
 from adw_modules.plan_parser import parse_plan, WorkflowConfig
-from adw_modules.plan_executor import execute_plan, ExecutionResult
+from adw_modules.plan_executor import execute_plan, create_worktree, ExecutionResult
 from adw_modules.data_types import AgentPromptResponse
 from tests.fixtures import (
     SAMPLE_ISSUE_TAC7_ROOT,
@@ -29,6 +24,7 @@ from tests.fixtures import (
     SAMPLE_PLAN_TAC7_ROOT,
     SAMPLE_PLAN_WEBBUILDER,
     MockTempRepo,
+    fast_init,
     create_mock_issue_json
 )
 
@@ -38,7 +34,7 @@ class TestTac7RootWorkflow:
     """Test complete workflow for tac-7-root tasks (no worktree)."""
 
     @patch('adw_modules.agent.execute_template')
-    def test_complete_tac7_workflow(self, mock_execute):
+    def test_complete_tac7_workflow(self, mock_execute, logger):
         """Test end-to-end workflow for tac-7-root task."""
         with MockTempRepo() as repo:
             # Setup git
@@ -59,8 +55,6 @@ class TestTac7RootWorkflow:
                 output=SAMPLE_PLAN_TAC7_ROOT
             )
 
-            logger = Mock()
-
             # STAGE 1: Parse plan
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
 
@@ -96,7 +90,7 @@ class TestTac7RootWorkflow:
             assert not trees_dir.exists() or len(list(trees_dir.iterdir())) == 0
 
     @patch('adw_modules.agent.execute_template')
-    def test_tac7_with_plan_file_creation(self, mock_execute):
+    def test_tac7_with_plan_file_creation(self, mock_execute, logger):
         """Test that plan file metadata is captured correctly."""
         with MockTempRepo() as repo:
             subprocess.run(
@@ -115,8 +109,6 @@ class TestTac7RootWorkflow:
                 output=SAMPLE_PLAN_TAC7_ROOT
             )
 
-            logger = Mock()
-
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
             result = execute_plan(config, 123, str(repo.repo_path), logger)
 
@@ -126,15 +118,20 @@ class TestTac7RootWorkflow:
 
 
 @pytest.mark.integration
-@pytest.mark.slow
 class TestWebbuilderWorkflow:
-    """Test complete workflow for webbuilder tasks (with worktree)."""
+    """Test complete workflow for webbuilder tasks (with worktree).
 
+    create_worktree is mocked so these stay out of the slow gate; real
+    `git worktree add` coverage lives in TestRealWorktree.
+    """
+
+    @patch('adw_modules.plan_executor.create_worktree')
     @patch('adw_modules.plan_executor.execute_worktree_setup')
     @patch('adw_modules.agent.execute_template')
-    def test_complete_webbuilder_workflow(self, mock_execute, mock_setup):
+    def test_complete_webbuilder_workflow(self, mock_execute, mock_setup, mock_create_worktree, logger):
         """Test end-to-end workflow for webbuilder task."""
         mock_setup.return_value = True
+        mock_create_worktree.return_value = ("/tmp/fake/trees/def67890", None)
 
         with MockTempRepo() as repo:
             # Setup git
@@ -155,8 +152,6 @@ class TestWebbuilderWorkflow:
                 output=SAMPLE_PLAN_WEBBUILDER
             )
 
-            logger = Mock()
-
             # STAGE 1: Parse plan
             config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
 
@@ -178,20 +173,25 @@ class TestWebbuilderWorkflow:
             assert result.success is True
             assert "trees/def67890" in result.metadata["working_directory"]
 
-            # Verify worktree was created
-            worktree_path = Path(result.metadata["working_directory"])
-            assert worktree_path.exists()
+            # Verify worktree was requested for the right ADW ID, branch and repo
+            adw_id, branch_name, base_path = mock_create_worktree.call_args[0][:3]
+            assert adw_id == "def67890"
+            assert branch_name == config.branch_name
+            assert base_path == str(repo.repo_path)
 
             # Verify setup was called
             assert mock_setup.called
             setup_call_args = mock_setup.call_args
+            assert setup_call_args[0][0] == "/tmp/fake/trees/def67890"
             assert setup_call_args[0][1] == config.worktree_setup  # Second arg is setup config
 
+    @patch('adw_modules.plan_executor.create_worktree')
     @patch('adw_modules.plan_executor.execute_worktree_setup')
     @patch('adw_modules.agent.execute_template')
-    def test_webbuilder_worktree_setup_steps(self, mock_execute, mock_setup):
+    def test_webbuilder_worktree_setup_steps(self, mock_execute, mock_setup, mock_create_worktree, logger):
         """Test that worktree setup receives correct configuration."""
         mock_setup.return_value = True
+        mock_create_worktree.return_value = ("/tmp/fake/trees/def67890", None)
 
         with MockTempRepo() as repo:
             subprocess.run(
@@ -210,11 +210,11 @@ class TestWebbuilderWorkflow:
                 output=SAMPLE_PLAN_WEBBUILDER
             )
 
-            logger = Mock()
             config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
             result = execute_plan(config, 456, str(repo.repo_path), logger)
 
             assert result.success is True
+            assert mock_create_worktree.call_count == 1
 
             # Verify setup was called with correct steps
             setup_config = mock_setup.call_args[0][1]
@@ -222,6 +222,31 @@ class TestWebbuilderWorkflow:
             assert len(setup_config["steps"]) == 6  # All 6 steps from fixture
 
 
+@pytest.mark.integration
+@pytest.mark.slow
+class TestRealWorktree:
+    """Smoke test that runs a real `git worktree add`."""
+
+    def test_real_worktree_creation(self, monkeypatch, logger):
+        """Test create_worktree produces a checked-out worktree on disk."""
+        with MockTempRepo() as repo:
+            fast_init(repo.repo_path, {
+                "fix-issue-456-adw-def67890-authentication-bug": "Branch commit"
+            })
+            monkeypatch.chdir(repo.repo_path)
+
+            worktree_path, error = create_worktree(
+                "def67890",
+                "fix-issue-456-adw-def67890-authentication-bug",
+                str(repo.repo_path),
+                logger
+            )
+
+            assert error is None
+            assert "trees/def67890" in worktree_path
+            assert (Path(worktree_path) / "README.md").exists()
+
+
 @pytest.mark.integration
 class TestWorkflowEdgeCases:
     """Test edge cases and error handling."""
@@ -250,7 +275,7 @@ project_context: tac-7-root
             parse_plan(incomplete_plan)
 
     @patch('adw_modules.agent.execute_template')
-    def test_execution_with_git_error(self, mock_execute):
+    def test_execution_with_git_error(self, mock_execute, logger):
         """Test handling of git operation errors."""
         with MockTempRepo() as repo:
             # Don't initialize git - should cause error
@@ -259,7 +284,6 @@ project_context: tac-7-root
                 output=SAMPLE_PLAN_TAC7_ROOT
             )
 
-            logger = Mock()
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
 
             # This should fail due to missing git initialization
@@ -308,7 +332,7 @@ class TestValidationArtifacts:
     """Test that validation artifacts are correctly structured."""
 
     @patch('adw_modules.agent.execute_template')
-    def test_validation_artifacts_structure(self, mock_execute):
+    def test_validation_artifacts_structure(self, mock_execute, logger):
         """Test that execution results can be used for validation."""
         with MockTempRepo() as repo:
             subprocess.run(
@@ -327,7 +351,6 @@ class TestValidationArtifacts:
                 output=SAMPLE_PLAN_TAC7_ROOT
             )
 
-            logger = Mock()
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
             result = execute_plan(config, 123, str(repo.repo_path), logger)
 
@@ -360,7 +383,7 @@ class TestPerformanceMetrics:
     """Tests to capture performance metrics."""
 
     @patch('adw_modules.agent.execute_template')
-    def test_execution_speed_tac7(self, mock_execute):
+    def test_execution_speed_tac7(self, mock_execute, logger):
         """Measure execution speed for tac-7-root workflow."""
         import time
 
@@ -381,7 +404,6 @@ class TestPerformanceMetrics:
                 output=SAMPLE_PLAN_TAC7_ROOT
             )
 
-            logger = Mock()
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
 
             start_time = time.time()
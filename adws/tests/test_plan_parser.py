@@ -5,19 +5,17 @@ Tests YAML extraction, parsing, and validation.
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from adw_modules.plan_parser import (
     extract_yaml_block,
     extract_plan_file_path,
+    parse_and_validate_plan,
     parse_plan,
+    parse_plan_from_file,
     validate_workflow_config,
     WorkflowConfig
 )
+from tests.fixtures import SAMPLE_PLAN_TAC7_ROOT, SAMPLE_PLAN_WEBBUILDER
 
 
 class TestYAMLExtraction:
@@ -55,6 +53,13 @@ More content...
         assert yaml_text is not None
         assert "issue_type: bug" in yaml_text
 
+    def test_extract_yaml_fence_with_crlf(self):
+        """Test fences not matching the literal fast path still extract."""
+        text = "Plan:\r\n```yaml \r\nissue_type: chore\r\nbranch_name: test\r\n```\r\n"
+        yaml_text = extract_yaml_block(text)
+        assert yaml_text is not None
+        assert "issue_type: chore" in yaml_text
+
     def test_extract_yaml_missing(self):
         """Test when no YAML block present."""
         text = "Just some regular text without YAML"
@@ -91,6 +96,14 @@ Created specs/issue-789-adw-ghi01234-sdlc_planner-update-docs.md
         path = extract_plan_file_path(text)
         assert "specs/issue-789-adw-ghi01234-sdlc_planner-update-docs.md" in path
 
+    def test_extract_labelled_non_specs_path(self):
+        """Test labelled paths outside specs/ are still extracted."""
+        text = """
+Saved to `docs/plans/custom-plan.md`
+"""
+        path = extract_plan_file_path(text)
+        assert path == "docs/plans/custom-plan.md"
+
     def test_extract_missing(self):
         """Test when no path present."""
         text = "No plan file mentioned here"
@@ -125,14 +138,17 @@ Plan file: specs/issue-123-adw-abc12345-sdlc_planner-test-feature.md
 """
         config = parse_plan(plan_text)
 
-        assert config.issue_type == "feature"
-        assert config.project_context == "tac-7-root"
+        expected = {
+            "issue_type": "feature",
+            "project_context": "tac-7-root",
+            "confidence": "high",
+            "branch_name": "feat-issue-123-adw-abc12345-test-feature",
+            "commit_message": "test: add feature",
+            "plan_file_path": "specs/issue-123-adw-abc12345-sdlc_planner-test-feature.md",
+        }
+        assert {k: getattr(config, k) for k in expected} == expected
         assert config.requires_worktree is False
-        assert config.confidence == "high"
-        assert config.branch_name == "feat-issue-123-adw-abc12345-test-feature"
-        assert config.commit_message == "test: add feature"
         assert len(config.validation_criteria) == 1
-        assert config.plan_file_path == "specs/issue-123-adw-abc12345-sdlc_planner-test-feature.md"
 
     def test_parse_with_worktree_setup(self):
         """Test parsing plan with worktree configuration."""
@@ -161,10 +177,60 @@ Plan file: specs/issue-456-adw-def67890-sdlc_planner-patch-error.md
         assert config.issue_type == "bug"
         assert config.requires_worktree is True
         assert config.worktree_setup is not None
-        assert config.worktree_setup['backend_port'] == 8001
-        assert config.worktree_setup['frontend_port'] == 5174
+        assert {k: config.worktree_setup[k] for k in ("backend_port", "frontend_port")} == {
+            "backend_port": 8001,
+            "frontend_port": 5174,
+        }
         assert len(config.worktree_setup['steps']) == 2
 
+    def test_parse_repeat_returns_independent_copies(self):
+        """Test repeat parses of the same text don't share mutable state."""
+        plan_text = """
+```yaml
+issue_type: bug
+project_context: tac-webbuilder
+requires_worktree: true
+confidence: high
+detection_reasoning: "Webbuilder task"
+branch_name: fix-issue-456-adw-def67890-patch-error
+worktree_setup:
+  backend_port: 8001
+  frontend_port: 5174
+  steps: []
+```
+"""
+        first = parse_plan(plan_text)
+        first.worktree_setup['backend_port'] = 9999
+        first.validation_criteria.append({"check": "mutated"})
+
+        second = parse_plan(plan_text)
+
+        assert second is not first
+        assert second.worktree_setup['backend_port'] == 8001
+        assert second.validation_criteria == []
+
+    def test_parse_disk_cache(self, tmp_path, monkeypatch):
+        """Test ADW_PARSE_CACHE persists parses and serves them back."""
+        monkeypatch.setenv("ADW_PARSE_CACHE", "1")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        plan_text = """
+```yaml
+issue_type: chore
+project_context: tac-7-root
+requires_worktree: false
+confidence: medium
+detection_reasoning: "Docs only"
+branch_name: chore-issue-789-adw-abc12345-update-docs
+```
+"""
+        first = parse_plan(plan_text)
+        cache_files = list((tmp_path / ".cache" / "adw" / "plan_parse").glob("config.*.cache"))
+        assert len(cache_files) == 1
+
+        second = parse_plan(plan_text)
+        assert second == first
+        assert second is not first
+
     def test_parse_missing_yaml(self):
         """Test error when YAML block missing."""
         plan_text = "Just markdown content without YAML"
@@ -200,6 +266,38 @@ detection_reasoning: "Test"
             parse_plan(plan_text)
 
 
+class TestPlanFileParsing:
+    """Test streaming plan parsing from saved responses."""
+
+    @pytest.mark.parametrize("plan_text", [SAMPLE_PLAN_TAC7_ROOT, SAMPLE_PLAN_WEBBUILDER])
+    def test_matches_parse_plan(self, tmp_path, plan_text):
+        """Test file parsing matches parsing the same text in memory."""
+        plan_path = tmp_path / "response.md"
+        plan_path.write_text(plan_text)
+
+        assert parse_plan_from_file(str(plan_path)) == parse_plan(plan_text)
+
+    def test_header_only_plan_falls_back(self, tmp_path):
+        """Test plans without a yaml fence still parse."""
+        plan_path = tmp_path / "response.md"
+        plan_path.write_text("""# WORKFLOW CONFIGURATION
+issue_type: chore
+branch_name: chore-issue-789-adw-abc12345-update-docs
+
+# Plan
+Plan file: specs/issue-789-adw-abc12345-sdlc_planner-update-docs.md
+""")
+        config = parse_plan_from_file(str(plan_path))
+
+        assert config.issue_type == 'chore'
+        assert config.plan_file_path == "specs/issue-789-adw-abc12345-sdlc_planner-update-docs.md"
+
+
+def _errs(config: WorkflowConfig) -> str:
+    """All validation errors for config joined into one searchable string."""
+    return "\n".join(validate_workflow_config(config))
+
+
 class TestWorkflowConfigValidation:
     """Test workflow configuration validation."""
 
@@ -228,9 +326,7 @@ class TestWorkflowConfigValidation:
             branch_name="feat-issue-123-adw-abc12345-test"
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("Invalid issue_type" in e for e in errors)
+        assert "Invalid issue_type" in _errs(config)
 
     def test_validate_invalid_project_context(self):
         """Test validation fails for invalid project context."""
@@ -243,9 +339,7 @@ class TestWorkflowConfigValidation:
             branch_name="feat-issue-123-adw-abc12345-test"
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("Invalid project_context" in e for e in errors)
+        assert "Invalid project_context" in _errs(config)
 
     def test_validate_invalid_confidence(self):
         """Test validation fails for invalid confidence level."""
@@ -258,9 +352,7 @@ class TestWorkflowConfigValidation:
             branch_name="feat-issue-123-adw-abc12345-test"
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("Invalid confidence" in e for e in errors)
+        assert "Invalid confidence" in _errs(config)
 
     def test_validate_invalid_branch_name_format(self):
         """Test validation fails for wrong branch name format."""
@@ -273,9 +365,7 @@ class TestWorkflowConfigValidation:
             branch_name="invalid-branch-name"  # Wrong format
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("Invalid branch_name format" in e for e in errors)
+        assert "Invalid branch_name format" in _errs(config)
 
     def test_validate_worktree_required_but_no_setup(self):
         """Test validation fails when worktree required but setup missing."""
@@ -289,9 +379,7 @@ class TestWorkflowConfigValidation:
             worktree_setup=None  # Missing!
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("worktree_setup is missing" in e for e in errors)
+        assert "worktree_setup is missing" in _errs(config)
 
     def test_validate_worktree_setup_missing_ports(self):
         """Test validation fails when worktree setup missing ports."""
@@ -308,10 +396,32 @@ class TestWorkflowConfigValidation:
             }
         )
 
-        errors = validate_workflow_config(config)
-        assert len(errors) > 0
-        assert any("backend_port" in e for e in errors)
-        assert any("frontend_port" in e for e in errors)
+        errors = _errs(config)
+        assert "backend_port" in errors
+        assert "frontend_port" in errors
+
+
+class TestParseAndValidate:
+    """Test combined parse + validation entry point."""
+
+    def test_valid_plan(self):
+        """Test a valid plan parses without errors."""
+        config = parse_and_validate_plan(SAMPLE_PLAN_TAC7_ROOT)
+        assert config.branch_name.startswith("feat-")
+
+    def test_invalid_plan_raises(self):
+        """Test validation errors surface as ValueError."""
+        plan_text = """
+```yaml
+issue_type: feature
+project_context: tac-7-root
+requires_worktree: false
+confidence: high
+branch_name: not-a-valid-branch
+```
+"""
+        with pytest.raises(ValueError, match="Invalid branch_name format"):
+            parse_and_validate_plan(plan_text)
 
 
 if __name__ == "__main__":
@@ -13,34 +13,58 @@ Tests:
 """
 
 import pytest
-import sys
-import os
 import json
-import subprocess
+import re
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from adw_modules.plan_parser import parse_plan, WorkflowConfig
+from adw_modules.plan_parser import BRANCH_NAME_RE, parse_plan, WorkflowConfig
 from adw_modules.plan_executor import execute_plan
 from adw_modules.data_types import AgentPromptResponse
 from tests.fixtures import (
     SAMPLE_ISSUE_TAC7_ROOT,
     SAMPLE_ISSUE_WEBBUILDER,
     SAMPLE_PLAN_TAC7_ROOT,
-    MockTempRepo
+    SAMPLE_PLAN_WEBBUILDER,
+    MockTempRepo,
+    fast_init
 )
 
 
+def _init_repo(repo_path: Path, monkeypatch) -> None:
+    """Seed ``main`` with one fast-import stream and run the executor from inside the repo."""
+    fast_init(repo_path, {})
+    monkeypatch.chdir(repo_path)
+
+
+def _enter_repo(repo_path: Path, monkeypatch) -> None:
+    """Point HEAD back at ``main`` so each test branches off the same commit."""
+    (repo_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    monkeypatch.chdir(repo_path)
+
+
+@pytest.fixture(scope="class")
+def seeded_repo():
+    """One seeded repo per test class; branches from earlier tests are left in place."""
+    with MockTempRepo() as repo:
+        fast_init(repo.repo_path, {})
+        yield repo
+
+
+def _local_branches(repo_path: Path) -> list:
+    """List local branch names by reading loose refs instead of spawning ``git branch``."""
+    heads = repo_path / ".git" / "refs" / "heads"
+    return [ref.relative_to(heads).as_posix() for ref in heads.rglob("*") if ref.is_file()]
+
+
 @pytest.mark.regression
 class TestOutputEquivalence:
     """Test that optimized workflow produces equivalent output to old workflow."""
 
-    def test_plan_structure_equivalence(self):
+    def test_plan_structure_equivalence(self, tac7_config):
         """Verify optimized plan has same structure as old workflow."""
         # Parse optimized plan
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         # Expected fields from old workflow
         expected_fields = {
@@ -62,49 +86,36 @@ class TestOutputEquivalence:
         assert config.project_context in ['tac-7-root', 'tac-webbuilder']
         assert isinstance(config.requires_worktree, bool)
 
-    def test_branch_name_format_compatibility(self):
+    def test_branch_name_format_compatibility(self, tac7_config):
         """Verify branch names match old workflow format."""
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         # Old workflow format: {type}-issue-{num}-adw-{id}-{slug}
-        branch_parts = config.branch_name.split('-')
+        match = BRANCH_NAME_RE.match(config.branch_name)
 
-        assert branch_parts[0] in ['feat', 'fix', 'chore'], "Invalid type prefix"
-        assert branch_parts[1] == 'issue', "Missing 'issue' segment"
-        assert branch_parts[2].isdigit(), "Issue number not numeric"
-        assert branch_parts[3] == 'adw', "Missing 'adw' segment"
-        assert len(branch_parts[4]) == 8, "ADW ID not 8 characters"
-        assert len(branch_parts) >= 6, "Missing slug"
+        assert match, "Branch name does not match {type}-issue-{num}-adw-{id}-{slug}"
+        assert match.group(1) in {'feat', 'fix', 'chore'}, "Invalid type prefix"
+        assert len(match.group(3)) == 8, "ADW ID not 8 characters"
+        assert match.group(4), "Missing slug"
 
-    def test_file_creation_equivalence(self):
+    def test_file_creation_equivalence(self, seeded_repo, monkeypatch, logger):
         """Verify same files created as old workflow."""
-        with MockTempRepo() as repo:
-            subprocess.run(
-                ["git", "checkout", "-b", "main"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-            subprocess.run(
-                ["git", "commit", "--allow-empty", "-m", "Initial"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
+        _enter_repo(seeded_repo.repo_path, monkeypatch)
 
-            config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
-            logger = Mock()
+        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
 
-            result = execute_plan(config, 123, str(repo.repo_path), logger)
+        result = execute_plan(config, 123, str(seeded_repo.repo_path), logger)
 
-            # Old workflow created these files
-            expected_files = {
-                'plan_file',  # specs/issue-*.md
-                'branch_name',
-                'working_directory'
-            }
+        # Old workflow created these files
+        expected_files = {
+            'plan_file',  # specs/issue-*.md
+            'branch_name',
+            'working_directory'
+        }
 
-            # Verify metadata contains expected keys
-            for key in expected_files:
-                assert key in result.metadata, f"Missing metadata: {key}"
+        # Verify metadata contains expected keys
+        for key in expected_files:
+            assert key in result.metadata, f"Missing metadata: {key}"
 
 
 @pytest.mark.regression
@@ -237,20 +248,20 @@ Plan file: specs/test.md
 class TestProjectDetectionRegression:
     """Test project context detection matches old workflow."""
 
-    def test_explicit_tac7_marker(self):
+    def test_explicit_tac7_marker(self, tac7_config):
         """Test explicit tac-7 project marker detection."""
         # Old workflow would recognize "NOT tac-webbuilder"
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         assert config.project_context == 'tac-7-root'
         assert config.requires_worktree is False
         assert 'NOT tac-webbuilder' in config.detection_reasoning or \
                'tac-7' in config.detection_reasoning.lower()
 
-    def test_webbuilder_path_detection(self):
+    def test_webbuilder_path_detection(self, webbuilder_config):
         """Test webbuilder detection from file paths."""
         # Old workflow would detect app/server, app/client paths
-        config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
+        config = webbuilder_config
 
         assert config.project_context == 'tac-webbuilder'
         assert config.requires_worktree is True
@@ -281,18 +292,18 @@ Plan file: specs/test.md
 class TestWorktreeDecisionRegression:
     """Test worktree creation decisions match old workflow."""
 
-    def test_webbuilder_requires_worktree(self):
+    def test_webbuilder_requires_worktree(self, webbuilder_config):
         """Test webbuilder tasks create worktree (old behavior)."""
-        config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
+        config = webbuilder_config
 
         # Old workflow ALWAYS created worktree for webbuilder
         assert config.project_context == 'tac-webbuilder'
         assert config.requires_worktree is True
         assert config.worktree_setup is not None
 
-    def test_tac7_skips_worktree(self):
+    def test_tac7_skips_worktree(self, tac7_config):
         """Test tac-7 tasks skip worktree (NEW optimized behavior)."""
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         # OLD workflow created worktree for everything
         # NEW workflow skips for tac-7-root
@@ -302,9 +313,9 @@ class TestWorktreeDecisionRegression:
 
         # This is a POSITIVE regression - we're more efficient
 
-    def test_worktree_setup_structure(self):
+    def test_worktree_setup_structure(self, webbuilder_config):
         """Test worktree setup has same structure as old workflow."""
-        config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
+        config = webbuilder_config
 
         # Old workflow setup had these fields
         assert 'backend_port' in config.worktree_setup
@@ -321,61 +332,31 @@ class TestGitOperationsRegression:
     """Test git operations produce same results as old workflow."""
 
     @patch('adw_modules.plan_executor.execute_worktree_setup')
-    def test_git_branch_creation_equivalence(self, mock_setup):
+    def test_git_branch_creation_equivalence(self, mock_setup, seeded_repo, monkeypatch, logger):
         """Test branch creation matches old workflow."""
         mock_setup.return_value = True
+        _enter_repo(seeded_repo.repo_path, monkeypatch)
 
-        with MockTempRepo() as repo:
-            subprocess.run(
-                ["git", "checkout", "-b", "main"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-            subprocess.run(
-                ["git", "commit", "--allow-empty", "-m", "Initial"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-
-            config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
-            logger = Mock()
+        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
 
-            result = execute_plan(config, 123, str(repo.repo_path), logger)
+        result = execute_plan(config, 123, str(seeded_repo.repo_path), logger)
 
-            # Verify branch exists (same as old workflow)
-            branch_check = subprocess.run(
-                ["git", "branch", "--list", config.branch_name],
-                cwd=repo.repo_path,
-                capture_output=True,
-                text=True
-            )
-            assert config.branch_name in branch_check.stdout
+        # Verify branch exists (same as old workflow)
+        assert config.branch_name in _local_branches(seeded_repo.repo_path)
 
     @patch('adw_modules.plan_executor.execute_worktree_setup')
-    def test_worktree_structure_equivalence(self, mock_setup):
+    def test_worktree_structure_equivalence(self, mock_setup, seeded_repo, monkeypatch, logger):
         """Test worktree structure matches old workflow."""
         mock_setup.return_value = True
+        _enter_repo(seeded_repo.repo_path, monkeypatch)
 
-        with MockTempRepo() as repo:
-            subprocess.run(
-                ["git", "checkout", "-b", "main"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-            subprocess.run(
-                ["git", "commit", "--allow-empty", "-m", "Initial"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-
-            config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
-            logger = Mock()
+        config = parse_plan(SAMPLE_PLAN_WEBBUILDER)
 
-            result = execute_plan(config, 456, str(repo.repo_path), logger)
+        result = execute_plan(config, 456, str(seeded_repo.repo_path), logger)
 
-            # Old workflow created worktrees at trees/{adw_id}/
-            assert 'trees/' in result.metadata['working_directory']
-            assert Path(result.metadata['working_directory']).exists()
+        # Old workflow created worktrees at trees/{adw_id}/
+        assert 'trees/' in result.metadata['working_directory']
+        assert Path(result.metadata['working_directory']).exists()
 
 
 @pytest.mark.regression
@@ -424,7 +405,7 @@ issue_type: feature
 class TestBackwardCompatibility:
     """Test backward compatibility with old workflow artifacts."""
 
-    def test_state_file_compatibility(self):
+    def test_state_file_compatibility(self, tac7_config):
         """Test state file format compatible with old workflow."""
         # Old workflow state had these fields
         expected_state_fields = {
@@ -436,7 +417,7 @@ class TestBackwardCompatibility:
         }
 
         # New workflow should maintain compatible state
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         # Verify we can create compatible state
         state_compatible = {
@@ -448,38 +429,26 @@ class TestBackwardCompatibility:
 
         assert all(key in state_compatible for key in ['adw_id', 'issue_class', 'branch_name'])
 
-    def test_plan_file_path_format(self):
+    def test_plan_file_path_format(self, tac7_config):
         """Test plan file paths match old format."""
-        config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
+        config = tac7_config
 
         # Old format: specs/issue-{num}-adw-{id}-sdlc_planner-{name}.md
-        assert config.plan_file_path.startswith('specs/')
-        assert 'issue-' in config.plan_file_path
-        assert 'adw-' in config.plan_file_path
-        assert 'sdlc_planner' in config.plan_file_path
-        assert config.plan_file_path.endswith('.md')
+        assert re.fullmatch(
+            r'specs/issue-\d+-adw-[a-z0-9]+-sdlc_planner-.+\.md', config.plan_file_path
+        ), f"Unexpected plan file path: {config.plan_file_path}"
 
 
 @pytest.mark.regression
 class TestPerformanceRegression:
     """Test that performance improvements don't break functionality."""
 
-    def test_fast_execution_maintains_correctness(self):
+    def test_fast_execution_maintains_correctness(self, monkeypatch, logger):
         """Test fast execution still produces correct results."""
         with MockTempRepo() as repo:
-            subprocess.run(
-                ["git", "checkout", "-b", "main"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
-            subprocess.run(
-                ["git", "commit", "--allow-empty", "-m", "Initial"],
-                cwd=repo.repo_path,
-                capture_output=True
-            )
+            _init_repo(repo.repo_path, monkeypatch)
 
             config = parse_plan(SAMPLE_PLAN_TAC7_ROOT)
-            logger = Mock()
 
             import time
             start = time.time()
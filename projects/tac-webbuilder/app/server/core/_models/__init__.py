@@ -0,0 +1,11 @@
+"""
+Pydantic models behind core.data_models, one module per API area.
+
+Import models from core.data_models; these modules are loaded on first use.
+"""
+
+from pydantic import ConfigDict
+
+# For models built in bulk (per query, per column, per issue): immutable once
+# constructed, and unknown fields are rejected rather than carried along.
+_FROZEN = ConfigDict(frozen=True, extra="forbid")
@@ -0,0 +1,22 @@
+"""CSV export models."""
+
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Literal, Union
+
+
+class ExportRequest(BaseModel):
+    table_name: str = Field(..., description="Name of the table to export")
+
+
+# Client-side export: the caller sends back rows it already holds. For large
+# results (>10k rows) prefer QueryExportStreamRequest.
+class QueryExportRequest(BaseModel):
+    data: Union[List[Dict[str, Any]], Dict[str, List[Any]]] = Field(
+        ..., description="Query result data to export: row dicts, or column name -> values"
+    )
+    columns: List[str] = Field(..., description="Column names for the export")
+
+
+class QueryExportStreamRequest(BaseModel):
+    sql: str = Field(..., description="SQL query whose results are exported")
+    format: Literal["csv", "jsonl"] = Field("csv", description="Export file format")
@@ -0,0 +1,17 @@
+"""File upload models."""
+
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+
+
+class FileUploadRequest(BaseModel):
+    # Handled by FastAPI UploadFile, no request model needed
+    pass
+
+
+class FileUploadResponse(BaseModel):
+    table_name: str
+    table_schema: Dict[str, str]  # column_name: data_type
+    row_count: int
+    sample_data: List[Dict[str, Any]]
+    error: Optional[str] = None
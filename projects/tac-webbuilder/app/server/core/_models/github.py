@@ -0,0 +1,41 @@
+"""GitHub issue generation models."""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
+
+from core._models import _FROZEN
+
+
+class GitHubIssue(BaseModel):
+    model_config = _FROZEN
+
+    title: str = Field(..., description="Issue title")
+    body: str = Field(..., description="Issue body in GitHub markdown format")
+    labels: List[str] = Field(default_factory=list, description="Issue labels")
+    classification: Literal["feature", "bug", "chore"] = Field(..., description="Issue type classification")
+    workflow: str = Field(..., description="ADW workflow command (e.g., adw_sdlc_iso)")
+    model_set: Literal["base", "heavy"] = Field(..., description="Model set for ADW workflow")
+
+
+class ProjectContext(BaseModel):
+    model_config = _FROZEN
+
+    path: str = Field(..., description="Project directory path")
+    is_new_project: bool = Field(..., description="Whether this is a new project")
+    framework: Optional[str] = Field(None, description="Detected framework (e.g., react-vite, nextjs, fastapi)")
+    backend: Optional[str] = Field(None, description="Detected backend framework")
+    complexity: Literal["low", "medium", "high"] = Field(..., description="Project complexity level")
+    build_tools: Optional[List[str]] = Field(default_factory=list, description="Detected build tools")
+    package_manager: Optional[str] = Field(None, description="Detected package manager")
+    has_git: bool = Field(default=False, description="Whether project has git initialized")
+
+
+class NLProcessRequest(BaseModel):
+    nl_input: str = Field(..., description="Natural language input describing the desired feature/bug/chore")
+    project_path: Optional[str] = Field(None, description="Path to project directory for context detection")
+
+
+class NLProcessResponse(BaseModel):
+    github_issue: GitHubIssue
+    project_context: ProjectContext
+    error: Optional[str] = None
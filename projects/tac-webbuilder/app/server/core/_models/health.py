@@ -0,0 +1,16 @@
+"""Health check models."""
+
+from pydantic import BaseModel
+from typing import Literal
+
+
+class HealthCheckRequest(BaseModel):
+    pass
+
+
+class HealthCheckResponse(BaseModel):
+    status: Literal["ok", "error"]
+    database_connected: bool
+    tables_count: int
+    version: str = "1.0.0"
+    uptime_seconds: float
@@ -0,0 +1,32 @@
+"""Column insight models."""
+
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+
+from core._models import _FROZEN
+
+
+class InsightsRequest(BaseModel):
+    table_name: str
+    column_names: Optional[List[str]] = None  # If None, analyze all columns
+
+
+class ColumnInsight(BaseModel):
+    model_config = _FROZEN
+
+    column_name: str
+    data_type: str
+    unique_values: int
+    null_count: int
+    min_value: Optional[Any] = None
+    max_value: Optional[Any] = None
+    avg_value: Optional[float] = None
+    most_common: Optional[List[Dict[str, Any]]] = None
+
+
+class InsightsResponse(BaseModel):
+    table_name: str
+    insights: List[ColumnInsight]
+    generated_at: datetime
+    error: Optional[str] = None
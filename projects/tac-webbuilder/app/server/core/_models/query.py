@@ -0,0 +1,40 @@
+"""Natural language query models."""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal
+
+from core._models import _FROZEN
+
+
+class QueryRequest(BaseModel):
+    query: str = Field(..., description="Natural language query")
+    llm_provider: Literal["openai", "anthropic"] = "openai"
+    table_name: Optional[str] = None  # If querying specific table
+
+
+class QueryResponse(BaseModel):
+    model_config = _FROZEN
+
+    sql: str
+    results: List[Dict[str, Any]]  # row dicts; large results should be streamed, not materialized
+    columns: List[str]
+    row_count: int
+    execution_time_ms: float
+    error: Optional[str] = None
+
+
+# Column-major QueryResponse: one list per column instead of a dict per row
+class QueryResponseColumnar(BaseModel):
+    model_config = _FROZEN
+
+    sql: str
+    columns: List[str]
+    data: List[List[Any]]  # data[col_idx][row_idx]
+    row_count: int
+    execution_time_ms: float
+    error: Optional[str] = None
+
+
+class RandomQueryResponse(BaseModel):
+    query: str
+    error: Optional[str] = None
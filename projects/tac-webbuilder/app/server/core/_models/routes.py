@@ -0,0 +1,16 @@
+"""Routes visualization models."""
+
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class Route(BaseModel):
+    path: str = Field(..., description="Route path (e.g., /api/upload)")
+    method: str = Field(..., description="HTTP method (GET, POST, PUT, DELETE, PATCH)")
+    handler: str = Field(..., description="Handler function name")
+    description: str = Field(..., description="Route description from docstring")
+
+
+class RoutesResponse(BaseModel):
+    routes: List[Route] = Field(..., description="List of routes")
+    total: int = Field(..., description="Total number of routes")
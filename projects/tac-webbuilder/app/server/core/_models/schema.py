@@ -0,0 +1,33 @@
+"""Database schema models."""
+
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+from core._models import _FROZEN
+
+
+class ColumnInfo(BaseModel):
+    name: str
+    type: str
+    nullable: bool = True
+    primary_key: bool = False
+
+
+class TableSchema(BaseModel):
+    model_config = _FROZEN
+
+    name: str
+    columns: List[ColumnInfo]
+    row_count: int
+    created_at: datetime
+
+
+class DatabaseSchemaRequest(BaseModel):
+    pass  # No input needed
+
+
+class DatabaseSchemaResponse(BaseModel):
+    tables: List[TableSchema]
+    total_tables: int
+    error: Optional[str] = None
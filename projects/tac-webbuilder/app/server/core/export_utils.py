@@ -1,15 +1,25 @@
+import csv
+import json
 import sqlite3
-from typing import List, Dict
+from typing import Any, Iterator, List, Dict, Union
 import pandas as pd
 import io
 
+from core.sql_security import validate_sql_query
 
-def generate_csv_from_data(data: List[Dict], columns: List[str]) -> bytes:
+# Rows fetched from the cursor per streamed chunk
+STREAM_BATCH_SIZE = 1000
+
+
+def generate_csv_from_data(
+    data: Union[List[Dict], Dict[str, List[Any]]], columns: List[str]
+) -> bytes:
     """
     Generate CSV file from data and columns.
     
     Args:
-        data: List of dictionaries containing the data
+        data: Row dictionaries, or a column-oriented mapping of column name
+            to values (pandas builds the frame from columns directly)
         columns: List of column names
         
     Returns:
@@ -19,7 +29,7 @@ def generate_csv_from_data(data: List[Dict], columns: List[str]) -> bytes:
         return b""
     
     if not columns and data:
-        columns = list(data[0].keys()) if data else []
+        columns = list(data.keys()) if isinstance(data, dict) else list(data[0].keys())
     
     df = pd.DataFrame(data, columns=columns)
     
@@ -63,4 +73,85 @@ def generate_csv_from_table(conn: sqlite3.Connection, table_name: str) -> bytes:
     csv_content = csv_buffer.getvalue()
     csv_buffer.close()
     
-    return csv_content.encode('utf-8')
\ No newline at end of file
+    return csv_content.encode('utf-8')
+
+
+def stream_query_export(
+    conn: sqlite3.Connection,
+    sql: str,
+    format: str = "csv",
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """
+    Stream query results as CSV or JSONL without materializing them.
+
+    Rows are read from the cursor ``batch_size`` at a time and encoded chunk
+    by chunk, so memory stays flat regardless of result size. The query is
+    validated and executed before returning, so SQL errors surface here
+    rather than mid-stream.
+
+    Args:
+        conn: SQLite database connection; closed when the stream finishes
+        sql: SQL query to export
+        format: "csv" or "jsonl"
+        batch_size: Rows per chunk
+
+    Returns:
+        Iterator of encoded chunks (CSV starts with a header chunk)
+
+    Raises:
+        SQLSecurityError: If the query contains dangerous operations
+        ValueError: If the format is not supported
+    """
+    if format not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported export format: {format}")
+
+    validate_sql_query(sql)
+    cursor = conn.execute(sql)
+    columns = [description[0] for description in cursor.description or []]
+
+    if format == "csv":
+        encode = _CsvEncoder()
+        header = [columns]
+    else:
+        encode = _encode_jsonl_rows
+        header = None
+    return _stream_rows(conn, cursor, columns, encode, batch_size, header)
+
+
+def _stream_rows(conn, cursor, columns, encode, batch_size, header):
+    try:
+        if header:
+            yield encode(columns, header)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield encode(columns, rows)
+    finally:
+        conn.close()
+
+
+class _CsvEncoder:
+    """
+    Encodes row batches to CSV through one reused buffer and writer.
+
+    The buffer is emptied after each batch, so a stream allocates a single
+    StringIO/csv.writer pair instead of one per chunk.
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def __call__(self, columns: List[str], rows: List[tuple]) -> bytes:
+        self._writer.writerows(rows)
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk.encode('utf-8')
+
+
+def _encode_jsonl_rows(columns: List[str], rows: List[tuple]) -> bytes:
+    lines = (json.dumps(dict(zip(columns, row)), default=str) for row in rows)
+    return ("\n".join(lines) + "\n").encode('utf-8')
@@ -2,13 +2,63 @@
 GitHub CLI integration for posting issues.
 """
 
+import asyncio
+import functools
+import json
+import re
+import shutil
 import subprocess
-from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
 from core.data_models import GitHubIssue
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+
+# "owner/repo" at the end of a bare slug, an https URL or an SSH remote (host:owner/repo)
+_REPO_PATH_RE = re.compile(r'(?:^|[/:])([^/:]+)/([^/:]+?)(?:\.git)?/?$')
+
+# GitHub caps label names at 50 characters. Labels are joined with commas
+# for `gh issue create --label`, so a comma (or line break) would split or
+# corrupt the list.
+_MAX_LABEL_LENGTH = 50
+_FORBIDDEN_LABEL_CHARS = frozenset(",\r\n")
+
+# gh prints the new issue's URL; "#123" covers older/alternate output
+_ISSUE_URL_RE = re.compile(r'/issues/(\d+)')
+_ISSUE_REF_RE = re.compile(r'#(\d+)')
+
+# Concurrent `gh issue create` processes in post_issues_async; GitHub
+# rate-limits bursts of content creation
+MAX_CONCURRENT_CREATES = 4
+
+
+class IssuePostError(RuntimeError):
+    """
+    Raised when some issues in a batch fail to post.
+
+    Attributes:
+        created: Issue numbers that were created, in input order
+        failed: (issue, error) pairs for the issues that were not created
+    """
+
+    def __init__(
+        self,
+        message: str,
+        created: List[int],
+        failed: List[Tuple[GitHubIssue, Exception]]
+    ):
+        super().__init__(message)
+        self.created = created
+        self.failed = failed
+
 
 class GitHubPoster:
     """
@@ -23,7 +73,16 @@ class GitHubPoster:
             repo_url: GitHub repository URL (optional, uses current repo if None)
         """
         self.repo_url = repo_url
-        self.console = Console()
+
+    @property
+    def console(self) -> "Console":
+        """
+        Rich console shared by all posters, created on first use.
+
+        rich is only imported once something is printed, so validation and
+        formatting callers never pay for it.
+        """
+        return _shared_console()
 
     def format_preview(self, issue: GitHubIssue) -> str:
         """
@@ -35,19 +94,14 @@ class GitHubPoster:
         Returns:
             Formatted preview string
         """
-        preview_parts = [
-            f"## Title: {issue.title}",
-            "",
-            f"**Classification:** {issue.classification}",
-            f"**Labels:** {', '.join(issue.labels)}",
-            f"**Workflow:** {issue.workflow} model_set {issue.model_set}",
-            "",
-            "---",
-            "",
-            issue.body
-        ]
-
-        return "\n".join(preview_parts)
+        return _preview_content(
+            issue.title,
+            issue.classification,
+            tuple(issue.labels),
+            issue.workflow,
+            issue.model_set,
+            issue.body,
+        )
 
     def post_issue(self, issue: GitHubIssue, confirm: bool = True) -> int:
         """
@@ -78,61 +132,345 @@ class GitHubPoster:
                 self.console.print("[yellow]Issue posting cancelled.[/yellow]")
                 raise RuntimeError("User cancelled issue posting")
 
-        # Prepare gh command
-        cmd = ["gh", "issue", "create"]
+        # Execute command
+        try:
+            result = self._execute_gh_command(self._create_command(issue), input=issue.body)
+
+            # gh CLI returns the issue URL like: https://github.com/owner/repo/issues/123
+            issue_url = result.strip()
+            issue_number = _parse_issue_number(issue_url)
+
+            self.console.print(f"[green]✓ Issue created: {issue_url}[/green]")
+            return issue_number
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to post issue to GitHub: {str(e)}")
+
+    def post_issues_bulk(self, issues: List[GitHubIssue]) -> List[int]:
+        """
+        Post several issues with a single GraphQL mutation.
+
+        Uses two gh calls in total (label/repository lookup + one aliased
+        createIssue mutation) instead of one ``gh issue create`` per issue.
+        No preview or confirmation is shown.
+
+        Args:
+            issues: GitHubIssue objects to post
+
+        Returns:
+            Issue numbers of the created issues, in input order
+
+        Raises:
+            RuntimeError: If gh CLI is not available, a label does not exist
+                in the repository, or posting fails
+            IssuePostError: If GitHub created only some of the issues; the
+                aliased mutations are not atomic, so the numbers that were
+                created are on the error's ``created``
+        """
+        if not issues:
+            return []
+
+        if not self._validate_gh_cli():
+            raise RuntimeError(
+                "GitHub CLI (gh) is not installed or not authenticated. "
+                "Please install gh CLI and run 'gh auth login'."
+            )
+
+        try:
+            owner, name = self._repo_owner_and_name()
+            label_names = sorted({label for issue in issues for label in issue.labels})
+            repo_id, label_ids = self._lookup_repo_and_labels(owner, name, label_names)
+
+            missing = [label for label in label_names if label not in label_ids]
+            if missing:
+                raise RuntimeError(f"Labels not found in repository: {', '.join(missing)}")
+
+            # Titles and bodies go in as variables so they need no escaping;
+            # node IDs are plain tokens and are inlined as JSON string literals.
+            declarations, mutations, variables = [], [], {}
+            for i, issue in enumerate(issues):
+                declarations.append(f"$t{i}: String!, $b{i}: String!")
+                ids = json.dumps([label_ids[label] for label in issue.labels])
+                mutations.append(
+                    f"i{i}: createIssue(input: {{repositoryId: {json.dumps(repo_id)}, "
+                    f"title: $t{i}, body: $b{i}, labelIds: {ids}}}) {{ issue {{ number url }} }}"
+                )
+                variables[f"t{i}"] = issue.title
+                variables[f"b{i}"] = issue.body
+
+            document = f"mutation({', '.join(declarations)}) {{\n  " + "\n  ".join(mutations) + "\n}"
+            response = self._graphql_response(document, variables)
+            data = response.get("data") or {}
+
+            # Errors for a single createIssue carry its alias as path[0];
+            # ones without a path (e.g. a rejected document) apply to all.
+            errors = {}
+            for error in response.get("errors") or []:
+                alias = (error.get("path") or [None])[0]
+                errors.setdefault(alias, error.get("message", "unknown error"))
+            if not data and not errors:
+                raise RuntimeError("GraphQL response contained no data")
+
+            numbers, failed = [], []
+            for i, issue in enumerate(issues):
+                created = (data.get(f"i{i}") or {}).get("issue")
+                if created:
+                    self.console.print(f"[green]✓ Issue created: {created['url']}[/green]")
+                    numbers.append(created["number"])
+                else:
+                    message = errors.get(f"i{i}") or errors.get(None) or "no issue returned"
+                    failed.append((issue, RuntimeError(message)))
+
+            if failed:
+                raise IssuePostError(
+                    f"Failed to post {len(failed)} of {len(issues)} issues to GitHub: "
+                    f"{str(failed[0][1])}",
+                    created=numbers,
+                    failed=failed
+                )
+            return numbers
+
+        except IssuePostError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to post issues to GitHub: {str(e)}")
+
+    async def post_issues_async(self, issues: List[GitHubIssue]) -> List[int]:
+        """
+        Post several issues with concurrent ``gh issue create`` processes.
+
+        Up to MAX_CONCURRENT_CREATES processes run at once, so N issues take
+        about N / MAX_CONCURRENT_CREATES round trips instead of N. Unlike
+        post_issues_bulk this needs no label lookup, and gh reports unknown
+        labels per issue.
+        No preview or confirmation is shown.
+
+        Args:
+            issues: GitHubIssue objects to post
+
+        Returns:
+            Issue numbers of the created issues, in input order
+
+        Raises:
+            RuntimeError: If gh CLI is not available
+            IssuePostError: If any issue fails to post; the others still
+                finish, and their numbers are on the error's ``created``
+        """
+        if not issues:
+            return []
+
+        if not self._validate_gh_cli():
+            raise RuntimeError(
+                "GitHub CLI (gh) is not installed or not authenticated. "
+                "Please install gh CLI and run 'gh auth login'."
+            )
+
+        slots = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+
+        async def post(issue: GitHubIssue) -> int:
+            async with slots:
+                return await self._post_issue_async(issue)
+
+        results = await asyncio.gather(
+            *(post(issue) for issue in issues),
+            return_exceptions=True
+        )
+
+        created = [result for result in results if not isinstance(result, Exception)]
+        failed = [
+            (issue, result)
+            for issue, result in zip(issues, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            raise IssuePostError(
+                f"Failed to post {len(failed)} of {len(issues)} issues to GitHub: "
+                f"{str(failed[0][1])}",
+                created=created,
+                failed=failed
+            )
+        return created
+
+    async def _post_issue_async(self, issue: GitHubIssue) -> int:
+        """
+        Run one ``gh issue create`` without blocking the event loop.
+
+        Returns:
+            Issue number of the created issue
+        """
+        process = await asyncio.create_subprocess_exec(
+            *self._create_command(issue),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate(input=issue.body.encode())
+        if process.returncode != 0:
+            raise RuntimeError(f"GitHub CLI command failed: {stderr.decode().strip()}")
+
+        issue_url = stdout.decode().strip()
+        issue_number = _parse_issue_number(issue_url)
+        self.console.print(f"[green]✓ Issue created: {issue_url}[/green]")
+        return issue_number
+
+    def _create_command(self, issue: GitHubIssue) -> List[str]:
+        """
+        Build the ``gh issue create`` command for an issue.
+
+        The body is read from stdin (``--body-file -``) rather than passed as
+        an argument, so long plan-sized bodies never hit argv limits; callers
+        must write ``issue.body`` to the process's stdin.
+
+        Args:
+            issue: GitHubIssue to post
 
-        # Add title
-        cmd.extend(["--title", issue.title])
+        Returns:
+            Command list for subprocess
 
-        # Add body
-        cmd.extend(["--body", issue.body])
+        Raises:
+            ValueError: If a label cannot be passed to ``--label``
+        """
+        cmd = ["gh", "issue", "create", "--title", issue.title, "--body-file", "-"]
 
-        # Add labels
         if issue.labels:
+            _validate_labels(issue.labels)
             cmd.extend(["--label", ",".join(issue.labels)])
 
-        # Add repo if specified
         if self.repo_url:
             cmd.extend(["--repo", self.repo_url])
 
-        # Execute command
-        try:
-            result = self._execute_gh_command(cmd)
+        return cmd
 
-            # Extract issue number from result
-            # gh CLI returns the issue URL like: https://github.com/owner/repo/issues/123
-            issue_url = result.strip()
-            issue_number = int(issue_url.split("/")[-1])
+    def _repo_owner_and_name(self) -> Tuple[str, str]:
+        """
+        Owner and name for GraphQL lookups.
 
-            self.console.print(f"[green]✓ Issue created: {issue_url}[/green]")
-            return issue_number
+        Parsed from repo_url (https URL or ``git@host:owner/repo`` remote);
+        without one, asks gh for the current directory's repository.
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to post issue to GitHub: {str(e)}")
+        Raises:
+            ValueError: If repo_url has no owner/repo path
+        """
+        if not self.repo_url:
+            info = self.get_repo_info()
+            return info["owner"]["login"], info["name"]
+        match = _REPO_PATH_RE.search(self.repo_url)
+        if not match:
+            raise ValueError(f"Cannot parse owner/repo from repository URL: {self.repo_url}")
+        return match.group(1), match.group(2)
+
+    def _lookup_repo_and_labels(
+        self, owner: str, name: str, label_names: Sequence[str]
+    ) -> Tuple[str, dict]:
+        """
+        Resolve the repository and label node IDs that createIssue needs.
+
+        Each label is fetched by name through an aliased ``label(name:)``
+        field, so only the requested labels are looked up and repositories
+        with many labels need no pagination.
+
+        Returns:
+            Tuple of (repository ID, {label name: label ID} for labels that exist)
+        """
+        declarations = ["$owner: String!", "$name: String!"]
+        fields = ["id"]
+        variables = {"owner": owner, "name": name}
+        for i, label in enumerate(label_names):
+            declarations.append(f"$l{i}: String!")
+            fields.append(f"l{i}: label(name: $l{i}) {{ id }}")
+            variables[f"l{i}"] = label
+
+        query = (
+            f"query({', '.join(declarations)}) {{\n"
+            f"  repository(owner: $owner, name: $name) {{ {' '.join(fields)} }}\n}}"
+        )
+        repo = self._graphql(query, variables)["repository"]
+
+        label_ids = {}
+        for i, label in enumerate(label_names):
+            found = repo.get(f"l{i}")
+            if found:
+                label_ids[label] = found["id"]
+        return repo["id"], label_ids
+
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """
+        Run a GraphQL document through ``gh api graphql``.
+
+        The query and variables are sent as one JSON request body on stdin
+        (``--input -``), so large issue bodies never hit argv limits and
+        values keep their JSON types.
+
+        Returns:
+            The response's ``data`` object
+        """
+        payload = json.dumps({"query": query, "variables": variables})
+        cmd = ["gh", "api", "graphql", "--input", "-"]
+        return _loads(self._execute_gh_command(cmd, text=False, input=payload))["data"]
+
+    def _graphql_response(self, query: str, variables: dict) -> dict:
+        """
+        Run a GraphQL document and return the whole response.
+
+        Unlike _graphql, a response that gh exits nonzero on (GraphQL
+        ``errors``) is still returned, so callers can see which fields
+        succeeded alongside the errors.
+
+        Returns:
+            The parsed response, with ``data`` and optionally ``errors``
+        """
+        payload = json.dumps({"query": query, "variables": variables})
+        cmd = ["gh", "api", "graphql", "--input", "-"]
+        return _loads(self._execute_gh_command(
+            cmd, text=False, input=payload, keep_output_on_error=True
+        ))
 
     def _show_preview(self, issue: GitHubIssue):
         """
         Display rich preview of the issue in terminal.
 
+        When output is not a terminal (piped, logged) the preview markdown is
+        written as-is; the panel layout and markdown rendering would only be
+        flattened to plain text anyway.
+
         Args:
             issue: GitHubIssue to preview
         """
         preview = self.format_preview(issue)
 
+        if not self.console.is_terminal:
+            self.console.out(f"\n{preview}", highlight=False)
+            return
+
+        from rich.panel import Panel
+
         # Display with rich
         self.console.print("\n")
         self.console.print(Panel(
-            Markdown(preview),
+            _preview_markdown(preview),
             title="[bold blue]GitHub Issue Preview[/bold blue]",
             border_style="blue"
         ))
 
-    def _execute_gh_command(self, cmd: list) -> str:
+    def _execute_gh_command(
+        self,
+        cmd: list,
+        text: bool = True,
+        input: Optional[str] = None,
+        keep_output_on_error: bool = False
+    ) -> Union[str, bytes]:
         """
         Execute a gh CLI command.
 
         Args:
             cmd: Command list to execute
+            text: Decode output to str; JSON callers pass False and hand the
+                raw bytes straight to the parser
+            input: Text to write to the command's stdin (e.g. an issue body
+                for ``--body-file -``)
+            keep_output_on_error: Return stdout instead of raising when the
+                command fails but still printed a response (``gh api``
+                prints GraphQL error responses and exits nonzero)
 
         Returns:
             Command output
@@ -143,13 +481,17 @@ class GitHubPoster:
         try:
             result = subprocess.run(
                 cmd,
+                input=input.encode() if input is not None and not text else input,
                 capture_output=True,
-                text=True,
+                text=text,
                 check=True
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            if keep_output_on_error and e.stdout:
+                return e.stdout
+            stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else e.stderr
+            error_msg = stderr if stderr else str(e)
             raise RuntimeError(f"GitHub CLI command failed: {error_msg}")
 
     def _validate_gh_cli(self) -> bool:
@@ -159,25 +501,12 @@ class GitHubPoster:
         Returns:
             True if gh CLI is ready, False otherwise
         """
-        try:
-            # Check if gh is installed
-            subprocess.run(
-                ["gh", "--version"],
-                capture_output=True,
-                check=True
-            )
-
-            # Check if authenticated
-            subprocess.run(
-                ["gh", "auth", "status"],
-                capture_output=True,
-                check=True
-            )
-
-            return True
-
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        available = _gh_available()
+        if not available:
+            # Don't pin a failure for the process lifetime; the user may
+            # install gh or run 'gh auth login' and retry.
+            _gh_available.cache_clear()
+        return available
 
     def get_repo_info(self) -> dict:
         """
@@ -194,10 +523,88 @@ class GitHubPoster:
             if self.repo_url:
                 cmd.append(self.repo_url)
 
-            result = self._execute_gh_command(cmd)
-
-            import json
-            return json.loads(result)
+            result = self._execute_gh_command(cmd, text=False)
+            return _loads(result)
 
         except Exception as e:
             raise RuntimeError(f"Failed to get repository info: {str(e)}")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_console() -> "Console":
+    """Process-wide console; terminal detection runs once, not per poster."""
+    from rich.console import Console
+    return Console()
+
+
+@functools.lru_cache(maxsize=128)
+def _preview_content(
+    title: str,
+    classification: str,
+    labels: Tuple[str, ...],
+    workflow: str,
+    model_set: str,
+    body: str,
+) -> str:
+    """Preview text for an issue's fields; repeat previews are served from cache."""
+    preview_parts = [
+        f"## Title: {title}",
+        "",
+        f"**Classification:** {classification}",
+        f"**Labels:** {', '.join(labels)}",
+        f"**Workflow:** {workflow} model_set {model_set}",
+        "",
+        "---",
+        "",
+        body
+    ]
+
+    return "\n".join(preview_parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _preview_markdown(preview: str) -> "Markdown":
+    """Parsed Markdown for a preview; rich renders it without re-parsing."""
+    from rich.markdown import Markdown
+    return Markdown(preview)
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_available() -> bool:
+    """
+    Whether gh is on PATH and authenticated, checked once per process.
+
+    ``shutil.which`` replaces the ``gh --version`` spawn, leaving a single
+    ``gh auth status`` call. Tests reset it with ``_gh_available.cache_clear()``.
+    """
+    if shutil.which("gh") is None:
+        return False
+    try:
+        return subprocess.run(["gh", "auth", "status"], capture_output=True).returncode == 0
+    except OSError:
+        return False
+
+
+def _validate_labels(labels: List[str]) -> None:
+    """
+    Check labels can be sent as one comma-separated ``--label`` value.
+
+    Raises:
+        ValueError: On an empty, over-long, or comma/newline-containing label
+    """
+    for label in labels:
+        if not label or len(label) > _MAX_LABEL_LENGTH or not _FORBIDDEN_LABEL_CHARS.isdisjoint(label):
+            raise ValueError(f"Invalid label format: {label!r}")
+
+
+def _parse_issue_number(output: str) -> int:
+    """
+    Extract the issue number from ``gh issue create`` output.
+
+    Raises:
+        ValueError: If the output contains no issue URL or reference
+    """
+    match = _ISSUE_URL_RE.search(output) or _ISSUE_REF_RE.search(output)
+    if not match:
+        raise ValueError(f"Could not find issue number in gh output: {output!r}")
+    return int(match.group(1))
@@ -67,12 +67,8 @@ def generate_insights(table_name: str, column_names: Optional[List[str]] = None)
             )
             null_count = cursor_null.fetchone()[0]
             
-            insight = ColumnInsight(
-                column_name=col_name,
-                data_type=col_type,
-                unique_values=unique_values,
-                null_count=null_count
-            )
+            # ColumnInsight is frozen, so gather optional stats before building it
+            stats = {}
             
             # Type-specific insights
             if col_type in ['INTEGER', 'REAL', 'NUMERIC']:
@@ -91,9 +87,9 @@ def generate_insights(table_name: str, column_names: Optional[List[str]] = None)
                 )
                 result = cursor_stats.fetchone()
                 if result:
-                    insight.min_value = result[0]
-                    insight.max_value = result[1]
-                    insight.avg_value = result[2]
+                    stats["min_value"] = result[0]
+                    stats["max_value"] = result[1]
+                    stats["avg_value"] = result[2]
             
             # Most common values (for all types) using safe query execution
             cursor_common = execute_query_safely(
@@ -110,12 +106,18 @@ def generate_insights(table_name: str, column_names: Optional[List[str]] = None)
             )
             most_common = cursor_common.fetchall()
             if most_common:
-                insight.most_common = [
+                stats["most_common"] = [
                     {"value": val, "count": count} 
                     for val, count in most_common
                 ]
             
-            insights.append(insight)
+            insights.append(ColumnInsight(
+                column_name=col_name,
+                data_type=col_type,
+                unique_values=unique_values,
+                null_count=null_count,
+                **stats
+            ))
         
         conn.close()
         return insights
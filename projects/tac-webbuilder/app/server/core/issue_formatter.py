@@ -2,7 +2,9 @@
 Issue formatting module for GitHub issue generation.
 """
 
-from typing import Dict, Any
+import functools
+import string
+from typing import Dict, Any, Tuple
 from core.data_models import GitHubIssue
 
 
@@ -53,6 +55,40 @@ ISSUE_TEMPLATES = {
 }
 
 
+# Placeholder text for sections the caller left empty
+_DEFAULT_REQUIREMENTS = "- To be determined"
+_DEFAULT_TECHNICAL_APPROACH = "To be determined during implementation planning."
+_TO_BE_DOCUMENTED = "To be documented"
+
+# Markers every issue body must contain
+_REQUIRED_SECTIONS = ("##", "Workflow")
+
+
+# ISSUE_TEMPLATES pre-parsed into (literal, field, format_spec, conversion)
+# segments, so rendering never re-scans the template text
+_ParsedTemplate = Tuple[Tuple[str, Any, Any, Any], ...]
+_COMPILED_TEMPLATES: Dict[str, _ParsedTemplate] = {
+    name: tuple(string.Formatter().parse(template))
+    for name, template in ISSUE_TEMPLATES.items()
+}
+
+
+def _render(parsed: _ParsedTemplate, values: Dict[str, Any]) -> str:
+    """
+    Fill a pre-parsed template; equivalent to ``template.format(**values)``
+    for the plain ``{field}`` placeholders ISSUE_TEMPLATES uses.
+
+    Raises:
+        KeyError: If a placeholder has no value
+    """
+    parts = []
+    for literal, field, format_spec, _ in parsed:
+        parts.append(literal)
+        if field is not None:
+            parts.append(format(values[field], format_spec))
+    return "".join(parts)
+
+
 def format_issue(issue: GitHubIssue, template_data: Dict[str, Any]) -> str:
     """
     Format a GitHub issue using the appropriate template.
@@ -64,20 +100,32 @@ def format_issue(issue: GitHubIssue, template_data: Dict[str, Any]) -> str:
     Returns:
         Formatted issue body as markdown string
     """
-    template = ISSUE_TEMPLATES.get(issue.classification, ISSUE_TEMPLATES["feature"])
-
     # Ensure workflow is formatted correctly
     workflow_str = f"{issue.workflow} model_set {issue.model_set}"
     template_data["workflow"] = workflow_str
 
     # Fill in the template
     try:
-        formatted = template.format(**template_data)
-        return formatted
+        fields = tuple(template_data.items())
+        try:
+            return _render_issue(issue.classification, fields)
+        except TypeError:
+            # Unhashable template values can't be cached; render directly
+            return _render(_template_for(issue.classification), template_data)
     except KeyError as e:
         raise ValueError(f"Missing required template field: {e}")
 
 
+def _template_for(classification: str) -> _ParsedTemplate:
+    return _COMPILED_TEMPLATES.get(classification, _COMPILED_TEMPLATES["feature"])
+
+
+@functools.lru_cache(maxsize=256)
+def _render_issue(classification: str, fields: Tuple[Tuple[str, Any], ...]) -> str:
+    """Rendered issue body; repeat formats of the same issue data hit the cache."""
+    return _render(_template_for(classification), dict(fields))
+
+
 def validate_issue_body(body: str) -> bool:
     """
     Validate that an issue body contains required sections.
@@ -88,14 +136,7 @@ def validate_issue_body(body: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Required sections for any issue
-    required_sections = ["##", "Workflow"]
-
-    for section in required_sections:
-        if section not in body:
-            return False
-
-    return True
+    return all(section in body for section in _REQUIRED_SECTIONS)
 
 
 def format_requirements_list(requirements: list) -> str:
@@ -109,9 +150,8 @@ def format_requirements_list(requirements: list) -> str:
         Formatted markdown string
     """
     if not requirements:
-        return "- To be determined"
-
-    return "\n".join([f"- {req}" for req in requirements])
+        return _DEFAULT_REQUIREMENTS
+    return "\n".join(f"- {r}" for r in requirements)
 
 
 def format_technical_approach(approach: str) -> str:
@@ -124,8 +164,8 @@ def format_technical_approach(approach: str) -> str:
     Returns:
         Formatted markdown string
     """
-    if not approach or approach.strip() == "":
-        return "To be determined during implementation planning."
+    if not approach or not approach.strip():
+        return _DEFAULT_TECHNICAL_APPROACH
 
     return approach
 
@@ -195,7 +235,7 @@ def create_feature_issue_body(
         "workflow": format_workflow_section(workflow, model_set)
     }
 
-    return ISSUE_TEMPLATES["feature"].format(**template_data)
+    return _render(_COMPILED_TEMPLATES["feature"], template_data)
 
 
 def create_bug_issue_body(
@@ -223,13 +263,13 @@ def create_bug_issue_body(
     template_data = {
         "title": "Bug Report",
         "description": description,
-        "steps": steps if steps else "To be documented",
-        "expected": expected if expected else "To be documented",
-        "actual": actual if actual else "To be documented",
+        "steps": steps or _TO_BE_DOCUMENTED,
+        "expected": expected or _TO_BE_DOCUMENTED,
+        "actual": actual or _TO_BE_DOCUMENTED,
         "workflow": format_workflow_section(workflow, model_set)
     }
 
-    return ISSUE_TEMPLATES["bug"].format(**template_data)
+    return _render(_COMPILED_TEMPLATES["bug"], template_data)
 
 
 def create_chore_issue_body(
@@ -257,4 +297,4 @@ def create_chore_issue_body(
         "workflow": format_workflow_section(workflow, model_set)
     }
 
-    return ISSUE_TEMPLATES["chore"].format(**template_data)
+    return _render(_COMPILED_TEMPLATES["chore"], template_data)
@@ -0,0 +1,195 @@
+"""
+Response cache for the natural language -> GitHub issue pipeline.
+
+process_request spends seconds in Claude calls, and users often resubmit the
+same request or a light rephrasing of it. SemanticCache stores generated
+GitHubIssue objects in SQLite, keyed by project context, and serves them back
+on:
+
+1. An exact match of the normalized input (always available).
+2. A cosine-similarity match of input embeddings above a threshold (only when
+   an embedder is available: sentence-transformers, or one passed in).
+
+Entries expire after a TTL (24h by default).
+"""
+
+import hashlib
+import sqlite3
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+from core.data_models import GitHubIssue, ProjectContext
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+Embedder = Callable[[str], Sequence[float]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nl_cache (
+    key TEXT PRIMARY KEY,
+    context_key TEXT NOT NULL,
+    nl_input TEXT NOT NULL,
+    embedding BLOB,
+    issue_json TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nl_cache_context ON nl_cache (context_key, expires_at);
+"""
+
+
+@lru_cache(maxsize=256)
+def _exact_key(context_key: str, nl_input: str) -> str:
+    """Hash of context + whitespace/case-normalized input."""
+    normalized = " ".join(nl_input.lower().split())
+    return hashlib.sha256(f"{context_key}\0{normalized}".encode()).hexdigest()
+
+
+def _context_key(project_context: ProjectContext) -> str:
+    """
+    Serialized project context.
+
+    The generated issue depends on more than the path (complexity picks the
+    workflow, framework adds a label), so the whole context is part of the key.
+    """
+    return project_context.model_dump_json()
+
+
+def load_default_embedder() -> Optional[Embedder]:
+    """
+    Build an embedder from sentence-transformers if it is installed.
+
+    Returns:
+        Callable mapping text to a vector, or None when the optional
+        dependency is missing (the cache then serves exact matches only)
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+
+    model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+    return lambda text: model.encode(text, normalize_embeddings=True)
+
+
+class SemanticCache:
+    """
+    SQLite-backed GitHubIssue cache with exact and similarity lookups.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db/nl_cache.db",
+        embedder: Optional[Embedder] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite database file (":memory:" for a process-local cache)
+            embedder: Text -> vector callable for similarity matching; None
+                disables similarity lookups
+            ttl_seconds: How long stored issues remain valid
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.embedder = embedder
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def get(self, nl_input: str, project_context: ProjectContext) -> Optional[GitHubIssue]:
+        """
+        Look up a cached issue for this request.
+
+        Args:
+            nl_input: Natural language request
+            project_context: Context the issue would be generated for
+
+        Returns:
+            Cached GitHubIssue, or None on a miss
+        """
+        context_key = _context_key(project_context)
+        now = time.time()
+
+        row = self.conn.execute(
+            "SELECT issue_json FROM nl_cache WHERE key = ? AND expires_at > ?",
+            (_exact_key(context_key, nl_input), now),
+        ).fetchone()
+        if row:
+            return GitHubIssue.model_validate_json(row[0])
+
+        if self.embedder is None:
+            return None
+
+        rows = self.conn.execute(
+            "SELECT embedding, issue_json FROM nl_cache "
+            "WHERE context_key = ? AND expires_at > ? AND embedding IS NOT NULL",
+            (context_key, now),
+        ).fetchall()
+        if not rows:
+            return None
+
+        # numpy is only needed once an embedder is configured
+        import numpy as np
+
+        # One matrix-vector product scores every candidate
+        matrix = np.vstack([np.frombuffer(blob, dtype=np.float32) for blob, _ in rows])
+        scores = matrix @ self._embed(nl_input)
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        return GitHubIssue.model_validate_json(rows[best][1])
+
+    def put(self, nl_input: str, project_context: ProjectContext, issue: GitHubIssue) -> None:
+        """
+        Store a generated issue for later lookups.
+
+        Args:
+            nl_input: Natural language request the issue was generated from
+            project_context: Context the issue was generated for
+            issue: Generated GitHubIssue
+        """
+        context_key = _context_key(project_context)
+        embedding = self._embed(nl_input).tobytes() if self.embedder is not None else None
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO nl_cache "
+                "(key, context_key, nl_input, embedding, issue_json, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    _exact_key(context_key, nl_input),
+                    context_key,
+                    nl_input,
+                    embedding,
+                    issue.model_dump_json(),
+                    time.time() + self.ttl_seconds,
+                ),
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM nl_cache WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def _embed(self, text: str) -> "np.ndarray":
+        """Unit-length float32 embedding, so dot product == cosine similarity."""
+        import numpy as np
+
+        vector = np.asarray(self.embedder(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
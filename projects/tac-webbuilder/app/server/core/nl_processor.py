@@ -1,9 +1,335 @@
+import asyncio
+import copy
 import os
 import json
-from typing import Tuple, List
-from anthropic import Anthropic
+import logging
+import re
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Tuple, List, Optional
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 from core.data_models import GitHubIssue, ProjectContext
 
+if TYPE_CHECKING:
+    from core.nl_cache import SemanticCache
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def _dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+logger = logging.getLogger(__name__)
+
+
+def _cached_system(text: str) -> List[dict]:
+    """
+    System prompt block marked for Anthropic prompt caching.
+
+    The instructions are identical on every call and only the user message
+    varies, so they form a cacheable prefix. Prefixes below the model's
+    minimum cacheable length are simply processed uncached.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+_INTENT_SYSTEM = _cached_system("""Analyze the natural language request in the user message and extract the intent.
+
+Provide your analysis as a JSON object with the following fields:
+- intent_type: Must be one of "feature", "bug", or "chore"
+- summary: A brief one-sentence summary of what the user wants
+- technical_area: The primary technical area (e.g., "UI", "authentication", "database", "API", "testing")
+
+Guidelines:
+- "feature": New functionality or enhancement to existing functionality
+- "bug": Something that's broken or not working as expected
+- "chore": Maintenance tasks, refactoring, documentation, setup
+
+Return ONLY the JSON object, no explanations.""")
+
+_REQUIREMENTS_SYSTEM = _cached_system("""Based on the request and its intent analysis in the user message, extract specific technical requirements.
+
+Extract a list of specific, actionable technical requirements. Each requirement should be:
+- Concrete and testable
+- Focused on implementation details
+- Written in clear, technical language
+
+Return your answer as a JSON array of strings. Example format:
+["Implement user authentication with JWT tokens", "Create login form with email/password fields", "Add password hashing with bcrypt"]
+
+Return ONLY the JSON array, no explanations.""")
+
+_ANALYSIS_SYSTEM = _cached_system("""Analyze the natural language request in the user message, then extract specific technical requirements from it.
+
+Provide your answer as a JSON object with the following fields:
+- intent: An object with these fields:
+  - intent_type: Must be one of "feature", "bug", or "chore"
+  - summary: A brief one-sentence summary of what the user wants
+  - technical_area: The primary technical area (e.g., "UI", "authentication", "database", "API", "testing")
+- requirements: A JSON array of strings, each a specific, actionable technical requirement
+
+Guidelines for intent_type:
+- "feature": New functionality or enhancement to existing functionality
+- "bug": Something that's broken or not working as expected
+- "chore": Maintenance tasks, refactoring, documentation, setup
+
+Each requirement should be:
+- Concrete and testable
+- Focused on implementation details
+- Written in clear, technical language
+
+Example format:
+{"intent": {"intent_type": "feature", "summary": "Add user login", "technical_area": "authentication"}, "requirements": ["Implement user authentication with JWT tokens", "Create login form with email/password fields"]}
+
+Return ONLY the JSON object, no explanations.""")
+
+
+# Intent classification is a short, fixed-shape JSON reply (well under 120
+# tokens), so it goes to the fast model with a tight output budget
+INTENT_MODEL = "claude-3-5-haiku-20241022"
+INTENT_MAX_TOKENS = 200
+
+
+class _LRUMemo:
+    """
+    Bounded, short-lived in-process memo of Claude analyses.
+
+    Retried and templated requests repeat the same input; a hit skips the API
+    call. Replies are sampled, so entries expire after ``ttl`` seconds rather
+    than pinning one answer for the life of the process. Only successful
+    results are stored, so transient failures are not sticky. Values are
+    copied in and out, so callers may mutate what they get.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Long enough to absorb retries and bursts of the same request
+ANALYSIS_MEMO_TTL_SECONDS = 300.0
+
+_analysis_memo = _LRUMemo(maxsize=512, ttl=ANALYSIS_MEMO_TTL_SECONDS)
+
+
+def _normalize_input(nl_input: str) -> str:
+    """Whitespace/case-normalized request, as SemanticCache normalizes it."""
+    return " ".join(nl_input.lower().split())
+
+
+def _api_key() -> str:
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+    return api_key
+
+
+# httpx drops idle connections after 5s by default, so requests a few seconds
+# apart would each pay a new TCP + TLS handshake; keep them open longer
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=120.0,
+)
+
+
+# Shared clients, so calls reuse a connection pool and TLS sessions instead
+# of building both per request. Connections use HTTP/2 when h2 is installed.
+# Only the current (class, key) client is kept; a rotated key's client is
+# closed rather than left holding its pool.
+_sync_clients: Dict[Tuple[type, str], Anthropic] = {}
+
+# Per-event-loop state: async connections and semaphores belong to the loop
+# that created them. Keys are weak so a dropped loop frees its entries, and
+# closed loops are swept on access since open transports can keep them alive.
+_loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_loop_request_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _drop_closed_loops(registry: weakref.WeakKeyDictionary) -> None:
+    """Remove entries for event loops that have been closed."""
+    for loop in [loop for loop in registry if loop.is_closed()]:
+        del registry[loop]
+
+
+def _get_client() -> Anthropic:
+    """Shared synchronous client for ANTHROPIC_API_KEY."""
+    key = (Anthropic, _api_key())
+    client = _sync_clients.get(key)
+    if client is None:
+        stale = list(_sync_clients.values())
+        _sync_clients.clear()
+        client = _sync_clients[key] = Anthropic(
+            api_key=key[1],
+            http_client=DefaultHttpxClient(http2=_HTTP2, limits=_CONNECTION_LIMITS),
+        )
+        for old in stale:
+            old.close()
+    return client
+
+
+async def _get_async_client() -> AsyncAnthropic:
+    """Shared async client for ANTHROPIC_API_KEY on the running event loop."""
+    key = (AsyncAnthropic, _api_key())
+    _drop_closed_loops(_loop_clients)
+    clients = _loop_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+    if client is None:
+        # Swap before awaiting the closes so concurrent callers see the new client
+        stale = list(clients.values())
+        clients.clear()
+        client = clients[key] = AsyncAnthropic(
+            api_key=key[1],
+            http_client=DefaultAsyncHttpxClient(http2=_HTTP2, limits=_CONNECTION_LIMITS),
+        )
+        for old in stale:
+            await old.close()
+    return client
+
+
+# Cap on in-flight async Claude calls per event loop, so a burst of requests
+# queues here instead of tripping the account's rate limit and retrying
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("ANTHROPIC_MAX_CONCURRENCY", "8"))
+
+
+def _request_slots() -> asyncio.Semaphore:
+    """Concurrency semaphore for Claude calls made on the running event loop."""
+    _drop_closed_loops(_loop_request_slots)
+    loop = asyncio.get_running_loop()
+    slots = _loop_request_slots.get(loop)
+    if slots is None:
+        slots = _loop_request_slots[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return slots
+
+
+async def _create_message(client: AsyncAnthropic, **params):
+    """Await client.messages.create once a concurrency slot is free."""
+    async with _request_slots():
+        response = await client.messages.create(**params)
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        logger.debug(
+            f"Claude {params.get('model')} call: {usage.input_tokens} input tokens, "
+            f"{usage.output_tokens} output tokens"
+        )
+    return response
+
+
+def _parse_json_response(result_text: str):
+    """Parse a JSON reply from Claude, tolerating a markdown code fence around it."""
+    # Clean up markdown code blocks if present
+    return _loads(
+        result_text.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+
+
+# Requests whose first line is tagged like a conventional commit
+# ("fix: ...", "feat(ui): ...") state their type outright, so they need no
+# model call to classify
+_TAGGED_REQUEST_RE = re.compile(
+    r'\s*(?P<tag>[a-z]+)(?:\([^)]*\))?!?:[ \t]*(?P<summary>\S.*?)\s*',
+    re.IGNORECASE
+)
+# Only tags that name one issue type; "test:", "docs:" or "perf:" can
+# describe feature work as easily as a chore, so those go to Claude
+_INTENT_TYPE_BY_TAG = {
+    "fix": "bug", "bug": "bug", "bugfix": "bug", "hotfix": "bug",
+    "feat": "feature", "feature": "feature",
+    "chore": "chore", "refactor": "chore",
+}
+
+
+def _match_tag(nl_input: str) -> Optional[Tuple[str, str]]:
+    """(intent_type, summary) from a tagged first line, or None if untagged."""
+    first_line = nl_input.strip().partition("\n")[0]
+    match = _TAGGED_REQUEST_RE.fullmatch(first_line)
+    if not match:
+        return None
+    intent_type = _INTENT_TYPE_BY_TAG.get(match.group("tag").lower())
+    if intent_type is None:
+        return None
+    return intent_type, match.group("summary")
+
+
+def _heuristic_intent(nl_input: str) -> Optional[dict]:
+    """
+    Intent for a request that names its own type, or None if Claude is needed.
+
+    Args:
+        nl_input: Natural language request
+
+    Returns:
+        Intent dictionary in analyze_intent's shape (summary taken from the
+        tagged first line), or None
+    """
+    tag = _match_tag(nl_input)
+    if tag is None:
+        return None
+    intent_type, summary = tag
+    return {
+        "intent_type": intent_type,
+        "summary": summary,
+        "technical_area": "general",
+    }
+
+
+def _apply_tag(intent: dict, nl_input: str) -> dict:
+    """
+    Claude's intent with intent_type taken from the request's own tag.
+
+    The tag states the type outright, so it wins over the model's guess;
+    summary and technical_area are kept from Claude.
+    """
+    tag = _match_tag(nl_input)
+    if tag is None or intent.get("intent_type") == tag[0]:
+        return intent
+    return {**intent, "intent_type": tag[0]}
+
 
 async def analyze_intent(nl_input: str) -> dict:
     """
@@ -12,6 +338,8 @@ async def analyze_intent(nl_input: str) -> dict:
     This function sends the natural language input to Claude API with a structured
     prompt that instructs the model to classify the request and extract key information.
     The response is parsed as JSON containing intent classification and metadata.
+    Requests tagged with their type ("fix: ...", "feat: ...") are classified
+    locally without an API call.
 
     Args:
         nl_input: Natural language description of the desired feature/bug/chore
@@ -26,49 +354,34 @@ async def analyze_intent(nl_input: str) -> dict:
         ValueError: If ANTHROPIC_API_KEY environment variable is not set
         Exception: If Claude API call fails or response cannot be parsed
     """
-    try:
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-
-        client = Anthropic(api_key=api_key)
-
-        prompt = f"""Analyze this natural language request and extract the intent:
+    intent = _heuristic_intent(nl_input)
+    if intent is not None:
+        return intent
 
-Request: "{nl_input}"
+    key = ("intent", _normalize_input(nl_input))
+    cached = _analysis_memo.get(key)
+    if cached is not None:
+        return cached
 
-Provide your analysis as a JSON object with the following fields:
-- intent_type: Must be one of "feature", "bug", or "chore"
-- summary: A brief one-sentence summary of what the user wants
-- technical_area: The primary technical area (e.g., "UI", "authentication", "database", "API", "testing")
-
-Guidelines:
-- "feature": New functionality or enhancement to existing functionality
-- "bug": Something that's broken or not working as expected
-- "chore": Maintenance tasks, refactoring, documentation, setup
+    try:
+        client = await _get_async_client()
 
-Return ONLY the JSON object, no explanations."""
+        prompt = f'Request: "{nl_input}"'
 
-        response = client.messages.create(
-            model="claude-sonnet-4-0",
-            max_tokens=300,
+        response = await _create_message(
+            client,
+            model=INTENT_MODEL,
+            max_tokens=INTENT_MAX_TOKENS,
             temperature=0.1,
+            system=_INTENT_SYSTEM,
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
 
-        result_text = response.content[0].text.strip()
-
-        # Clean up markdown code blocks if present
-        if result_text.startswith("```json"):
-            result_text = result_text[7:]
-        if result_text.startswith("```"):
-            result_text = result_text[3:]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3]
-
-        return json.loads(result_text.strip())
+        intent = _parse_json_response(response.content[0].text)
+        _analysis_memo.put(key, intent)
+        return intent
 
     except Exception as e:
         raise Exception(f"Error analyzing intent with Anthropic: {str(e)}")
@@ -93,51 +406,97 @@ def extract_requirements(nl_input: str, intent: dict) -> List[str]:
         ValueError: If ANTHROPIC_API_KEY environment variable is not set
         Exception: If Claude API call fails or response cannot be parsed
     """
+    key = ("requirements", _normalize_input(nl_input), _dumps_sorted(intent))
+    cached = _analysis_memo.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        client = _get_client()
 
-        client = Anthropic(api_key=api_key)
+        response = client.messages.create(**_requirements_params(nl_input, intent))
 
-        prompt = f"""Based on this request and its intent analysis, extract specific technical requirements:
+        requirements = _parse_json_response(response.content[0].text)
+        _analysis_memo.put(key, requirements)
+        return requirements
 
-Request: "{nl_input}"
-Intent: {json.dumps(intent, indent=2)}
+    except Exception as e:
+        raise Exception(f"Error extracting requirements with Anthropic: {str(e)}")
 
-Extract a list of specific, actionable technical requirements. Each requirement should be:
-- Concrete and testable
-- Focused on implementation details
-- Written in clear, technical language
 
-Return your answer as a JSON array of strings. Example format:
-["Implement user authentication with JWT tokens", "Create login form with email/password fields", "Add password hashing with bcrypt"]
+def _requirements_params(nl_input: str, intent: dict) -> dict:
+    """messages.create parameters for the requirements-only prompt."""
+    prompt = f"""Request: "{nl_input}"
+Intent: {_dumps_indented(intent)}"""
+    return {
+        "model": "claude-sonnet-4-0",
+        "max_tokens": 500,
+        "temperature": 0.2,
+        "system": _REQUIREMENTS_SYSTEM,
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+    }
+
+
+def _analysis_params(nl_input: str) -> dict:
+    """messages.create parameters for the combined intent + requirements prompt."""
+    return {
+        "model": "claude-sonnet-4-0",
+        "max_tokens": 800,
+        "temperature": 0.1,
+        "system": _ANALYSIS_SYSTEM,
+        "messages": [
+            {"role": "user", "content": f'Request: "{nl_input}"'}
+        ],
+    }
+
+
+def _parse_analysis(result_text: str) -> Tuple[dict, List[str]]:
+    """Split a combined analysis reply into (intent, requirements)."""
+    result = _parse_json_response(result_text)
+    return result["intent"], result.get("requirements", [])
+
+
+async def analyze_and_extract(nl_input: str) -> Tuple[dict, List[str]]:
+    """
+    Analyze intent and extract requirements in a single Claude call.
 
-Return ONLY the JSON array, no explanations."""
+    Returns the same data as analyze_intent followed by extract_requirements,
+    but the request is sent once and answered in one round trip, so the input
+    is tokenized once and latency is roughly halved. process_request uses
+    this; the separate functions remain for callers that only need one part.
+    For requests tagged with their type ("fix: ...", "feat: ...") the tag
+    decides intent_type, as in analyze_intent.
 
-        response = client.messages.create(
-            model="claude-sonnet-4-0",
-            max_tokens=500,
-            temperature=0.2,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+    Args:
+        nl_input: Natural language description of the desired feature/bug/chore
+
+    Returns:
+        Tuple of (intent, requirements):
+        - intent: Dictionary with intent_type, summary, and technical_area
+        - requirements: List of technical requirements (strings)
 
-        result_text = response.content[0].text.strip()
+    Raises:
+        ValueError: If ANTHROPIC_API_KEY environment variable is not set
+        Exception: If Claude API call fails or response cannot be parsed
+    """
+    key = ("analysis", _normalize_input(nl_input))
+    cached = _analysis_memo.get(key)
+    if cached is not None:
+        return cached
 
-        # Clean up markdown code blocks if present
-        if result_text.startswith("```json"):
-            result_text = result_text[7:]
-        if result_text.startswith("```"):
-            result_text = result_text[3:]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3]
+    try:
+        client = await _get_async_client()
 
-        return json.loads(result_text.strip())
+        response = await _create_message(client, **_analysis_params(nl_input))
+        intent, requirements = _parse_analysis(response.content[0].text)
+        analysis = _apply_tag(intent, nl_input), requirements
+        _analysis_memo.put(key, analysis)
+        return analysis
 
     except Exception as e:
-        raise Exception(f"Error extracting requirements with Anthropic: {str(e)}")
+        raise Exception(f"Error analyzing request with Anthropic: {str(e)}")
 
 
 def classify_issue_type(intent: dict) -> str:
@@ -153,6 +512,20 @@ def classify_issue_type(intent: dict) -> str:
     return intent.get("intent_type", "feature")
 
 
+# (workflow, model_set) recommendations, shared rather than rebuilt per call
+_LIGHT_WORKFLOW = ("adw_sdlc_iso", "base")
+_TESTED_WORKFLOW = ("adw_plan_build_test_iso", "base")
+_WORKFLOW_BY_ISSUE_TYPE = {
+    "bug": _TESTED_WORKFLOW,
+    "chore": _LIGHT_WORKFLOW,
+}
+_FEATURE_WORKFLOW_BY_COMPLEXITY = {
+    "high": ("adw_plan_build_test_iso", "heavy"),
+    "medium": _TESTED_WORKFLOW,
+    "low": _LIGHT_WORKFLOW,
+}
+
+
 def suggest_adw_workflow(issue_type: str, complexity: str) -> Tuple[str, str]:
     """
     Recommend ADW workflow and model set based on issue type and complexity.
@@ -174,21 +547,78 @@ def suggest_adw_workflow(issue_type: str, complexity: str) -> Tuple[str, str]:
         - workflow: ADW workflow identifier (e.g., "adw_sdlc_iso")
         - model_set: "base" or "heavy"
     """
-    # Workflow recommendation logic based on complexity and type
-    if issue_type == "bug":
-        return ("adw_plan_build_test_iso", "base")
-    elif issue_type == "chore":
-        return ("adw_sdlc_iso", "base")
-    else:  # feature
-        if complexity == "high":
-            return ("adw_plan_build_test_iso", "heavy")
-        elif complexity == "medium":
-            return ("adw_plan_build_test_iso", "base")
-        else:  # low
-            return ("adw_sdlc_iso", "base")
-
-
-async def process_request(nl_input: str, project_context: ProjectContext) -> GitHubIssue:
+    # Bugs and chores ignore complexity; anything else is treated as a feature
+    workflow = _WORKFLOW_BY_ISSUE_TYPE.get(issue_type)
+    if workflow is not None:
+        return workflow
+    return _FEATURE_WORKFLOW_BY_COMPLEXITY.get(complexity, _LIGHT_WORKFLOW)
+
+
+def _build_issue(
+    nl_input: str,
+    project_context: ProjectContext,
+    intent: dict,
+    requirements: List[str]
+) -> GitHubIssue:
+    """
+    Assemble a GitHubIssue from an analyzed request (pipeline steps 3-8).
+
+    Args:
+        nl_input: Natural language request the analysis came from
+        project_context: Project context information
+        intent: Intent analysis dictionary
+        requirements: Extracted technical requirements
+
+    Returns:
+        Complete GitHubIssue
+    """
+    # Step 3: Classify issue type
+    classification = classify_issue_type(intent)
+
+    # Step 4: Suggest workflow based on complexity
+    workflow, model_set = suggest_adw_workflow(classification, project_context.complexity)
+
+    # Step 5: Generate title
+    title = intent.get("summary", nl_input[:100])
+
+    # Step 6: Generate issue body (will be formatted by issue_formatter)
+    # For now, create a basic structure
+    requirement_lines = "".join([f"- {req}\n" for req in requirements])
+    body = f"""## Description
+{intent.get('summary', nl_input)}
+
+## Requirements
+{requirement_lines}
+## Technical Area
+{intent.get('technical_area', 'General')}
+
+## Workflow
+{workflow} model_set {model_set}"""
+
+    # Step 7: Generate labels
+    labels = [classification, intent.get('technical_area', 'general').lower()]
+    if project_context.framework:
+        labels.append(project_context.framework)
+    # The technical area can coincide with the framework (e.g. "react");
+    # drop repeats while keeping order
+    labels = list(dict.fromkeys(labels))
+
+    # Step 8: Create GitHubIssue object
+    return GitHubIssue(
+        title=title,
+        body=body,
+        labels=labels,
+        classification=classification,
+        workflow=workflow,
+        model_set=model_set
+    )
+
+
+async def process_request(
+    nl_input: str,
+    project_context: ProjectContext,
+    cache: Optional["SemanticCache"] = None
+) -> GitHubIssue:
     """
     Main orchestration function that converts natural language to GitHub issue.
 
@@ -198,7 +628,7 @@ async def process_request(nl_input: str, project_context: ProjectContext) -> Git
 
     Processing Pipeline:
     1. Analyze intent using Claude API
-    2. Extract technical requirements from the input
+    2. Extract technical requirements from the input (same call as step 1)
     3. Classify issue type (feature/bug/chore)
     4. Suggest appropriate ADW workflow based on type and complexity
     5. Generate issue title from summary
@@ -209,6 +639,8 @@ async def process_request(nl_input: str, project_context: ProjectContext) -> Git
     Args:
         nl_input: Natural language description of the desired feature/bug/chore
         project_context: Project context information from detect_project_context()
+        cache: Optional SemanticCache; a hit skips every Claude call, and a
+            freshly generated issue is stored in it
 
     Returns:
         GitHubIssue object with all fields populated:
@@ -223,59 +655,129 @@ async def process_request(nl_input: str, project_context: ProjectContext) -> Git
         Exception: If any step of the pipeline fails (intent analysis, requirement
                   extraction, or issue generation)
     """
+    if cache is not None:
+        cached = cache.get(nl_input, project_context)
+        if cached is not None:
+            return cached
+
     try:
-        # Step 1: Analyze intent
-        intent = await analyze_intent(nl_input)
-
-        # Step 2: Extract requirements
-        requirements = extract_requirements(nl_input, intent)
-
-        # Step 3: Classify issue type
-        classification = classify_issue_type(intent)
-
-        # Step 4: Suggest workflow based on complexity
-        workflow, model_set = suggest_adw_workflow(classification, project_context.complexity)
-
-        # Step 5: Generate title
-        title = intent.get("summary", nl_input[:100])
-
-        # Step 6: Generate issue body (will be formatted by issue_formatter)
-        # For now, create a basic structure
-        body_parts = [
-            "## Description",
-            f"{intent.get('summary', nl_input)}",
-            "",
-            "## Requirements",
-        ]
-
-        for req in requirements:
-            body_parts.append(f"- {req}")
-
-        body_parts.extend([
-            "",
-            "## Technical Area",
-            f"{intent.get('technical_area', 'General')}",
-            "",
-            "## Workflow",
-            f"{workflow} model_set {model_set}"
-        ])
+        # Steps 1-2: Analyze intent and extract requirements in one Claude call
+        intent, requirements = await analyze_and_extract(nl_input)
 
-        body = "\n".join(body_parts)
-
-        # Step 7: Generate labels
-        labels = [classification, intent.get('technical_area', 'general').lower()]
-        if project_context.framework:
-            labels.append(project_context.framework)
-
-        # Step 8: Create GitHubIssue object
-        return GitHubIssue(
-            title=title,
-            body=body,
-            labels=labels,
-            classification=classification,
-            workflow=workflow,
-            model_set=model_set
-        )
+        # Steps 3-8: Classify, pick a workflow, and assemble the issue
+        issue = _build_issue(nl_input, project_context, intent, requirements)
+
+        if cache is not None:
+            cache.put(nl_input, project_context, issue)
+
+        return issue
 
     except Exception as e:
         raise Exception(f"Error processing NL request: {str(e)}")
+
+
+# Batches usually finish within minutes, so there is no point polling faster
+BATCH_POLL_INTERVAL_SECONDS = 30.0
+# A batch still running after this long is cancelled rather than awaited
+# until Anthropic's own 24 hour expiry
+BATCH_TIMEOUT_SECONDS = 3600.0
+
+
+async def process_requests_batch(
+    nl_inputs: List[str],
+    project_context: ProjectContext,
+    cache: Optional["SemanticCache"] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+    timeout: float = BATCH_TIMEOUT_SECONDS
+) -> List[Optional[GitHubIssue]]:
+    """
+    Convert many natural language requests to GitHub issues in one Message Batch.
+
+    Each request is sent as the same combined prompt process_request uses,
+    but through Anthropic's Message Batches API: one submission for the whole
+    workload at half the per-token price, in exchange for asynchronous
+    completion (usually minutes, at most 24 hours). Use it for bulk issue
+    generation; interactive callers should keep using process_request.
+    As in process_request, a request's type tag ("fix: ...") decides its
+    intent_type.
+
+    Args:
+        nl_inputs: Natural language requests
+        project_context: Project context shared by every request
+        cache: Optional SemanticCache; hits are not submitted, and generated
+            issues are stored in it
+        poll_interval: Seconds between batch status checks
+        timeout: Seconds to wait for the batch before cancelling it
+
+    Returns:
+        GitHubIssue per input, in input order; None where that request errored,
+        expired, or returned an unparseable reply (each such request is logged)
+
+    Raises:
+        TimeoutError: If the batch has not ended within timeout; it is cancelled
+        Exception: If the batch cannot be submitted, polled, or read
+            (including a missing ANTHROPIC_API_KEY)
+    """
+    issues: List[Optional[GitHubIssue]] = [None] * len(nl_inputs)
+
+    # custom_id (input index) -> input, for requests the cache can't answer
+    pending = {}
+    for index, nl_input in enumerate(nl_inputs):
+        cached = cache.get(nl_input, project_context) if cache is not None else None
+        if cached is not None:
+            issues[index] = cached
+        else:
+            pending[str(index)] = nl_input
+
+    if not pending:
+        return issues
+
+    try:
+        client = await _get_async_client()
+
+        batch = await client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": _analysis_params(nl_input)}
+            for custom_id, nl_input in pending.items()
+        ])
+        deadline = asyncio.get_running_loop().time() + timeout
+        while batch.processing_status != "ended":
+            if asyncio.get_running_loop().time() >= deadline:
+                await client.messages.batches.cancel(batch.id)
+                raise TimeoutError(
+                    f"NL batch {batch.id} did not finish within {timeout:g}s and was cancelled"
+                )
+            await asyncio.sleep(poll_interval)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        results = [entry async for entry in await client.messages.batches.results(batch.id)]
+
+    except TimeoutError:
+        raise
+    except Exception as e:
+        raise Exception(f"Error processing NL batch with Anthropic: {str(e)}")
+
+    for entry in results:
+        nl_input = pending[entry.custom_id]
+        if entry.result.type != "succeeded":
+            reason = entry.result.type
+            if reason == "errored":
+                reason = f"errored: {entry.result.error}"
+            logger.warning(f"NL batch request {entry.custom_id} {reason} ({nl_input[:80]!r})")
+            continue
+
+        try:
+            intent, requirements = _parse_analysis(entry.result.message.content[0].text)
+            intent = _apply_tag(intent, nl_input)
+            issue = _build_issue(nl_input, project_context, intent, requirements)
+        except Exception as e:
+            logger.warning(
+                f"NL batch request {entry.custom_id} returned an unusable reply: {e} "
+                f"({nl_input[:80]!r})"
+            )
+            continue
+
+        if cache is not None:
+            cache.put(nl_input, project_context, issue)
+        issues[int(entry.custom_id)] = issue
+
+    return issues
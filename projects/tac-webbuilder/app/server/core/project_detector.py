@@ -4,11 +4,41 @@ Analyzes project structure to determine framework, tools, and complexity.
 """
 
 import json
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import AbstractSet, Optional, List, Tuple
 from core.data_models import ProjectContext
 
 
+# Detected contexts by resolved project path. An entry is reused while the
+# root directory and the manifests whose contents feed detection keep their
+# mtimes, for at most CONTEXT_CACHE_TTL_SECONDS (deeper edits, like files
+# added under src/, don't touch those mtimes). At most
+# CONTEXT_CACHE_MAX_ENTRIES paths are kept, least recently used evicted first.
+CONTEXT_CACHE_TTL_SECONDS = 30.0
+CONTEXT_CACHE_MAX_ENTRIES = 128
+_CONTENT_MARKERS = ("package.json", "pyproject.toml", "requirements.txt")
+_context_cache: "OrderedDict[str, Tuple[Tuple[Optional[int], ...], float, ProjectContext]]" = OrderedDict()
+
+
+def _context_fingerprint(project_path: Path) -> Tuple[Optional[int], ...]:
+    """mtimes (ns) of the project root and its manifests; None where missing."""
+    mtimes = []
+    for path in (project_path, *(project_path / name for name in _CONTENT_MARKERS)):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def clear_context_cache() -> None:
+    """Forget every detected project context, forcing fresh detection."""
+    _context_cache.clear()
+
+
 def detect_project_context(path: str) -> ProjectContext:
     """
     Detect project context by analyzing directory structure and files.
@@ -18,6 +48,9 @@ def detect_project_context(path: str) -> ProjectContext:
     stack, complexity, and characteristics. The information is used to make
     intelligent workflow recommendations.
 
+    Results are cached per project for a short TTL and reused while the
+    project root and its manifests are unchanged.
+
     Detection Strategy:
     1. Validate directory exists
     2. Check if project is new (empty directory)
@@ -51,30 +84,43 @@ def detect_project_context(path: str) -> ProjectContext:
     if not project_path.exists():
         raise ValueError(f"Project path does not exist: {path}")
 
+    cache_key = str(project_path.resolve())
+    fingerprint = _context_fingerprint(project_path)
+    cached = _context_cache.get(cache_key)
+    if cached is not None and cached[0] == fingerprint and cached[1] > time.time():
+        _context_cache.move_to_end(cache_key)
+        return cached[2].model_copy(update={"path": str(project_path)}, deep=True)
+
+    # Read the top level once; every detector below probes these names
+    root_names = _scan_root(project_path)
+
     # Check if directory is empty (new project)
-    is_new_project = is_directory_empty(project_path)
+    is_new_project = is_directory_empty(project_path, root_names)
+
+    # Parse package.json once for both framework and backend detection
+    package_deps = _load_package_deps(project_path, root_names)
 
     # Detect framework
-    framework = detect_framework(project_path)
+    framework = detect_framework(project_path, root_names, package_deps)
 
     # Detect backend
-    backend = detect_backend(project_path)
+    backend = detect_backend(project_path, root_names, package_deps)
 
     # Detect build tools
-    build_tools = detect_build_tools(project_path)
+    build_tools = detect_build_tools(project_path, root_names)
 
     # Detect package manager
-    package_manager = detect_package_manager(project_path)
+    package_manager = detect_package_manager(project_path, root_names)
 
     # Check git status
-    has_git = check_git_initialized(project_path)
+    has_git = check_git_initialized(project_path, root_names)
 
     # Calculate complexity
     complexity = calculate_complexity_from_structure(
-        project_path, framework, backend, build_tools
+        project_path, framework, backend, build_tools, root_names
     )
 
-    return ProjectContext(
+    context = ProjectContext(
         path=str(project_path),
         is_new_project=is_new_project,
         framework=framework,
@@ -84,14 +130,44 @@ def detect_project_context(path: str) -> ProjectContext:
         package_manager=package_manager,
         has_git=has_git
     )
+    _context_cache[cache_key] = (
+        fingerprint,
+        time.time() + CONTEXT_CACHE_TTL_SECONDS,
+        context.model_copy(deep=True),
+    )
+    _context_cache.move_to_end(cache_key)
+    if len(_context_cache) > CONTEXT_CACHE_MAX_ENTRIES:
+        _context_cache.popitem(last=False)
+    return context
+
+
+def _scan_root(path: Path) -> AbstractSet[str]:
+    """
+    Names of the entries directly inside a directory.
 
+    One directory read replaces the per-file exists() probes the detectors
+    would otherwise make, each of which is a separate stat call.
 
-def is_directory_empty(path: Path) -> bool:
+    Args:
+        path: Directory to scan
+
+    Returns:
+        Set of entry names, empty if path is missing or not a directory
+    """
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+def is_directory_empty(path: Path, root_names: Optional[AbstractSet[str]] = None) -> bool:
     """
     Check if directory is empty or only contains hidden files.
 
     Args:
         path: Path to check
+        root_names: Entry names from _scan_root(path), if already read
 
     Returns:
         True if empty, False otherwise
@@ -99,225 +175,236 @@ def is_directory_empty(path: Path) -> bool:
     if not path.is_dir():
         return False
 
-    # Get all items, including hidden files
-    items = list(path.iterdir())
+    if root_names is None:
+        root_names = _scan_root(path)
+
+    # Consider directory empty if it has no items or only hidden ones like .git
+    return all(name.startswith('.') for name in root_names)
+
+
+def _load_package_deps(path: Path, root_names: AbstractSet[str]) -> AbstractSet[str]:
+    """
+    Names of the dependencies and devDependencies declared in package.json.
 
-    # Consider directory empty if it has no items or only .git
-    non_hidden = [item for item in items if not item.name.startswith('.')]
+    Args:
+        path: Project path
+        root_names: Entry names from _scan_root(path)
 
-    return len(non_hidden) == 0
+    Returns:
+        Set of package names, empty if package.json is missing or unreadable
+    """
+    if "package.json" not in root_names:
+        return frozenset()
+    try:
+        with open(path / "package.json") as f:
+            data = json.load(f)
+            return frozenset({**data.get("dependencies", {}), **data.get("devDependencies", {})})
+    except (OSError, json.JSONDecodeError, KeyError):
+        return frozenset()
 
 
-def detect_framework(path: Path) -> Optional[str]:
+def detect_framework(
+    path: Path,
+    root_names: Optional[AbstractSet[str]] = None,
+    package_deps: Optional[AbstractSet[str]] = None
+) -> Optional[str]:
     """
     Detect frontend/application framework.
 
     Args:
         path: Project path
+        root_names: Entry names from _scan_root(path), if already read
+        package_deps: Dependency names from _load_package_deps, if already read
 
     Returns:
         Framework name or None
     """
+    if root_names is None:
+        root_names = _scan_root(path)
+    if package_deps is None:
+        package_deps = _load_package_deps(path, root_names)
+
     # Check for React with Vite
-    if (path / "vite.config.ts").exists() or (path / "vite.config.js").exists():
-        package_json = path / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-                    if "react" in deps:
-                        return "react-vite"
-                    elif "vue" in deps:
-                        return "vue-vite"
-            except (OSError, json.JSONDecodeError, KeyError):
-                pass
+    if "vite.config.ts" in root_names or "vite.config.js" in root_names:
+        if "react" in package_deps:
+            return "react-vite"
+        elif "vue" in package_deps:
+            return "vue-vite"
         return "vite"
 
     # Check for Next.js
-    package_json = path / "package.json"
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-                if "next" in deps:
-                    return "nextjs"
-                elif "react" in deps:
-                    return "react"
-                elif "vue" in deps:
-                    return "vue"
-                elif "@angular/core" in deps:
-                    return "angular"
-                elif "svelte" in deps:
-                    return "svelte"
-        except (OSError, json.JSONDecodeError, KeyError):
-            pass
+    if "next" in package_deps:
+        return "nextjs"
+    elif "react" in package_deps:
+        return "react"
+    elif "vue" in package_deps:
+        return "vue"
+    elif "@angular/core" in package_deps:
+        return "angular"
+    elif "svelte" in package_deps:
+        return "svelte"
 
     # Check for Python frameworks
-    if (path / "pyproject.toml").exists():
+    if "pyproject.toml" in root_names:
         return None  # Backend framework will be detected separately
 
     return None
 
 
-def detect_backend(path: Path) -> Optional[str]:
+# Python manifests and web frameworks, each in detection priority order
+_PYTHON_MANIFESTS = ("pyproject.toml", "requirements.txt")
+_PYTHON_BACKENDS = ((b"fastapi", "fastapi"), (b"django", "django"), (b"flask", "flask"))
+
+
+def _python_backend_in(manifest: Path) -> Optional[str]:
+    """
+    First of _PYTHON_BACKENDS mentioned anywhere in a manifest file.
+
+    The file is scanned as lowercased bytes, so nothing is split or decoded
+    and a manifest in an unexpected encoding can't raise. Plain substring
+    checks are used; a compiled alternation measured far slower on
+    manifest-sized files and would also pick the earliest mention rather
+    than the highest-priority framework.
+
+    Args:
+        manifest: Path to pyproject.toml or requirements.txt
+
+    Returns:
+        Backend name, or None if none is mentioned or the file is unreadable
+    """
+    try:
+        with open(manifest, "rb") as f:
+            content = f.read().lower()
+    except OSError:
+        return None
+    return next((backend for marker, backend in _PYTHON_BACKENDS if marker in content), None)
+
+
+def detect_backend(
+    path: Path,
+    root_names: Optional[AbstractSet[str]] = None,
+    package_deps: Optional[AbstractSet[str]] = None
+) -> Optional[str]:
     """
     Detect backend framework.
 
     Args:
         path: Project path
+        root_names: Entry names from _scan_root(path), if already read
+        package_deps: Dependency names from _load_package_deps, if already read
 
     Returns:
         Backend framework name or None
     """
-    # Check for FastAPI
-    pyproject_toml = path / "pyproject.toml"
-    if pyproject_toml.exists():
-        try:
-            with open(pyproject_toml) as f:
-                content = f.read()
-                if "fastapi" in content.lower():
-                    return "fastapi"
-                elif "django" in content.lower():
-                    return "django"
-                elif "flask" in content.lower():
-                    return "flask"
-        except OSError:
-            pass
+    if root_names is None:
+        root_names = _scan_root(path)
 
-    # Check requirements.txt
-    requirements = path / "requirements.txt"
-    if requirements.exists():
-        try:
-            with open(requirements) as f:
-                content = f.read().lower()
-                if "fastapi" in content:
-                    return "fastapi"
-                elif "django" in content:
-                    return "django"
-                elif "flask" in content:
-                    return "flask"
-        except OSError:
-            pass
+    # Check Python manifests: pyproject.toml, then requirements.txt
+    for manifest in _PYTHON_MANIFESTS:
+        if manifest in root_names:
+            backend = _python_backend_in(path / manifest)
+            if backend:
+                return backend
 
     # Check for Node.js backend
-    package_json = path / "package.json"
-    if package_json.exists():
-        try:
-            with open(package_json) as f:
-                data = json.load(f)
-                deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-                if "express" in deps:
-                    return "express"
-                elif "fastify" in deps:
-                    return "fastify"
-                elif "@nestjs/core" in deps:
-                    return "nestjs"
-        except (OSError, json.JSONDecodeError, KeyError):
-            pass
+    if package_deps is None:
+        package_deps = _load_package_deps(path, root_names)
+
+    if "express" in package_deps:
+        return "express"
+    elif "fastify" in package_deps:
+        return "fastify"
+    elif "@nestjs/core" in package_deps:
+        return "nestjs"
 
     return None
 
 
-def detect_build_tools(path: Path) -> List[str]:
+# (tool, marker files) in reporting order; any marker present means the tool is used
+_BUILD_TOOL_TABLE = (
+    ("vite", ("vite.config.ts", "vite.config.js")),
+    ("webpack", ("webpack.config.js",)),
+    ("rollup", ("rollup.config.js",)),
+    ("typescript", ("tsconfig.json",)),
+    ("babel", ("babel.config.js", ".babelrc")),
+    ("make", ("Makefile",)),
+    ("docker", ("Dockerfile",)),
+)
+
+# (marker file, package manager) in priority order: lockfiles first, then
+# the manifests that imply a default manager
+_PACKAGE_MANAGER_TABLE = (
+    ("bun.lockb", "bun"),
+    ("pnpm-lock.yaml", "pnpm"),
+    ("yarn.lock", "yarn"),
+    ("package-lock.json", "npm"),
+    ("uv.lock", "uv"),
+    ("poetry.lock", "poetry"),
+    ("Pipfile.lock", "pipenv"),
+    ("package.json", "npm"),
+    ("pyproject.toml", "pip"),
+)
+
+
+def detect_build_tools(path: Path, root_names: Optional[AbstractSet[str]] = None) -> List[str]:
     """
     Detect build tools in the project.
 
     Args:
         path: Project path
+        root_names: Entry names from _scan_root(path), if already read
 
     Returns:
         List of detected build tools
     """
-    tools = []
-
-    # Check for various build tools
-    if (path / "vite.config.ts").exists() or (path / "vite.config.js").exists():
-        tools.append("vite")
-
-    if (path / "webpack.config.js").exists():
-        tools.append("webpack")
-
-    if (path / "rollup.config.js").exists():
-        tools.append("rollup")
-
-    if (path / "tsconfig.json").exists():
-        tools.append("typescript")
-
-    if (path / "babel.config.js").exists() or (path / ".babelrc").exists():
-        tools.append("babel")
-
-    if (path / "Makefile").exists():
-        tools.append("make")
+    if root_names is None:
+        root_names = _scan_root(path)
 
-    if (path / "Dockerfile").exists():
-        tools.append("docker")
+    return [tool for tool, markers in _BUILD_TOOL_TABLE if not root_names.isdisjoint(markers)]
 
-    return tools
 
-
-def detect_package_manager(path: Path) -> Optional[str]:
+def detect_package_manager(path: Path, root_names: Optional[AbstractSet[str]] = None) -> Optional[str]:
     """
     Detect package manager used in the project.
 
     Args:
         path: Project path
+        root_names: Entry names from _scan_root(path), if already read
 
     Returns:
         Package manager name or None
     """
-    if (path / "bun.lockb").exists():
-        return "bun"
-
-    if (path / "pnpm-lock.yaml").exists():
-        return "pnpm"
-
-    if (path / "yarn.lock").exists():
-        return "yarn"
-
-    if (path / "package-lock.json").exists():
-        return "npm"
-
-    if (path / "uv.lock").exists():
-        return "uv"
+    if root_names is None:
+        root_names = _scan_root(path)
 
-    if (path / "poetry.lock").exists():
-        return "poetry"
-
-    if (path / "Pipfile.lock").exists():
-        return "pipenv"
-
-    # Default guesses based on what's present
-    if (path / "package.json").exists():
-        return "npm"
-
-    if (path / "pyproject.toml").exists():
-        return "pip"
-
-    return None
+    return next(
+        (manager for marker, manager in _PACKAGE_MANAGER_TABLE if marker in root_names),
+        None
+    )
 
 
-def check_git_initialized(path: Path) -> bool:
+def check_git_initialized(path: Path, root_names: Optional[AbstractSet[str]] = None) -> bool:
     """
     Check if git is initialized in the project.
 
     Args:
         path: Project path
+        root_names: Entry names from _scan_root(path), if already read
 
     Returns:
         True if git is initialized, False otherwise
     """
-    return (path / ".git").exists()
+    if root_names is None:
+        root_names = _scan_root(path)
+    return ".git" in root_names
 
 
 def calculate_complexity_from_structure(
     path: Path,
     framework: Optional[str],
     backend: Optional[str],
-    build_tools: List[str]
+    build_tools: List[str],
+    root_names: Optional[AbstractSet[str]] = None
 ) -> str:
     """
     Calculate project complexity based on structure.
@@ -345,14 +432,16 @@ def calculate_complexity_from_structure(
         framework: Detected framework (e.g., "react-vite")
         backend: Detected backend (e.g., "fastapi")
         build_tools: List of build tools (e.g., ["vite", "typescript"])
+        root_names: Entry names from _scan_root(path), if already read
 
     Returns:
         Complexity level: "low", "medium", or "high"
     """
     complexity_score = 0
 
-    # Count files in project (excluding node_modules, venv, etc.)
-    file_count = count_project_files(path)
+    # Count files in project (excluding node_modules, venv, etc.); past 100
+    # the exact number doesn't change the score
+    file_count = count_project_files(path, limit=101)
 
     if file_count > 100:
         complexity_score += 2
@@ -372,7 +461,9 @@ def calculate_complexity_from_structure(
         complexity_score += 1
 
     # Check for multiple packages (monorepo)
-    if (path / "packages").exists() or (path / "apps").exists():
+    if root_names is None:
+        root_names = _scan_root(path)
+    if "packages" in root_names or "apps" in root_names:
         complexity_score += 2
 
     # Determine complexity level
@@ -384,37 +475,44 @@ def calculate_complexity_from_structure(
         return "low"
 
 
-def count_project_files(path: Path) -> int:
+# Directories whose contents are dependencies, caches or build output
+_IGNORED_DIRS = frozenset({
+    "node_modules", "venv", ".venv", "dist", "build", ".git",
+    "__pycache__", ".pytest_cache", "coverage", ".next"
+})
+
+
+def count_project_files(path: Path, limit: Optional[int] = None) -> int:
     """
     Count source files in project, excluding common ignored directories.
 
+    Ignored directories are pruned from the walk, so their contents are
+    never listed.
+
     Args:
         path: Project path
+        limit: Stop counting once this many files are found
 
     Returns:
-        Number of source files
+        Number of source files (at most limit, if given)
     """
-    ignored_dirs = {
-        "node_modules", "venv", ".venv", "dist", "build", ".git",
-        "__pycache__", ".pytest_cache", "coverage", ".next"
-    }
-
     count = 0
-    try:
-        for item in path.rglob("*"):
-            # Skip if in ignored directory
-            if any(ignored in item.parts for ignored in ignored_dirs):
-                continue
-
-            # Count only files (not directories)
-            if item.is_file():
-                count += 1
-    except OSError:
-        pass
+    for _, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in _IGNORED_DIRS]
+        count += len(files)
+        if limit is not None and count >= limit:
+            return limit
 
     return count
 
 
+# Complexity -> recommended workflow; anything else gets the light workflow
+_WORKFLOW_BY_COMPLEXITY = {
+    "high": "adw_plan_build_test_iso",
+    "medium": "adw_plan_build_test_iso",
+}
+
+
 def suggest_workflow(context: ProjectContext) -> str:
     """
     Recommend ADW workflow based on project context.
@@ -425,12 +523,7 @@ def suggest_workflow(context: ProjectContext) -> str:
     Returns:
         Recommended workflow name
     """
-    if context.complexity == "high":
-        return "adw_plan_build_test_iso"
-    elif context.complexity == "medium":
-        return "adw_plan_build_test_iso"
-    else:
-        return "adw_sdlc_iso"
+    return _WORKFLOW_BY_COMPLEXITY.get(context.complexity, "adw_sdlc_iso")
 
 
 def calculate_complexity(context: ProjectContext) -> str:
@@ -157,6 +157,6 @@ class RoutesAnalyzer:
         docstring = ast.get_docstring(func_node)
         if docstring:
             # Return first line only
-            first_line = docstring.split('\n')[0].strip()
+            first_line = docstring.partition('\n')[0].strip()
             return first_line if first_line else "N/A"
         return "N/A"
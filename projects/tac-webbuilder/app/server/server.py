@@ -1,6 +1,7 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime
 import os
 import sqlite3
@@ -22,6 +23,7 @@ from core.data_models import (
     RandomQueryResponse,
     ExportRequest,
     QueryExportRequest,
+    QueryExportStreamRequest,
     Route,
     RoutesResponse
 )
@@ -35,7 +37,7 @@ from core.sql_security import (
     check_table_exists,
     SQLSecurityError
 )
-from core.export_utils import generate_csv_from_data, generate_csv_from_table
+from core.export_utils import generate_csv_from_data, generate_csv_from_table, stream_query_export
 from core.routes_analyzer import RoutesAnalyzer
 
 # Load .env file from server directory
@@ -366,6 +368,38 @@ async def export_query_results(request: QueryExportRequest) -> Response:
         logger.error(f"[ERROR] Full traceback:\n{traceback.format_exc()}")
         raise HTTPException(500, f"Error exporting query results: {str(e)}")
 
+def _open_query_stream(sql: str, format: str):
+    """Connect read-only and start the export; the connection closes with the stream"""
+    # StreamingResponse iterates from a worker thread, one chunk at a time
+    conn = sqlite3.connect("file:db/database.db?mode=ro", uri=True, check_same_thread=False)
+    try:
+        return stream_query_export(conn, sql, format)
+    except Exception:
+        conn.close()
+        raise
+
+@app.post("/api/export/query/stream")
+async def export_query_stream(request: QueryExportStreamRequest) -> StreamingResponse:
+    """Run a query and stream its results as CSV or JSONL"""
+    try:
+        # Connecting and executing the query block, so keep them off the event loop
+        chunks = await run_in_threadpool(_open_query_stream, request.sql, request.format)
+    except SQLSecurityError as e:
+        raise HTTPException(400, f"Security error: {str(e)}")
+    except Exception as e:
+        logger.error(f"[ERROR] Streaming query export failed: {str(e)}")
+        logger.error(f"[ERROR] Full traceback:\n{traceback.format_exc()}")
+        raise HTTPException(500, f"Error exporting query results: {str(e)}")
+
+    media_type = "text/csv" if request.format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="query_results.{request.format}"'
+        }
+    )
+
 @app.get("/api/routes", response_model=RoutesResponse)
 async def get_routes() -> RoutesResponse:
     """Get all API routes with metadata"""
@@ -0,0 +1,22 @@
+"""Shared pytest fixtures for the server test suite."""
+
+import pytest
+
+from core.nl_processor import _analysis_memo
+from core.project_detector import clear_context_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_analysis_memo():
+    """Claude analyses are memoized per process; start every test with none."""
+    _analysis_memo.clear()
+    yield
+    _analysis_memo.clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_context_cache():
+    """Detected project contexts are cached per process; start every test with none."""
+    clear_context_cache()
+    yield
+    clear_context_cache()
@@ -0,0 +1,18 @@
+import pytest
+import core.data_models as data_models
+
+
+class TestLazyModels:
+
+    @pytest.mark.parametrize("name", data_models.__all__)
+    def test_every_exported_model_resolves(self, name):
+        """Test each name in __all__ loads from its core._models module."""
+        model = getattr(data_models, name)
+
+        assert model.__name__ == name
+        assert model.__module__ == f"core._models.{data_models._LAZY_MODELS[name]}"
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            data_models.NotAModel
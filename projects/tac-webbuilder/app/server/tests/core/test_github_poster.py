@@ -1,7 +1,9 @@
+import asyncio
+import json
 import pytest
 import subprocess
-from unittest.mock import patch, MagicMock
-from core.github_poster import GitHubPoster
+from unittest.mock import patch, MagicMock, AsyncMock
+from core.github_poster import MAX_CONCURRENT_CREATES, GitHubPoster, IssuePostError, _gh_available, _shared_console
 from core.data_models import GitHubIssue
 
 
@@ -24,6 +26,13 @@ class TestGitHubPoster:
         """Create a GitHubPoster instance."""
         return GitHubPoster()
 
+    @pytest.fixture(autouse=True)
+    def clear_gh_check_cache(self):
+        """Reset the process-wide gh availability cache around each test."""
+        _gh_available.cache_clear()
+        yield
+        _gh_available.cache_clear()
+
     def test_init_without_repo(self):
         """Test initializing without repo URL."""
         poster = GitHubPoster()
@@ -34,6 +43,15 @@ class TestGitHubPoster:
         poster = GitHubPoster(repo_url="owner/repo")
         assert poster.repo_url == "owner/repo"
 
+    def test_console_created_on_first_use_and_shared(self, poster, sample_issue):
+        """Test formatting alone does not build a console, and posters share one."""
+        _shared_console.cache_clear()
+        poster.format_preview(sample_issue)
+        assert _shared_console.cache_info().currsize == 0
+
+        assert poster.console is GitHubPoster(repo_url="owner/repo").console
+        assert _shared_console.cache_info().misses == 1
+
     def test_format_preview(self, poster, sample_issue):
         """Test formatting issue preview."""
         preview = poster.format_preview(sample_issue)
@@ -44,6 +62,20 @@ class TestGitHubPoster:
         assert "adw_sdlc_iso model_set base" in preview
         assert "## Description" in preview
 
+    @pytest.mark.parametrize("is_terminal", [True, False])
+    def test_show_preview(self, poster, sample_issue, is_terminal):
+        """Test terminals get the rich panel and other outputs the plain markdown."""
+        console = MagicMock(is_terminal=is_terminal)
+        with patch('core.github_poster._shared_console', return_value=console):
+            poster._show_preview(sample_issue)
+
+        if is_terminal:
+            assert console.print.call_count == 2
+            console.out.assert_not_called()
+        else:
+            console.print.assert_not_called()
+            assert poster.format_preview(sample_issue) in console.out.call_args.args[0]
+
     @patch('core.github_poster.GitHubPoster._validate_gh_cli')
     @patch('core.github_poster.GitHubPoster._execute_gh_command')
     def test_post_issue_without_confirmation(self, mock_execute, mock_validate, poster, sample_issue):
@@ -64,7 +96,9 @@ class TestGitHubPoster:
         assert call_args[2] == "create"
         assert "--title" in call_args
         assert "Add Dark Mode" in call_args
-        assert "--body" in call_args
+        assert call_args[call_args.index("--body-file") + 1] == "-"
+        assert sample_issue.body not in call_args
+        assert mock_execute.call_args.kwargs["input"] == sample_issue.body
         assert "--label" in call_args
 
     @patch('core.github_poster.GitHubPoster._validate_gh_cli')
@@ -127,37 +161,36 @@ class TestGitHubPoster:
         assert "--repo" in call_args
         assert "owner/repo" in call_args
 
+    @patch('core.github_poster.shutil.which', return_value='/usr/bin/gh')
     @patch('core.github_poster.subprocess.run')
-    def test_validate_gh_cli_success(self, mock_run, poster):
-        """Test successful gh CLI validation."""
+    def test_validate_gh_cli_success(self, mock_run, mock_which, poster):
+        """Test successful gh CLI validation is cached after one auth check."""
         mock_run.return_value = MagicMock(returncode=0)
 
-        result = poster._validate_gh_cli()
+        assert poster._validate_gh_cli() is True
+        assert poster._validate_gh_cli() is True
 
-        assert result is True
-        assert mock_run.call_count == 2  # version check + auth check
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gh", "auth", "status"]
 
+    @patch('core.github_poster.shutil.which', return_value=None)
     @patch('core.github_poster.subprocess.run')
-    def test_validate_gh_cli_not_installed(self, mock_run, poster):
+    def test_validate_gh_cli_not_installed(self, mock_run, mock_which, poster):
         """Test validation when gh is not installed."""
-        mock_run.side_effect = FileNotFoundError()
-
         result = poster._validate_gh_cli()
 
         assert result is False
+        mock_run.assert_not_called()
 
+    @patch('core.github_poster.shutil.which', return_value='/usr/bin/gh')
     @patch('core.github_poster.subprocess.run')
-    def test_validate_gh_cli_not_authenticated(self, mock_run, poster):
-        """Test validation when gh is not authenticated."""
-        # First call (version check) succeeds, second call (auth check) fails
-        mock_run.side_effect = [
-            MagicMock(returncode=0),
-            subprocess.CalledProcessError(1, "gh auth status")
-        ]
-
-        result = poster._validate_gh_cli()
+    def test_validate_gh_cli_not_authenticated(self, mock_run, mock_which, poster):
+        """Test validation when gh is not authenticated, and that failures are retried."""
+        mock_run.side_effect = [MagicMock(returncode=1), MagicMock(returncode=0)]
 
-        assert result is False
+        assert poster._validate_gh_cli() is False
+        assert poster._validate_gh_cli() is True
+        assert mock_run.call_count == 2
 
     @patch('core.github_poster.subprocess.run')
     def test_execute_gh_command_success(self, mock_run, poster):
@@ -183,6 +216,33 @@ class TestGitHubPoster:
 
         assert "GitHub CLI command failed" in str(exc_info.value)
 
+    @patch('core.github_poster.subprocess.run')
+    def test_execute_gh_command_bytes(self, mock_run, poster):
+        """Test JSON callers get undecoded stdout and readable errors."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"name": "repo"}')
+
+        assert poster._execute_gh_command(["gh", "repo", "view"], text=False) == b'{"name": "repo"}'
+        assert mock_run.call_args.kwargs["text"] is False
+
+        poster._execute_gh_command(["gh", "api", "-"], text=False, input="body")
+        assert mock_run.call_args.kwargs["input"] == b"body"
+
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh", stderr=b"HTTP 404")
+        with pytest.raises(RuntimeError, match="HTTP 404"):
+            poster._execute_gh_command(["gh", "repo", "view"], text=False)
+
+    @patch('core.github_poster.subprocess.run')
+    def test_execute_gh_command_keeps_error_output(self, mock_run, poster):
+        """Test a failed command's response is returned when the caller asks for it."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, "gh", output=b'{"errors": []}', stderr=b"GraphQL error"
+        )
+        cmd = ["gh", "api", "graphql"]
+
+        assert poster._execute_gh_command(cmd, text=False, keep_output_on_error=True) == b'{"errors": []}'
+        with pytest.raises(RuntimeError, match="GraphQL error"):
+            poster._execute_gh_command(cmd, text=False)
+
     @patch('core.github_poster.GitHubPoster._execute_gh_command')
     def test_get_repo_info(self, mock_execute, poster):
         """Test getting repository information."""
@@ -235,6 +295,18 @@ class TestGitHubPoster:
                 assert "feature" in labels
                 assert "UI" in labels
 
+    @pytest.mark.parametrize("label", ["", "a,b", "line\nbreak", "x" * 51])
+    def test_post_issue_rejects_invalid_label(self, label, sample_issue):
+        """Test labels that would break the --label list are rejected before gh runs."""
+        poster = GitHubPoster()
+        issue = sample_issue.model_copy(update={"labels": ["feature", label]})
+
+        with patch.object(poster, '_validate_gh_cli', return_value=True):
+            with patch.object(poster, '_execute_gh_command') as mock_execute:
+                with pytest.raises(RuntimeError, match="Invalid label format"):
+                    poster.post_issue(issue, confirm=False)
+                mock_execute.assert_not_called()
+
     @patch('core.github_poster.GitHubPoster._validate_gh_cli')
     @patch('core.github_poster.GitHubPoster._execute_gh_command')
     def test_post_issue_extracts_number_correctly(self, mock_execute, mock_validate, poster, sample_issue):
@@ -246,9 +318,197 @@ class TestGitHubPoster:
             ("https://github.com/owner/repo/issues/1", 1),
             ("https://github.com/owner/repo/issues/999", 999),
             ("https://github.com/owner/repo/issues/42\n", 42),
+            ("Creating issue in owner/repo\n\nhttps://github.com/owner/repo/issues/7\n", 7),
         ]
 
         for url, expected_number in test_cases:
             mock_execute.return_value = url
             result = poster.post_issue(sample_issue, confirm=False)
             assert result == expected_number
+
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli')
+    @patch('core.github_poster.GitHubPoster._execute_gh_command')
+    def test_post_issues_bulk(self, mock_execute, mock_validate, sample_issue):
+        """Test bulk posting uses one lookup and one mutation for all issues."""
+        poster = GitHubPoster(repo_url="https://github.com/owner/repo")
+        mock_validate.return_value = True
+        second = sample_issue.model_copy(update={"title": "Fix Login", "labels": ["feature"]})
+        mock_execute.side_effect = [
+            '{"data": {"repository": {"id": "R_1", "l0": {"id": "LA_u"}, "l1": {"id": "LA_f"}}}}',
+            '{"data": {'
+            '"i0": {"issue": {"number": 7, "url": "https://github.com/owner/repo/issues/7"}}, '
+            '"i1": {"issue": {"number": 8, "url": "https://github.com/owner/repo/issues/8"}}}}',
+        ]
+
+        result = poster.post_issues_bulk([sample_issue, second])
+
+        assert result == [7, 8]
+        assert mock_execute.call_count == 2
+
+        lookup_call = mock_execute.call_args_list[0]
+        assert lookup_call[0][0] == ["gh", "api", "graphql", "--input", "-"]
+        lookup = json.loads(lookup_call.kwargs["input"])
+        assert lookup["variables"] == {"owner": "owner", "name": "repo", "l0": "UI", "l1": "feature"}
+        assert "l0: label(name: $l0)" in lookup["query"]
+
+        mutation_call = mock_execute.call_args_list[1]
+        assert mutation_call[0][0] == ["gh", "api", "graphql", "--input", "-"]
+        mutation = json.loads(mutation_call.kwargs["input"])
+        assert 'repositoryId: "R_1"' in mutation["query"]
+        assert '["LA_f", "LA_u"]' in mutation["query"]
+        assert mutation["variables"]["t1"] == "Fix Login"
+        assert mutation["variables"]["b0"] == sample_issue.body
+
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli')
+    @patch('core.github_poster.GitHubPoster._execute_gh_command')
+    def test_post_issues_bulk_unknown_label(self, mock_execute, mock_validate, poster, sample_issue):
+        """Test bulk posting fails before the mutation when a label is missing."""
+        mock_validate.return_value = True
+        mock_execute.side_effect = [
+            '{"name": "repo", "owner": {"login": "owner"}}',
+            '{"data": {"repository": {"id": "R_1", "l0": null, "l1": {"id": "LA_f"}}}}',
+        ]
+
+        with pytest.raises(RuntimeError) as exc_info:
+            poster.post_issues_bulk([sample_issue])
+
+        assert "Labels not found in repository: UI" in str(exc_info.value)
+        assert mock_execute.call_count == 2
+        assert mock_execute.call_args_list[0][0][0][:3] == ["gh", "repo", "view"]
+
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli')
+    @patch('core.github_poster.GitHubPoster._execute_gh_command')
+    def test_post_issues_bulk_partial_failure(self, mock_execute, mock_validate, sample_issue):
+        """Test issues created before a failing alias are reported, not lost."""
+        poster = GitHubPoster(repo_url="https://github.com/owner/repo")
+        mock_validate.return_value = True
+        second = sample_issue.model_copy(update={"title": "Fix Login", "labels": ["feature"]})
+        mock_execute.side_effect = [
+            '{"data": {"repository": {"id": "R_1", "l0": {"id": "LA_u"}, "l1": {"id": "LA_f"}}}}',
+            '{"data": {'
+            '"i0": {"issue": {"number": 7, "url": "https://github.com/owner/repo/issues/7"}}, '
+            '"i1": null}, '
+            '"errors": [{"path": ["i1"], "message": "was submitted too quickly"}]}',
+        ]
+
+        with pytest.raises(IssuePostError) as exc_info:
+            poster.post_issues_bulk([sample_issue, second])
+
+        assert exc_info.value.created == [7]
+        assert [issue for issue, _ in exc_info.value.failed] == [second]
+        assert "was submitted too quickly" in str(exc_info.value.failed[0][1])
+        assert mock_execute.call_args_list[1].kwargs["keep_output_on_error"] is True
+
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli')
+    @patch('core.github_poster.GitHubPoster._execute_gh_command')
+    def test_post_issues_bulk_null_data(self, mock_execute, mock_validate, sample_issue):
+        """Test a rejected mutation (data: null) fails every issue with its error."""
+        poster = GitHubPoster(repo_url="https://github.com/owner/repo")
+        mock_validate.return_value = True
+        mock_execute.side_effect = [
+            '{"data": {"repository": {"id": "R_1", "l0": {"id": "LA_u"}, "l1": {"id": "LA_f"}}}}',
+            '{"data": null, "errors": [{"message": "Something went wrong"}]}',
+        ]
+
+        with pytest.raises(IssuePostError) as exc_info:
+            poster.post_issues_bulk([sample_issue])
+
+        assert exc_info.value.created == []
+        assert "Something went wrong" in str(exc_info.value)
+
+        mock_execute.side_effect = [
+            '{"data": {"repository": {"id": "R_1", "l0": {"id": "LA_u"}, "l1": {"id": "LA_f"}}}}',
+            '{"data": null}',
+        ]
+        with pytest.raises(RuntimeError, match="no data"):
+            poster.post_issues_bulk([sample_issue])
+
+    @pytest.mark.parametrize("repo_url", [
+        "owner/repo",
+        "https://github.com/owner/repo",
+        "https://github.com/owner/repo.git",
+        "git@github.com:owner/repo.git",
+    ])
+    def test_repo_owner_and_name(self, repo_url):
+        """Test owner/name parsing from slugs, https URLs and SSH remotes."""
+        assert GitHubPoster(repo_url=repo_url)._repo_owner_and_name() == ("owner", "repo")
+
+    @patch('core.github_poster.GitHubPoster._execute_gh_command')
+    def test_post_issues_bulk_empty(self, mock_execute, poster):
+        """Test bulk posting nothing makes no gh calls."""
+        assert poster.post_issues_bulk([]) == []
+        mock_execute.assert_not_called()
+
+    @staticmethod
+    def _fake_process(stdout: bytes, returncode: int = 0, stderr: bytes = b""):
+        process = MagicMock(returncode=returncode)
+        process.communicate = AsyncMock(return_value=(stdout, stderr))
+        return process
+
+    @pytest.mark.asyncio
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli', return_value=True)
+    @patch('core.github_poster.asyncio.create_subprocess_exec', new_callable=AsyncMock)
+    async def test_post_issues_async(self, mock_exec, mock_validate, poster, sample_issue):
+        """Test concurrent posting returns numbers in input order."""
+        processes = [
+            self._fake_process(b"https://github.com/owner/repo/issues/10\n"),
+            self._fake_process(b"https://github.com/owner/repo/issues/11\n"),
+        ]
+        mock_exec.side_effect = processes
+        second = sample_issue.model_copy(update={"title": "Second"})
+
+        assert await poster.post_issues_async([sample_issue, second]) == [10, 11]
+
+        cmds = [call.args for call in mock_exec.call_args_list]
+        assert cmds[0][:3] == ("gh", "issue", "create")
+        assert "Second" in cmds[1]
+        processes[0].communicate.assert_awaited_once_with(input=sample_issue.body.encode())
+
+    @pytest.mark.asyncio
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli', return_value=True)
+    @patch('core.github_poster.asyncio.create_subprocess_exec', new_callable=AsyncMock)
+    async def test_post_issues_async_failure(self, mock_exec, mock_validate, poster, sample_issue):
+        """Test one failed create surfaces after the others finish."""
+        ok = self._fake_process(b"https://github.com/owner/repo/issues/10\n")
+        mock_exec.side_effect = [
+            ok,
+            self._fake_process(b"", returncode=1, stderr=b"could not add label"),
+        ]
+
+        second = sample_issue.model_copy(update={"title": "Second"})
+
+        with pytest.raises(IssuePostError, match="could not add label") as exc_info:
+            await poster.post_issues_async([sample_issue, second])
+        ok.communicate.assert_awaited_once()
+        assert exc_info.value.created == [10]
+        assert [issue for issue, _ in exc_info.value.failed] == [second]
+
+    @pytest.mark.asyncio
+    @patch('core.github_poster.GitHubPoster._validate_gh_cli', return_value=True)
+    @patch('core.github_poster.GitHubPoster._post_issue_async')
+    async def test_post_issues_async_bounds_concurrency(self, mock_post, mock_validate, poster, sample_issue):
+        """Test at most MAX_CONCURRENT_CREATES gh processes run at once."""
+        running = peak = 0
+
+        async def fake_post(issue):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return 1
+
+        mock_post.side_effect = fake_post
+
+        result = await poster.post_issues_async([sample_issue] * 10)
+
+        assert result == [1] * 10
+        assert peak == MAX_CONCURRENT_CREATES
+
+    def test_format_preview_reuses_cached_content(self, poster, sample_issue):
+        """Test repeat previews of identical issues return the cached string."""
+        first = poster.format_preview(sample_issue)
+        second = poster.format_preview(sample_issue.model_copy())
+
+        assert first is second
+        assert poster.format_preview(sample_issue.model_copy(update={"title": "Other"})) != first
@@ -31,6 +31,14 @@ class TestIssueFormatter:
 
         assert result == "- To be determined"
 
+    def test_format_requirements_list_none(self):
+        """Test None is treated like an empty requirements list."""
+        assert format_requirements_list(None) == "- To be determined"
+
+    def test_format_requirements_list_non_string_items(self):
+        """Test non-string requirements are formatted rather than rejected."""
+        assert format_requirements_list([1, None]) == "- 1\n- None"
+
     def test_format_technical_approach_with_content(self):
         """Test formatting technical approach with content."""
         approach = "Use React hooks for state management"
@@ -229,6 +237,24 @@ class TestIssueFormatter:
 
         assert "Missing required template field" in str(exc_info.value)
 
+    def test_format_issue_reuses_cached_render(self):
+        """Test identical issue data is rendered once, unhashable data still renders."""
+        issue = GitHubIssue(
+            title="Update Dependencies",
+            body="",
+            labels=["chore"],
+            classification="chore",
+            workflow="adw_sdlc_iso",
+            model_set="base"
+        )
+        template_data = {"title": "Update Dependencies", "description": "Bump", "tasks": "- npm"}
+
+        first = format_issue(issue, dict(template_data))
+        assert format_issue(issue, dict(template_data)) is first
+
+        unhashable = dict(template_data, tasks=["npm", "pip"])
+        assert "['npm', 'pip']" in format_issue(issue, unhashable)
+
     def test_validate_issue_body_valid(self):
         """Test validating a valid issue body."""
         body = """## Description
@@ -280,6 +306,17 @@ This is a test issue.
         assert "{tasks}" in ISSUE_TEMPLATES["chore"]
         assert "{workflow}" in ISSUE_TEMPLATES["chore"]
 
+    @pytest.mark.parametrize("name", ["feature", "bug", "chore"])
+    def test_compiled_templates_match_format(self, name):
+        """Test pre-parsed templates render exactly like str.format."""
+        from core.issue_formatter import _COMPILED_TEMPLATES, _render
+
+        fields = ["title", "description", "requirements", "technical_approach",
+                  "workflow", "steps", "expected", "actual", "tasks"]
+        values = {field: f"<{field} {{not a placeholder}}>" for field in fields}
+
+        assert _render(_COMPILED_TEMPLATES[name], values) == ISSUE_TEMPLATES[name].format(**values)
+
     def test_escape_markdown_special_chars(self):
         """Test escaping markdown special characters."""
         from core.issue_formatter import escape_markdown_special_chars
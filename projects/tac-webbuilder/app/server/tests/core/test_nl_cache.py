@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import patch
+from core.nl_cache import SemanticCache
+from core.nl_processor import process_request
+from core.data_models import GitHubIssue, ProjectContext
+
+
+def _fake_embedder(text: str):
+    """Tiny deterministic embedding: which of a few keywords the text mentions."""
+    words = set(text.lower().split())
+    return [float(bool(words & group)) for group in (
+        {"login", "signin"}, {"page", "screen"}, {"dark", "theme"}, {"add", "create"}
+    )]
+
+
+class TestSemanticCache:
+
+    @pytest.fixture
+    def context(self):
+        return ProjectContext(
+            path="/test/project",
+            is_new_project=False,
+            framework="react-vite",
+            complexity="medium"
+        )
+
+    @pytest.fixture
+    def issue(self):
+        return GitHubIssue(
+            title="Add login page",
+            body="## Description\nAdd login page",
+            labels=["feature", "ui"],
+            classification="feature",
+            workflow="adw_sdlc_iso",
+            model_set="base"
+        )
+
+    def test_exact_hit_ignores_case_and_whitespace(self, context, issue):
+        """Test exact lookups normalize the input."""
+        cache = SemanticCache(":memory:")
+        cache.put("Add login page", context, issue)
+
+        assert cache.get("  add   LOGIN page ", context) == issue
+
+    def test_miss_for_different_context(self, context, issue):
+        """Test entries are scoped to the project context."""
+        cache = SemanticCache(":memory:")
+        cache.put("Add login page", context, issue)
+
+        other = context.model_copy(update={"complexity": "high"})
+        assert cache.get("Add login page", other) is None
+
+    def test_no_similarity_lookup_without_embedder(self, context, issue):
+        """Test rephrasings miss when no embedder is configured."""
+        cache = SemanticCache(":memory:")
+        cache.put("Add login page", context, issue)
+
+        assert cache.get("create signin screen", context) is None
+
+    def test_semantic_hit_above_threshold(self, context, issue):
+        """Test rephrasings hit via embedding similarity."""
+        cache = SemanticCache(":memory:", embedder=_fake_embedder)
+        cache.put("Add login page", context, issue)
+
+        assert cache.get("create signin screen", context) == issue
+        assert cache.get("add dark theme", context) is None
+
+    def test_expired_entries_miss_and_purge(self, context, issue):
+        """Test TTL expiry."""
+        cache = SemanticCache(":memory:", ttl_seconds=-1)
+        cache.put("Add login page", context, issue)
+
+        assert cache.get("Add login page", context) is None
+        assert cache.purge_expired() == 1
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_uses_cache(self, mock_analyze, context):
+        """Test a cached request skips the Claude-backed steps."""
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Add dark mode",
+                "technical_area": "UI"
+            },
+            ["Create theme toggle component"]
+        )
+        cache = SemanticCache(":memory:")
+
+        first = await process_request("Add dark mode", context, cache=cache)
+        second = await process_request("add dark mode", context, cache=cache)
+
+        assert second == first
+        mock_analyze.assert_called_once()
@@ -1,24 +1,29 @@
 import pytest
+import asyncio
 import os
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from core.nl_processor import (
     analyze_intent,
     extract_requirements,
+    analyze_and_extract,
     classify_issue_type,
     suggest_adw_workflow,
-    process_request
+    process_request,
+    process_requests_batch
 )
+from core import nl_processor
 from core.data_models import ProjectContext
+from core.nl_cache import SemanticCache
 
 
 class TestNLProcessor:
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_feature(self, mock_anthropic_class):
         """Test analyzing intent for a feature request."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -38,10 +43,10 @@ class TestNLProcessor:
             mock_client.messages.create.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_bug(self, mock_anthropic_class):
         """Test analyzing intent for a bug report."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -60,10 +65,10 @@ class TestNLProcessor:
             assert result["technical_area"] == "authentication"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_clean_markdown(self, mock_anthropic_class):
         """Test that markdown code blocks are cleaned from responses."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -88,10 +93,10 @@ class TestNLProcessor:
             assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_api_error(self, mock_anthropic_class):
         """Test handling of API errors."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
         mock_client.messages.create.side_effect = Exception("API Error")
 
@@ -101,6 +106,53 @@ class TestNLProcessor:
 
             assert "Error analyzing intent with Anthropic" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_intent_tagged_request_skips_api(self, mock_anthropic_class):
+        """Test a request tagged with its type is classified without Claude."""
+        with patch.dict(os.environ, {}, clear=True):
+            result = await analyze_intent("fix(auth): login button does nothing ")
+
+        assert result == {
+            "intent_type": "bug",
+            "summary": "login button does nothing",
+            "technical_area": "general"
+        }
+        mock_anthropic_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_intent_tagged_summary_is_first_line(self, mock_anthropic_class):
+        """Test only the tagged first line becomes the summary."""
+        with patch.dict(os.environ, {}, clear=True):
+            result = await analyze_intent("feat: dark mode\n\nToggle in settings, persist choice")
+
+        assert result["intent_type"] == "feature"
+        assert result["summary"] == "dark mode"
+        mock_anthropic_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("nl_input", [
+        "Note: users want dark mode",
+        "test: cover the checkout flow end to end",
+        "docs: add an API reference site",
+    ])
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_intent_unknown_tag_uses_api(self, mock_anthropic_class, nl_input):
+        """Test unrecognized or ambiguous tags still go to Claude."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({"intent_type": "feature"})
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            result = await analyze_intent(nl_input)
+
+        assert result == {"intent_type": "feature"}
+        mock_client.messages.create.assert_called_once()
+
     @patch('core.nl_processor.Anthropic')
     def test_extract_requirements_success(self, mock_anthropic_class):
         """Test extracting requirements from NL input."""
@@ -151,6 +203,232 @@ class TestNLProcessor:
 
             assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_single_call(self, mock_anthropic_class):
+        """Test intent and requirements come back from one API call."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = '```json\n' + json.dumps({
+            "intent": {
+                "intent_type": "bug",
+                "summary": "Fix login button",
+                "technical_area": "UI"
+            },
+            "requirements": ["Fix click handler", "Add regression test"]
+        }) + '\n```'
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            intent, requirements = await analyze_and_extract("Login button is broken")
+
+            assert intent["intent_type"] == "bug"
+            assert requirements == ["Fix click handler", "Add regression test"]
+            mock_client.messages.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_tagged_request_keeps_technical_area(self, mock_anthropic_class):
+        """Test a request's tag decides intent_type while Claude still names the area."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Make the login button work",
+                "technical_area": "UI"
+            },
+            "requirements": ["Fix click handler"]
+        })
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            intent, requirements = await analyze_and_extract("fix: login button does nothing")
+
+        assert intent == {
+            "intent_type": "bug",
+            "summary": "Make the login button work",
+            "technical_area": "UI"
+        }
+        assert requirements == ["Fix click handler"]
+        assert mock_client.messages.create.call_args.kwargs["max_tokens"] == 800
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_caches_instructions(self, mock_anthropic_class):
+        """Test the fixed instructions go in a cache-marked system block."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({
+            "intent": {"intent_type": "feature", "summary": "Add dark mode", "technical_area": "UI"},
+            "requirements": []
+        })
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            await analyze_and_extract("Add dark mode")
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"] == [{"role": "user", "content": 'Request: "Add dark mode"'}]
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_memoizes_normalized_input(self, mock_anthropic_class):
+        """Test repeats of a request (modulo case/whitespace) reuse the first analysis."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({
+            "intent": {"intent_type": "feature", "summary": "Add dark mode", "technical_area": "UI"},
+            "requirements": ["Create theme toggle"]
+        })
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            first = await analyze_and_extract("Add dark mode")
+            first[0]["summary"] = "mutated by caller"
+            second = await analyze_and_extract("  add DARK mode ")
+
+        mock_client.messages.create.assert_called_once()
+        assert second == ({"intent_type": "feature", "summary": "Add dark mode", "technical_area": "UI"},
+                          ["Create theme toggle"])
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_memo_expires(self, mock_anthropic_class):
+        """Test a memoized analysis is not reused after the memo TTL."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({"intent": {"intent_type": "feature"}})
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}), \
+                patch('core.nl_processor.time.monotonic', return_value=1000.0) as clock:
+            await analyze_and_extract("Add dark mode")
+            clock.return_value += nl_processor.ANALYSIS_MEMO_TTL_SECONDS - 1
+            await analyze_and_extract("Add dark mode")
+            assert mock_client.messages.create.await_count == 1
+
+            clock.return_value += 1
+            await analyze_and_extract("Add dark mode")
+
+        assert mock_client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_client_is_reused_across_calls(self, mock_anthropic_class):
+        """Test the API client is built once, not per call."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({"intent_type": "feature"})
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            await analyze_intent("Add dark mode")
+            await analyze_intent("Add light mode")
+
+        mock_anthropic_class.assert_called_once()
+        assert mock_anthropic_class.call_args.kwargs["api_key"] == 'test-key'
+        assert mock_client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_rotated_api_key_closes_old_client(self, mock_anthropic_class):
+        """Test a new API key replaces the loop's client and closes the old one."""
+        old_client, new_client = AsyncMock(), AsyncMock()
+        mock_anthropic_class.side_effect = [old_client, new_client]
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'old-key'}):
+            assert await nl_processor._get_async_client() is old_client
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'new-key'}):
+            assert await nl_processor._get_async_client() is new_client
+
+        old_client.close.assert_awaited_once()
+        new_client.close.assert_not_awaited()
+
+    @patch('core.nl_processor.AsyncAnthropic')
+    def test_closed_loops_are_dropped(self, mock_anthropic_class):
+        """Test clients and semaphores of finished event loops are not kept."""
+        async def use_loop():
+            await nl_processor._get_async_client()
+            nl_processor._request_slots()
+            return asyncio.get_running_loop()
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            first_loop = asyncio.run(use_loop())
+            second_loop = asyncio.run(use_loop())
+
+        assert first_loop not in nl_processor._loop_clients
+        assert first_loop not in nl_processor._loop_request_slots
+        assert second_loop in nl_processor._loop_clients
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_intent_does_not_memoize_failures(self, mock_anthropic_class):
+        """Test a failed call is retried on the next request."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = json.dumps({"intent_type": "bug"})
+        mock_client.messages.create.side_effect = [Exception("API Error"), mock_response]
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            with pytest.raises(Exception):
+                await analyze_intent("Login is broken")
+            result = await analyze_intent("Login is broken")
+
+        assert result == {"intent_type": "bug"}
+
+    @pytest.mark.asyncio
+    async def test_analyze_and_extract_no_api_key(self):
+        """Test error when API key is missing."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(Exception) as exc_info:
+                await analyze_and_extract("Add dark mode")
+
+            assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.MAX_CONCURRENT_REQUESTS', 2)
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_caps_concurrent_calls(self, mock_anthropic_class):
+        """Test parallel requests never exceed the in-flight call limit."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.content[0].text = json.dumps({"intent": {"intent_type": "chore"}})
+            return response
+
+        mock_client = AsyncMock()
+        mock_client.messages.create.side_effect = create
+        mock_anthropic_class.return_value = mock_client
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            await asyncio.gather(*(analyze_and_extract(f"Task {i}") for i in range(6)))
+
+        assert mock_client.messages.create.call_count == 6
+        assert peak == 2
+
     def test_classify_issue_type_feature(self):
         """Test classifying a feature request."""
         intent = {"intent_type": "feature", "summary": "Add dark mode"}
@@ -206,23 +484,21 @@ class TestNLProcessor:
         assert model_set == "heavy"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_success(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_success(self, mock_analyze):
         """Test end-to-end request processing."""
-        # Mock the async function - use AsyncMock or return the dict directly
-
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Add dark mode",
-            "technical_area": "UI"
-        }
-
-        mock_extract.return_value = [
-            "Create theme toggle component",
-            "Add CSS variables for light/dark themes",
-            "Persist theme preference in localStorage"
-        ]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Add dark mode",
+                "technical_area": "UI"
+            },
+            [
+                "Create theme toggle component",
+                "Add CSS variables for light/dark themes",
+                "Persist theme preference in localStorage"
+            ]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -244,7 +520,27 @@ class TestNLProcessor:
         assert "## Requirements" in result.body
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_dedupes_labels(self, mock_analyze):
+        """Test a technical area matching the framework yields one label."""
+        mock_analyze.return_value = (
+            {"intent_type": "feature", "summary": "Add hooks", "technical_area": "React"},
+            []
+        )
+
+        project_context = ProjectContext(
+            path="/test/project",
+            is_new_project=False,
+            framework="react",
+            complexity="low"
+        )
+
+        result = await process_request("Add hooks", project_context)
+
+        assert result.labels == ["feature", "react"]
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.analyze_and_extract')
     async def test_process_request_error_handling(self, mock_analyze):
         """Test error handling in process_request."""
         mock_analyze.side_effect = Exception("API Error")
@@ -259,3 +555,125 @@ class TestNLProcessor:
             await process_request("Add feature", project_context)
 
         assert "Error processing NL request" in str(exc_info.value)
+
+
+async def _async_iter(items):
+    for item in items:
+        yield item
+
+
+def _batch_entry(custom_id, intent_type=None, summary=None):
+    """Message Batch result line: succeeded when an intent is given, errored otherwise."""
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    if intent_type is None:
+        entry.result.type = "errored"
+    else:
+        entry.result.type = "succeeded"
+        entry.result.message.content[0].text = json.dumps({
+            "intent": {"intent_type": intent_type, "summary": summary, "technical_area": "UI"},
+            "requirements": [f"Implement {summary}"]
+        })
+    return entry
+
+
+class TestProcessRequestsBatch:
+
+    @pytest.fixture
+    def project_context(self):
+        return ProjectContext(path="/test/project", is_new_project=False, complexity="low")
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_results_map_back_to_inputs(self, mock_anthropic_class, project_context):
+        """Test results come back in input order, with None for failed requests."""
+        mock_anthropic_class.return_value = AsyncMock()
+        batches = mock_anthropic_class.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+        batches.retrieve.return_value = MagicMock(id="batch_1", processing_status="ended")
+        batches.results.return_value = _async_iter([
+            _batch_entry("2", "bug", "Fix login"),
+            _batch_entry("1"),
+            _batch_entry("0", "feature", "Add dark mode"),
+        ])
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            issues = await process_requests_batch(
+                ["Add dark mode", "???", "Login is broken"], project_context, poll_interval=0
+            )
+
+        assert [issue and issue.title for issue in issues] == ["Add dark mode", None, "Fix login"]
+        assert issues[2].classification == "bug"
+        submitted = batches.create.call_args.kwargs["requests"]
+        assert [request["custom_id"] for request in submitted] == ["0", "1", "2"]
+        batches.retrieve.assert_called_once_with("batch_1")
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_tagged_requests_use_their_tag(self, mock_anthropic_class, project_context):
+        """Test a request's type tag wins over Claude's intent_type, as in process_request."""
+        mock_anthropic_class.return_value = AsyncMock()
+        batches = mock_anthropic_class.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="ended")
+        batches.results.return_value = _async_iter([_batch_entry("0", "feature", "Fix login")])
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            issues = await process_requests_batch(["fix: login is broken"], project_context)
+
+        assert issues[0].classification == "bug"
+        assert issues[0].labels == ["bug", "ui"]
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_failed_requests_are_logged(self, mock_anthropic_class, project_context, caplog):
+        """Test errored and expired requests are logged rather than dropped silently."""
+        mock_anthropic_class.return_value = AsyncMock()
+        batches = mock_anthropic_class.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="ended")
+        expired = _batch_entry("1")
+        expired.result.type = "expired"
+        batches.results.return_value = _async_iter([_batch_entry("0"), expired])
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}), \
+                caplog.at_level("WARNING", logger="core.nl_processor"):
+            issues = await process_requests_batch(["???", "Add dark mode"], project_context)
+
+        assert issues == [None, None]
+        assert "NL batch request 0 errored" in caplog.text
+        assert "NL batch request 1 expired ('Add dark mode')" in caplog.text
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_batch_cancelled_after_timeout(self, mock_anthropic_class, project_context):
+        """Test a batch that outlives the timeout is cancelled and reported."""
+        mock_anthropic_class.return_value = AsyncMock()
+        batches = mock_anthropic_class.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+        batches.retrieve.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            with pytest.raises(TimeoutError, match="batch_1"):
+                await process_requests_batch(
+                    ["Add dark mode"], project_context, poll_interval=0.01, timeout=0.05
+                )
+
+        batches.cancel.assert_awaited_once_with("batch_1")
+        batches.results.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_cache_hits_are_not_submitted(self, mock_anthropic_class, project_context):
+        """Test cached inputs skip the batch, and new results are cached."""
+        mock_anthropic_class.return_value = AsyncMock()
+        batches = mock_anthropic_class.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="ended")
+        batches.results.return_value = _async_iter([_batch_entry("0", "chore", "Update deps")])
+
+        cache = SemanticCache(":memory:")
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            first = await process_requests_batch(["Update deps"], project_context, cache=cache)
+            batches.create.reset_mock()
+            second = await process_requests_batch(["Update deps"], project_context, cache=cache)
+
+        assert second == first
+        batches.create.assert_not_called()
@@ -1,5 +1,7 @@
 import pytest
 import json
+import os
+from unittest.mock import patch
 from core.project_detector import (
     detect_project_context,
     is_directory_empty,
@@ -9,8 +11,10 @@ from core.project_detector import (
     detect_package_manager,
     check_git_initialized,
     calculate_complexity_from_structure,
+    count_project_files,
     suggest_workflow,
-    calculate_complexity
+    calculate_complexity,
+    _scan_root
 )
 from core.data_models import ProjectContext
 
@@ -139,6 +143,26 @@ dependencies = [
         result = detect_backend(project_dir)
         assert result == "express"
 
+    def test_detect_backend_priority_over_mention_order(self, tmp_path):
+        """Test FastAPI wins over Django even when Django is listed first."""
+        project_dir = tmp_path / "mixed_python"
+        project_dir.mkdir()
+
+        (project_dir / "requirements.txt").write_text("Django==5.0\nfastapi==0.110.0\n")
+
+        result = detect_backend(project_dir)
+        assert result == "fastapi"
+
+    def test_detect_backend_non_utf8_requirements(self, tmp_path):
+        """Test a requirements.txt with non-UTF-8 bytes is still scanned."""
+        project_dir = tmp_path / "latin1_requirements"
+        project_dir.mkdir()
+
+        (project_dir / "requirements.txt").write_bytes(b"flask==3.0  # caf\xe9\n")
+
+        result = detect_backend(project_dir)
+        assert result == "flask"
+
     def test_detect_backend_none(self, tmp_path):
         """Test when no backend is detected."""
         project_dir = tmp_path / "no_backend"
@@ -299,6 +323,27 @@ dependencies = [
 
         assert complexity == "high"
 
+    def test_count_project_files_skips_ignored_dirs(self, tmp_path):
+        """Test files under ignored directories are not counted."""
+        project_dir = tmp_path / "counted"
+        (project_dir / "src").mkdir(parents=True)
+        (project_dir / "node_modules" / "pkg").mkdir(parents=True)
+        for i in range(3):
+            (project_dir / "src" / f"file{i}.ts").touch()
+            (project_dir / "node_modules" / "pkg" / f"dep{i}.js").touch()
+        (project_dir / "package.json").touch()
+
+        assert count_project_files(project_dir) == 4
+
+    def test_count_project_files_stops_at_limit(self, tmp_path):
+        """Test counting stops once the limit is reached."""
+        project_dir = tmp_path / "limited"
+        project_dir.mkdir()
+        for i in range(10):
+            (project_dir / f"file{i}.ts").touch()
+
+        assert count_project_files(project_dir, limit=5) == 5
+
     def test_suggest_workflow_low(self):
         """Test workflow suggestion for low complexity."""
         context = ProjectContext(
@@ -387,6 +432,83 @@ dependencies = [
         assert context.has_git is True
         assert "vite" in context.build_tools
 
+    def test_detect_project_context_reads_root_once(self, tmp_path):
+        """Test every detector shares a single read of the project root."""
+        project_dir = tmp_path / "scanned_once"
+        project_dir.mkdir()
+        (project_dir / "package.json").write_text(json.dumps({"dependencies": {"express": "^4.0.0"}}))
+        (project_dir / "Dockerfile").touch()
+
+        with patch('core.project_detector._scan_root', wraps=_scan_root) as mock_scan:
+            context = detect_project_context(str(project_dir))
+
+        assert context.backend == "express"
+        assert context.build_tools == ["docker"]
+        mock_scan.assert_called_once_with(project_dir)
+
+    def test_detect_project_context_reads_package_json_once(self, tmp_path):
+        """Test framework and backend detection share one package.json parse."""
+        project_dir = tmp_path / "fullstack"
+        project_dir.mkdir()
+        (project_dir / "package.json").write_text(
+            json.dumps({"dependencies": {"react": "^18.0.0", "express": "^4.0.0"}})
+        )
+
+        with patch('builtins.open', wraps=open) as mock_open:
+            context = detect_project_context(str(project_dir))
+
+        assert context.framework == "react"
+        assert context.backend == "express"
+        package_json_opens = [c for c in mock_open.call_args_list if c.args[0] == project_dir / "package.json"]
+        assert len(package_json_opens) == 1
+
+    def test_detect_project_context_cached_until_manifest_changes(self, tmp_path):
+        """Test repeat detection is served from cache until package.json changes."""
+        project_dir = tmp_path / "cached"
+        project_dir.mkdir()
+        package_json = project_dir / "package.json"
+        package_json.write_text(json.dumps({"dependencies": {"react": "^18.0.0"}}))
+
+        first = detect_project_context(str(project_dir))
+        with patch('core.project_detector._scan_root') as mock_scan:
+            second = detect_project_context(str(project_dir))
+        mock_scan.assert_not_called()
+        assert second == first
+
+        package_json.write_text(json.dumps({"dependencies": {"vue": "^3.0.0"}}))
+        os.utime(package_json, ns=(0, package_json.stat().st_mtime_ns + 1_000_000))
+
+        assert detect_project_context(str(project_dir)).framework == "vue"
+
+    def test_detect_project_context_cache_expires(self, tmp_path):
+        """Test cached contexts are re-detected once the TTL passes."""
+        project_dir = tmp_path / "expiring"
+        project_dir.mkdir()
+
+        with patch('core.project_detector.CONTEXT_CACHE_TTL_SECONDS', 0):
+            detect_project_context(str(project_dir))
+            with patch('core.project_detector._scan_root', wraps=_scan_root) as mock_scan:
+                detect_project_context(str(project_dir))
+
+        mock_scan.assert_called_once()
+
+    def test_detect_project_context_cache_is_bounded(self, tmp_path):
+        """Test the least recently used path is evicted once the cache is full."""
+        from core.project_detector import _context_cache
+
+        paths = []
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            paths.append(str((tmp_path / name).resolve()))
+
+        with patch('core.project_detector.CONTEXT_CACHE_MAX_ENTRIES', 2):
+            detect_project_context(paths[0])
+            detect_project_context(paths[1])
+            detect_project_context(paths[0])
+            detect_project_context(paths[2])
+
+        assert list(_context_cache) == [paths[0], paths[2]]
+
     def test_detect_project_context_nonexistent_path(self):
         """Test error when path doesn't exist."""
         with pytest.raises(ValueError) as exc_info:
@@ -0,0 +1,55 @@
+"""
+Tests for /api/export/query/stream endpoint
+"""
+
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from server import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Run from a temp directory holding db/database.db with a small table"""
+    (tmp_path / "db").mkdir()
+    conn = sqlite3.connect(tmp_path / "db" / "database.db")
+    conn.execute("CREATE TABLE numbers (id INTEGER, label TEXT)")
+    conn.executemany("INSERT INTO numbers VALUES (?, ?)", [(1, "one"), (2, "two")])
+    conn.commit()
+    conn.close()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_stream_export_csv(database):
+    """Test query results stream back as a CSV attachment"""
+    response = client.post(
+        "/api/export/query/stream",
+        json={"sql": "SELECT id, label FROM numbers ORDER BY id"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="query_results.csv"' in response.headers["content-disposition"]
+    assert response.text.splitlines() == ["id,label", "1,one", "2,two"]
+
+
+def test_stream_export_rejects_unsafe_sql(database):
+    """Test dangerous SQL is rejected with a 400 before streaming"""
+    response = client.post("/api/export/query/stream", json={"sql": "DROP TABLE numbers"})
+
+    assert response.status_code == 400
+    assert "Security error" in response.json()["detail"]
+
+
+def test_stream_export_missing_database(tmp_path, monkeypatch):
+    """Test a missing database file returns an error response, not a crash"""
+    monkeypatch.chdir(tmp_path)
+
+    response = client.post("/api/export/query/stream", json={"sql": "SELECT 1"})
+
+    assert response.status_code == 500
+    assert "Error exporting query results" in response.json()["detail"]
@@ -2,7 +2,9 @@ import pytest
 import sqlite3
 import pandas as pd
 from io import StringIO
-from core.export_utils import generate_csv_from_data, generate_csv_from_table
+import json
+from core.export_utils import generate_csv_from_data, generate_csv_from_table, stream_query_export
+from core.sql_security import SQLSecurityError
 
 
 class TestExportUtils:
@@ -60,6 +62,18 @@ class TestExportUtils:
         assert 'name' in df.columns
         assert len(df) == 2
         
+    def test_generate_csv_from_data_columnar(self):
+        """Test CSV generation from column-oriented data"""
+        data = {'id': [1, 2], 'name': ['Test 1', 'Test 2']}
+        
+        result = generate_csv_from_data(data, [])
+        
+        csv_str = result.decode('utf-8')
+        df = pd.read_csv(StringIO(csv_str))
+        
+        assert list(df.columns) == ['id', 'name']
+        assert df.iloc[1]['name'] == 'Test 2'
+        
     def test_generate_csv_from_data_various_types(self):
         """Test CSV generation with various data types"""
         data = [
@@ -215,4 +229,53 @@ class TestExportUtils:
         assert len(df) == 1
         assert df.iloc[0]['data'] == 'test data'
         
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+    @staticmethod
+    def _numbers_db(rows: int) -> sqlite3.Connection:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE numbers (id INTEGER, label TEXT)')
+        conn.executemany('INSERT INTO numbers VALUES (?, ?)', [(i, f'n{i}') for i in range(rows)])
+        conn.commit()
+        return conn
+
+    def test_stream_query_export_csv_in_batches(self):
+        """Test streamed CSV matches the full result, one chunk per batch plus header"""
+        conn = self._numbers_db(25)
+
+        chunks = list(stream_query_export(conn, 'SELECT id, label FROM numbers', 'csv', batch_size=10))
+
+        assert len(chunks) == 4
+        df = pd.read_csv(StringIO(b''.join(chunks).decode('utf-8')))
+        assert list(df.columns) == ['id', 'label']
+        assert len(df) == 25
+        assert df.iloc[24]['label'] == 'n24'
+
+    def test_stream_query_export_jsonl(self):
+        """Test streamed JSONL yields one object per row"""
+        conn = self._numbers_db(3)
+
+        lines = b''.join(stream_query_export(conn, 'SELECT * FROM numbers', 'jsonl')).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {'id': 0, 'label': 'n0'}, {'id': 1, 'label': 'n1'}, {'id': 2, 'label': 'n2'}
+        ]
+
+    def test_stream_query_export_closes_connection(self):
+        """Test the connection is closed once the stream is consumed"""
+        conn = self._numbers_db(1)
+        list(stream_query_export(conn, 'SELECT * FROM numbers'))
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+
+    def test_stream_query_export_rejects_before_streaming(self):
+        """Test unsafe SQL and bad formats fail before any output"""
+        conn = self._numbers_db(1)
+
+        with pytest.raises(SQLSecurityError):
+            stream_query_export(conn, 'DROP TABLE numbers')
+        with pytest.raises(ValueError):
+            stream_query_export(conn, 'SELECT * FROM numbers', 'parquet')
+
+        conn.close()
@@ -5,7 +5,7 @@ Tests the complete workflow from natural language input to formatted issue.
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from core.nl_processor import process_request
 from core.project_detector import detect_project_context
 from core.github_poster import GitHubPoster
@@ -72,23 +72,20 @@ class TestNLWorkflowIntegration:
         assert "vite" in context.build_tools
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_nl_to_issue_workflow(self, mock_anthropic_class, sample_project_dir, mock_anthropic_responses):
         """Test complete workflow from NL input to GitHub issue."""
         # Setup mocks
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        # Mock intent analysis response
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps(mock_anthropic_responses["intent"])
-
-        # Mock requirements extraction response
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps(mock_anthropic_responses["requirements"])
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": mock_anthropic_responses["intent"],
+            "requirements": mock_anthropic_responses["requirements"]
+        })
 
-        # Configure mock to return different responses on subsequent calls
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         # Step 1: Detect project context
         project_context = detect_project_context(str(sample_project_dir))
@@ -114,28 +111,28 @@ class TestNLWorkflowIntegration:
         assert any(req in issue.body for req in mock_anthropic_responses["requirements"])
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_bug_report_workflow(self, mock_anthropic_class, sample_project_dir):
         """Test workflow for bug reports."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Mock bug intent
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "bug",
-            "summary": "Login button not responding to clicks",
-            "technical_area": "authentication"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "bug",
+                "summary": "Login button not responding to clicks",
+                "technical_area": "authentication"
+            },
+            "requirements": [
+                "Investigate click event handlers",
+                "Check for JavaScript errors in console",
+                "Test button functionality"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Investigate click event handlers",
-            "Check for JavaScript errors in console",
-            "Test button functionality"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_context = detect_project_context(str(sample_project_dir))
 
@@ -148,27 +145,27 @@ class TestNLWorkflowIntegration:
         assert "bug" in issue.labels
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_chore_workflow(self, mock_anthropic_class, sample_project_dir):
         """Test workflow for chore tasks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "chore",
-            "summary": "Update project dependencies",
-            "technical_area": "maintenance"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "chore",
+                "summary": "Update project dependencies",
+                "technical_area": "maintenance"
+            },
+            "requirements": [
+                "Update npm packages to latest versions",
+                "Run tests to ensure compatibility",
+                "Update documentation if needed"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Update npm packages to latest versions",
-            "Run tests to ensure compatibility",
-            "Update documentation if needed"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_context = detect_project_context(str(sample_project_dir))
 
@@ -192,7 +189,7 @@ class TestNLWorkflowIntegration:
         assert context.framework is None
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_high_complexity_workflow(self, mock_anthropic_class, tmp_path):
         """Test workflow with high complexity project."""
         # Create a complex project structure
@@ -228,24 +225,24 @@ dependencies = [
         (complex_project / "packages").mkdir()
 
         # Mock Anthropic responses
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Add real-time collaboration feature",
-            "technical_area": "realtime"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Add real-time collaboration feature",
+                "technical_area": "realtime"
+            },
+            "requirements": [
+                "Implement WebSocket connection",
+                "Add operational transformation",
+                "Create collaborative editing UI"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Implement WebSocket connection",
-            "Add operational transformation",
-            "Create collaborative editing UI"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         # Detect context
         context = detect_project_context(str(complex_project))
@@ -261,10 +258,10 @@ dependencies = [
         assert issue.model_set == "heavy"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_error_propagation(self, mock_anthropic_class, sample_project_dir):
         """Test that errors propagate correctly through the workflow."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Simulate API error
@@ -319,7 +316,7 @@ dependencies = [
         # This is tested in the full workflow test above
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_workflow_with_missing_api_key(self, mock_anthropic_class, sample_project_dir):
         """Test workflow fails gracefully without API key."""
         project_context = detect_project_context(str(sample_project_dir))
@@ -106,11 +106,10 @@ def override_workflow(issue: GitHubIssue, workflow: str, model_set: str) -> GitH
         model_set: Custom model set
 
     Returns:
-        Modified GitHubIssue object
+        Copy of the GitHubIssue with the override applied
     """
     print(f"  Original: {issue.workflow} model_set {issue.model_set}")
-    issue.workflow = workflow
-    issue.model_set = model_set
+    issue = issue.model_copy(update={"workflow": workflow, "model_set": model_set})
     print(f"  Override: {issue.workflow} model_set {issue.model_set}")
     return issue
 
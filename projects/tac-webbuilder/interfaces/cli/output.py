@@ -1,5 +1,6 @@
 """Rich terminal output formatting utilities for CLI."""
 
+from functools import lru_cache
 from typing import Any, Optional
 from rich.console import Console
 from rich.panel import Panel
@@ -100,10 +101,23 @@ def print_table(table: Table) -> None:
     console.print(table)
 
 
+@lru_cache(maxsize=32)
+def _parse_markdown(content: str) -> Markdown:
+    """Parsed Markdown renderable; repeat displays of the same content skip the parse."""
+    return Markdown(content)
+
+
 def show_markdown(content: str) -> None:
-    """Display markdown-formatted content."""
-    md = Markdown(content)
-    console.print(md)
+    """
+    Display markdown-formatted content.
+
+    When output is not a terminal the markdown source is written as-is,
+    skipping the parse and render.
+    """
+    if not console.is_terminal:
+        console.out(content, highlight=False)
+        return
+    console.print(_parse_markdown(content))
 
 
 def show_syntax(
@@ -0,0 +1,105 @@
+"""
+Project context detection for the web API.
+
+Shared by request previews (state.py) and the project registry
+(routes/projects.py), which each used to carry their own copy.
+"""
+
+import logging
+import os
+import subprocess
+from pathlib import Path
+
+from interfaces.web.models import ProjectContext
+
+logger = logging.getLogger(__name__)
+
+
+def detect_project_context(project_path: Path) -> ProjectContext:
+    """
+    Detect project context and metadata.
+
+    The project root is listed once and every marker file is looked up in
+    that listing, rather than stat'ing each candidate path.
+
+    Args:
+        project_path: Path to project directory
+
+    Returns:
+        ProjectContext with detected information
+    """
+    try:
+        with os.scandir(project_path) as entries:
+            root_names = frozenset(entry.name for entry in entries)
+    except OSError:
+        root_names = frozenset()
+
+    project_name = project_path.name
+    framework = None
+    language = None
+    tech_stack = []
+    build_tools = []
+    test_frameworks = []
+    has_git = ".git" in root_names
+    repo_url = None
+
+    # Detect based on files present
+    if "package.json" in root_names:
+        tech_stack.append("Node.js")
+        build_tools.append("npm")
+        language = "JavaScript/TypeScript"
+
+    if "pyproject.toml" in root_names:
+        tech_stack.append("Python")
+        build_tools.append("uv")
+        language = "Python"
+
+    if "requirements.txt" in root_names:
+        tech_stack.append("Python")
+        build_tools.append("pip")
+        language = "Python"
+
+    if "Cargo.toml" in root_names:
+        tech_stack.append("Rust")
+        build_tools.append("cargo")
+        language = "Rust"
+
+    # Detect frameworks
+    if "vite.config.ts" in root_names:
+        framework = "Vite"
+    elif "next.config.js" in root_names:
+        framework = "Next.js"
+
+    # Detect test frameworks
+    if "pytest.ini" in root_names or "pyproject.toml" in root_names:
+        test_frameworks.append("pytest")
+
+    if "vitest.config.ts" in root_names:
+        test_frameworks.append("vitest")
+
+    # Get repo URL if Git repo
+    if has_git:
+        try:
+            result = subprocess.run(
+                ["git", "config", "--get", "remote.origin.url"],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                repo_url = result.stdout.strip()
+        except Exception as e:
+            logger.warning(f"Failed to get repo URL: {e}")
+
+    return ProjectContext(
+        project_path=str(project_path),
+        project_name=project_name,
+        framework=framework,
+        language=language,
+        tech_stack=tech_stack,
+        build_tools=build_tools,
+        test_frameworks=test_frameworks,
+        has_git=has_git,
+        repo_url=repo_url,
+    )
@@ -17,6 +17,7 @@ from interfaces.web.models import (
     ProjectListResponse,
     ProjectSummary,
 )
+from interfaces.web.project_context import detect_project_context
 
 logger = logging.getLogger(__name__)
 
@@ -66,84 +67,6 @@ def _save_projects():
         logger.error(f"Failed to save projects: {e}")
 
 
-def _detect_project_context(project_path: Path) -> ProjectContext:
-    """
-    Detect project context (duplicated from state.py for now).
-
-    TODO: Move to shared utility module.
-    """
-    project_name = project_path.name
-    framework = None
-    language = None
-    tech_stack = []
-    build_tools = []
-    test_frameworks = []
-    has_git = (project_path / ".git").exists()
-    repo_url = None
-
-    # Detect based on files present
-    if (project_path / "package.json").exists():
-        tech_stack.append("Node.js")
-        build_tools.append("npm")
-        language = "JavaScript/TypeScript"
-
-    if (project_path / "pyproject.toml").exists():
-        tech_stack.append("Python")
-        build_tools.append("uv")
-        language = "Python"
-
-    if (project_path / "requirements.txt").exists():
-        tech_stack.append("Python")
-        build_tools.append("pip")
-        language = "Python"
-
-    if (project_path / "Cargo.toml").exists():
-        tech_stack.append("Rust")
-        build_tools.append("cargo")
-        language = "Rust"
-
-    # Detect frameworks
-    if (project_path / "vite.config.ts").exists():
-        framework = "Vite"
-    elif (project_path / "next.config.js").exists():
-        framework = "Next.js"
-
-    # Detect test frameworks
-    if (project_path / "pytest.ini").exists() or (project_path / "pyproject.toml").exists():
-        test_frameworks.append("pytest")
-
-    if (project_path / "vitest.config.ts").exists():
-        test_frameworks.append("vitest")
-
-    # Get repo URL if Git repo
-    if has_git:
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                repo_url = result.stdout.strip()
-        except Exception as e:
-            logger.warning(f"Failed to get repo URL: {e}")
-
-    return ProjectContext(
-        project_path=str(project_path),
-        project_name=project_name,
-        framework=framework,
-        language=language,
-        tech_stack=tech_stack,
-        build_tools=build_tools,
-        test_frameworks=test_frameworks,
-        has_git=has_git,
-        repo_url=repo_url,
-    )
-
-
 @router.get(
     "/projects",
     response_model=ProjectListResponse,
@@ -220,7 +143,7 @@ async def add_project(req: AddProjectModel) -> ProjectContext:
             raise ValueError(f"Project path is not a directory: {req.project_path}")
 
         # Detect project context
-        context = _detect_project_context(project_path)
+        context = detect_project_context(project_path)
 
         # Generate project ID
         project_id = project_path.name.lower().replace(" ", "-")
@@ -16,6 +16,7 @@ from interfaces.web.models import (
     ProjectContext,
     RequestPreviewResponse,
 )
+from interfaces.web.project_context import detect_project_context
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +65,7 @@ class RequestState:
             resolved_path = Path.cwd()
 
         # Detect project context
-        project_context = self._detect_project_context(resolved_path)
+        project_context = detect_project_context(resolved_path)
 
         # Generate GitHub issue preview
         github_issue = self._generate_issue_preview(nl_input, project_context)
@@ -182,89 +183,6 @@ class RequestState:
         if old_requests:
             logger.info(f"Cleaned up {len(old_requests)} old requests")
 
-    def _detect_project_context(self, project_path: Path) -> ProjectContext:
-        """
-        Detect project context and metadata.
-
-        Args:
-            project_path: Path to project directory
-
-        Returns:
-            ProjectContext with detected information
-        """
-        # Simple detection logic
-        # TODO: Integrate with core/project_detector.py when available
-        project_name = project_path.name
-        framework = None
-        language = None
-        tech_stack = []
-        build_tools = []
-        test_frameworks = []
-        has_git = (project_path / ".git").exists()
-        repo_url = None
-
-        # Detect based on files present
-        if (project_path / "package.json").exists():
-            tech_stack.append("Node.js")
-            build_tools.append("npm")
-            language = "JavaScript/TypeScript"
-
-        if (project_path / "pyproject.toml").exists():
-            tech_stack.append("Python")
-            build_tools.append("uv")
-            language = "Python"
-
-        if (project_path / "requirements.txt").exists():
-            tech_stack.append("Python")
-            build_tools.append("pip")
-            language = "Python"
-
-        if (project_path / "Cargo.toml").exists():
-            tech_stack.append("Rust")
-            build_tools.append("cargo")
-            language = "Rust"
-
-        # Detect frameworks
-        if (project_path / "vite.config.ts").exists():
-            framework = "Vite"
-        elif (project_path / "next.config.js").exists():
-            framework = "Next.js"
-
-        # Detect test frameworks
-        if (project_path / "pytest.ini").exists() or (project_path / "pyproject.toml").exists():
-            test_frameworks.append("pytest")
-
-        if (project_path / "vitest.config.ts").exists():
-            test_frameworks.append("vitest")
-
-        # Get repo URL if Git repo
-        if has_git:
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["git", "config", "--get", "remote.origin.url"],
-                    cwd=project_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    repo_url = result.stdout.strip()
-            except Exception as e:
-                logger.warning(f"Failed to get repo URL: {e}")
-
-        return ProjectContext(
-            project_path=str(project_path),
-            project_name=project_name,
-            framework=framework,
-            language=language,
-            tech_stack=tech_stack,
-            build_tools=build_tools,
-            test_frameworks=test_frameworks,
-            has_git=has_git,
-            repo_url=repo_url,
-        )
-
     def _generate_issue_preview(
         self,
         nl_input: str,
@@ -284,17 +202,17 @@ class RequestState:
         # TODO: Integrate with core/nl_processor.py and core/issue_formatter.py when available
 
         # Extract potential title (first line or first sentence)
-        lines = nl_input.strip().split("\n")
-        first_line = lines[0].strip()
+        # partition splits once; the rest of the input is never broken into lines
+        first_line, newline, rest = nl_input.strip().partition("\n")
+        first_line = first_line.strip()
 
         # Use first line as title if short, otherwise create a title
-        if len(first_line) < 80 and len(lines) > 1:
+        if len(first_line) < 80 and newline:
             title = first_line
-            description = "\n".join(lines[1:]).strip()
+            description = rest.strip()
         else:
             # Extract first sentence as title
-            sentences = nl_input.split(".")
-            title = sentences[0].strip() if sentences else nl_input[:80]
+            title = nl_input.partition(".")[0].strip()
             description = nl_input
 
         # Format body
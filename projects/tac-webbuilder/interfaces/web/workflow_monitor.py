@@ -7,6 +7,7 @@ reads their state, and provides status information for the web API.
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -57,11 +58,12 @@ class WorkflowMonitor:
         workflows = []
 
         try:
-            # Scan agents directory for workflow directories
-            for workflow_dir in self.agents_dir.iterdir():
-                if not workflow_dir.is_dir():
-                    continue
+            # Scan agents directory for workflow directories; DirEntry.is_dir()
+            # uses the type readdir already returned instead of a stat per entry
+            with os.scandir(self.agents_dir) as entries:
+                workflow_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
+            for workflow_dir in workflow_dirs:
                 try:
                     # Try to read workflow state
                     state = self._read_workflow_state(workflow_dir)
@@ -2,12 +2,36 @@
 
 import pytest
 import json
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 from tests.fixtures import api_responses, project_samples
 
 
+@pytest.fixture(autouse=True)
+def fresh_analysis_memo():
+    """
+    Claude analyses are memoized per process; start every test with none.
+
+    Only suites that import core.nl_processor have a memo to clear, and the
+    interfaces tests run without the server package on the path.
+    """
+    nl_processor = sys.modules.get("core.nl_processor")
+    if nl_processor is not None:
+        nl_processor._analysis_memo.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def fresh_context_cache():
+    """Detected project contexts are cached per process; start every test with none."""
+    project_detector = sys.modules.get("core.project_detector")
+    if project_detector is not None:
+        project_detector.clear_context_cache()
+    yield
+
+
 @pytest.fixture
 def mock_anthropic_client():
     """Create a mock Anthropic client for testing."""
@@ -1,10 +1,11 @@
 import pytest
 import os
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from core.nl_processor import (
     analyze_intent,
     extract_requirements,
+    analyze_and_extract,
     classify_issue_type,
     suggest_adw_workflow,
     process_request
@@ -16,10 +17,10 @@ from tests.fixtures import api_responses
 class TestNLProcessor:
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_feature(self, mock_anthropic_class):
         """Test analyzing intent for a feature request."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -39,10 +40,10 @@ class TestNLProcessor:
             mock_client.messages.create.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_bug(self, mock_anthropic_class):
         """Test analyzing intent for a bug report."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -61,10 +62,10 @@ class TestNLProcessor:
             assert result["technical_area"] == "authentication"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_clean_markdown(self, mock_anthropic_class):
         """Test that markdown code blocks are cleaned from responses."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -89,10 +90,10 @@ class TestNLProcessor:
             assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_api_error(self, mock_anthropic_class):
         """Test handling of API errors."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
         mock_client.messages.create.side_effect = Exception("API Error")
 
@@ -152,6 +153,40 @@ class TestNLProcessor:
 
             assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_analyze_and_extract_single_call(self, mock_anthropic_class):
+        """Test intent and requirements come back from one API call."""
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.content[0].text = '```json\n' + json.dumps({
+            "intent": {
+                "intent_type": "bug",
+                "summary": "Fix login button",
+                "technical_area": "UI"
+            },
+            "requirements": ["Fix click handler", "Add regression test"]
+        }) + '\n```'
+        mock_client.messages.create.return_value = mock_response
+
+        with patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            intent, requirements = await analyze_and_extract("Login button is broken")
+
+            assert intent["intent_type"] == "bug"
+            assert requirements == ["Fix click handler", "Add regression test"]
+            mock_client.messages.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_analyze_and_extract_no_api_key(self):
+        """Test error when API key is missing."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(Exception) as exc_info:
+                await analyze_and_extract("Add dark mode")
+
+            assert "ANTHROPIC_API_KEY environment variable not set" in str(exc_info.value)
+
     def test_classify_issue_type_feature(self):
         """Test classifying a feature request."""
         intent = {"intent_type": "feature", "summary": "Add dark mode"}
@@ -207,23 +242,21 @@ class TestNLProcessor:
         assert model_set == "heavy"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_success(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_success(self, mock_analyze):
         """Test end-to-end request processing."""
-        # Mock the async function - use AsyncMock or return the dict directly
-
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Add dark mode",
-            "technical_area": "UI"
-        }
-
-        mock_extract.return_value = [
-            "Create theme toggle component",
-            "Add CSS variables for light/dark themes",
-            "Persist theme preference in localStorage"
-        ]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Add dark mode",
+                "technical_area": "UI"
+            },
+            [
+                "Create theme toggle component",
+                "Add CSS variables for light/dark themes",
+                "Persist theme preference in localStorage"
+            ]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -245,7 +278,7 @@ class TestNLProcessor:
         assert "## Requirements" in result.body
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
+    @patch('core.nl_processor.analyze_and_extract')
     async def test_process_request_error_handling(self, mock_analyze):
         """Test error handling in process_request."""
         mock_analyze.side_effect = Exception("API Error")
@@ -266,10 +299,10 @@ class TestNLProcessorEdgeCases:
     """Comprehensive edge case tests for NL Processor."""
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_empty_input(self, mock_anthropic_class):
         """Test handling of empty string input."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -282,10 +315,10 @@ class TestNLProcessorEdgeCases:
             assert "intent_type" in result
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_very_long_input(self, mock_anthropic_class):
         """Test handling of extremely long input."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -299,10 +332,10 @@ class TestNLProcessorEdgeCases:
             assert result["intent_type"] in ["feature", "bug", "chore"]
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_unicode_characters(self, mock_anthropic_class):
         """Test handling of Unicode characters and emojis."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -317,10 +350,10 @@ class TestNLProcessorEdgeCases:
             assert result["technical_area"] == "i18n"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_special_characters(self, mock_anthropic_class):
         """Test handling of special characters and markdown."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -334,10 +367,10 @@ class TestNLProcessorEdgeCases:
             assert "intent_type" in result
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_whitespace_only(self, mock_anthropic_class):
         """Test handling of whitespace-only input."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -351,10 +384,10 @@ class TestNLProcessorEdgeCases:
             assert "intent_type" in result
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_malformed_json_response(self, mock_anthropic_class):
         """Test handling of malformed JSON in API response."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -367,10 +400,10 @@ class TestNLProcessorEdgeCases:
             assert "Error analyzing intent" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_response_with_extra_whitespace(self, mock_anthropic_class):
         """Test cleaning of extra whitespace in API response."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -382,10 +415,10 @@ class TestNLProcessorEdgeCases:
             assert result["intent_type"] == "feature"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_nested_markdown_blocks(self, mock_anthropic_class):
         """Test cleaning of nested markdown code blocks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -398,10 +431,10 @@ class TestNLProcessorEdgeCases:
             assert result["intent_type"] == "feature"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_xss_attempt(self, mock_anthropic_class):
         """Test handling of potential XSS injection attempts."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -416,10 +449,10 @@ class TestNLProcessorEdgeCases:
             assert "intent_type" in result
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_sql_injection_attempt(self, mock_anthropic_class):
         """Test handling of potential SQL injection attempts."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -546,16 +579,17 @@ class TestNLProcessorEdgeCases:
         assert model_set == expected_model
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_with_no_framework(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_with_no_framework(self, mock_analyze):
         """Test processing with no framework detected."""
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Add feature",
-            "technical_area": "general"
-        }
-        mock_extract.return_value = ["Requirement 1"]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Add feature",
+                "technical_area": "general"
+            },
+            ["Requirement 1"]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -570,16 +604,17 @@ class TestNLProcessorEdgeCases:
         assert "general" in result.labels
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_with_backend(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_with_backend(self, mock_analyze):
         """Test processing with backend framework."""
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Add API endpoint",
-            "technical_area": "API"
-        }
-        mock_extract.return_value = ["Create REST endpoint", "Add validation"]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Add API endpoint",
+                "technical_area": "API"
+            },
+            ["Create REST endpoint", "Add validation"]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -594,16 +629,10 @@ class TestNLProcessorEdgeCases:
         assert "react-vite" in result.labels
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_extract_requirements_error(self, mock_extract, mock_analyze):
-        """Test error handling when requirement extraction fails."""
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Add feature",
-            "technical_area": "general"
-        }
-        mock_extract.side_effect = Exception("Extraction failed")
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_analysis_error(self, mock_analyze):
+        """Test error handling when the combined analysis call fails."""
+        mock_analyze.side_effect = Exception("Extraction failed")
 
         project_context = ProjectContext(
             path="/test/project",
@@ -616,16 +645,17 @@ class TestNLProcessorEdgeCases:
         assert "Error processing NL request" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_empty_requirements(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_empty_requirements(self, mock_analyze):
         """Test processing with empty requirements list."""
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "summary": "Simple task",
-            "technical_area": "general"
-        }
-        mock_extract.return_value = []
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "summary": "Simple task",
+                "technical_area": "general"
+            },
+            []
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -638,16 +668,17 @@ class TestNLProcessorEdgeCases:
         assert "## Requirements" in result.body
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_missing_summary(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_missing_summary(self, mock_analyze):
         """Test processing when summary is missing from intent."""
-        mock_analyze.return_value = {
-            "intent_type": "feature",
-            "technical_area": "general"
-            # summary is missing
-        }
-        mock_extract.return_value = ["Requirement 1"]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "feature",
+                "technical_area": "general"
+                # summary is missing
+            },
+            ["Requirement 1"]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
@@ -661,16 +692,17 @@ class TestNLProcessorEdgeCases:
         assert len(result.title) <= 100
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.analyze_intent')
-    @patch('core.nl_processor.extract_requirements')
-    async def test_process_request_missing_technical_area(self, mock_extract, mock_analyze):
+    @patch('core.nl_processor.analyze_and_extract')
+    async def test_process_request_missing_technical_area(self, mock_analyze):
         """Test processing when technical_area is missing from intent."""
-        mock_analyze.return_value = {
-            "intent_type": "chore",
-            "summary": "Update dependencies"
-            # technical_area is missing
-        }
-        mock_extract.return_value = ["Update package.json"]
+        mock_analyze.return_value = (
+            {
+                "intent_type": "chore",
+                "summary": "Update dependencies"
+                # technical_area is missing
+            },
+            ["Update package.json"]
+        )
 
         project_context = ProjectContext(
             path="/test/project",
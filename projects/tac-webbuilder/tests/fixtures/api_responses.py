@@ -36,6 +36,12 @@ REQUIREMENTS_DARKMODE_RESPONSE = json.dumps([
     "Update all components to respect theme"
 ])
 
+# Combined intent + requirements response (analyze_and_extract)
+ANALYSIS_FEATURE_RESPONSE = json.dumps({
+    "intent": json.loads(INTENT_FEATURE_RESPONSE),
+    "requirements": json.loads(REQUIREMENTS_AUTH_RESPONSE)
+})
+
 # Responses with markdown code blocks (should be cleaned)
 INTENT_WITH_MARKDOWN = f"""```json
 {INTENT_FEATURE_RESPONSE}
@@ -126,6 +126,22 @@ class TestMarkdownDisplay:
         show_markdown(markdown_content)
         mock_console.print.assert_called_once()
 
+    def test_show_markdown_reuses_parsed_content(self, mock_console):
+        """Test repeated content is parsed once."""
+        show_markdown("# Cached heading")
+        show_markdown("# Cached heading")
+
+        first, second = (call.args[0] for call in mock_console.print.call_args_list)
+        assert first is second
+
+    def test_show_markdown_writes_source_when_not_a_terminal(self, mock_console):
+        """Test piped output skips markdown rendering."""
+        mock_console.is_terminal = False
+        show_markdown("# Piped heading")
+
+        mock_console.out.assert_called_once_with("# Piped heading", highlight=False)
+        mock_console.print.assert_not_called()
+
 
 class TestSyntaxDisplay:
     """Test syntax highlighting functions."""
@@ -0,0 +1,29 @@
+"""Tests for web project context detection."""
+
+from interfaces.web.project_context import detect_project_context
+
+
+def test_detect_python_project(tmp_path):
+    """Test detecting a Python project from its root files."""
+    (tmp_path / "pyproject.toml").touch()
+    (tmp_path / "vite.config.ts").touch()
+
+    context = detect_project_context(tmp_path)
+
+    assert context.project_name == tmp_path.name
+    assert context.language == "Python"
+    assert context.tech_stack == ["Python"]
+    assert context.build_tools == ["uv"]
+    assert context.framework == "Vite"
+    assert context.test_frameworks == ["pytest"]
+    assert context.has_git is False
+    assert context.repo_url is None
+
+
+def test_detect_missing_directory(tmp_path):
+    """Test a missing directory yields an empty context instead of an error."""
+    context = detect_project_context(tmp_path / "missing")
+
+    assert context.language is None
+    assert context.tech_stack == []
+    assert context.has_git is False
@@ -11,7 +11,7 @@ These tests measure and validate performance characteristics:
 import pytest
 import time
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from core.nl_processor import analyze_intent, extract_requirements, process_request
 from core.project_detector import detect_project_context
 from core.issue_formatter import create_feature_issue_body
@@ -23,10 +23,10 @@ class TestNLProcessorPerformance:
     """Performance tests for NL processor functions."""
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_small_input_performance(self, mock_anthropic_class):
         """Test performance with small input (<100 chars)."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -45,10 +45,10 @@ class TestNLProcessorPerformance:
             assert result is not None
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_medium_input_performance(self, mock_anthropic_class):
         """Test performance with medium input (100-1000 chars)."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -66,10 +66,10 @@ class TestNLProcessorPerformance:
             assert result is not None
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_analyze_intent_large_input_performance(self, mock_anthropic_class):
         """Test performance with large input (1000-10000 chars)."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -298,20 +298,17 @@ class TestEndToEndPerformance:
     """End-to-end performance tests."""
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_complete_workflow_performance(self, mock_anthropic_class, tmp_path):
         """Test complete workflow performance from NL to issue."""
         # Setup
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = api_responses.INTENT_FEATURE_RESPONSE
-
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = api_responses.REQUIREMENTS_AUTH_RESPONSE
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = api_responses.ANALYSIS_FEATURE_RESPONSE
 
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         # Create project
         project_dir = tmp_path / "project"
@@ -340,24 +337,17 @@ class TestEndToEndPerformance:
         assert issue.title is not None
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_concurrent_requests_performance(self, mock_anthropic_class, tmp_path):
         """Test performance of multiple concurrent requests."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = api_responses.INTENT_FEATURE_RESPONSE
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = api_responses.ANALYSIS_FEATURE_RESPONSE
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = api_responses.REQUIREMENTS_AUTH_RESPONSE
-
-        # Setup for multiple calls
-        mock_client.messages.create.side_effect = [
-            intent_response, requirements_response,
-            intent_response, requirements_response,
-            intent_response, requirements_response
-        ]
+        # One Claude call per request
+        mock_client.messages.create.side_effect = [analysis_response] * 3
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
@@ -405,10 +395,10 @@ class TestMemoryPerformance:
         assert len(body) > 10000  # Should be a large document
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_many_api_calls_memory(self, mock_anthropic_class):
         """Test that many API calls don't accumulate memory."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         mock_response = MagicMock()
@@ -5,7 +5,7 @@ Tests the complete workflow from natural language input to formatted issue.
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from core.nl_processor import process_request
 from core.project_detector import detect_project_context
 from core.github_poster import GitHubPoster
@@ -72,23 +72,20 @@ class TestNLWorkflowIntegration:
         assert "vite" in context.build_tools
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_nl_to_issue_workflow(self, mock_anthropic_class, sample_project_dir, mock_anthropic_responses):
         """Test complete workflow from NL input to GitHub issue."""
         # Setup mocks
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        # Mock intent analysis response
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps(mock_anthropic_responses["intent"])
-
-        # Mock requirements extraction response
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps(mock_anthropic_responses["requirements"])
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": mock_anthropic_responses["intent"],
+            "requirements": mock_anthropic_responses["requirements"]
+        })
 
-        # Configure mock to return different responses on subsequent calls
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         # Step 1: Detect project context
         project_context = detect_project_context(str(sample_project_dir))
@@ -114,28 +111,28 @@ class TestNLWorkflowIntegration:
         assert any(req in issue.body for req in mock_anthropic_responses["requirements"])
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_bug_report_workflow(self, mock_anthropic_class, sample_project_dir):
         """Test workflow for bug reports."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Mock bug intent
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "bug",
-            "summary": "Login button not responding to clicks",
-            "technical_area": "authentication"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "bug",
+                "summary": "Login button not responding to clicks",
+                "technical_area": "authentication"
+            },
+            "requirements": [
+                "Investigate click event handlers",
+                "Check for JavaScript errors in console",
+                "Test button functionality"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Investigate click event handlers",
-            "Check for JavaScript errors in console",
-            "Test button functionality"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_context = detect_project_context(str(sample_project_dir))
 
@@ -148,27 +145,27 @@ class TestNLWorkflowIntegration:
         assert "bug" in issue.labels
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_chore_workflow(self, mock_anthropic_class, sample_project_dir):
         """Test workflow for chore tasks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "chore",
-            "summary": "Update project dependencies",
-            "technical_area": "maintenance"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "chore",
+                "summary": "Update project dependencies",
+                "technical_area": "maintenance"
+            },
+            "requirements": [
+                "Update npm packages to latest versions",
+                "Run tests to ensure compatibility",
+                "Update documentation if needed"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Update npm packages to latest versions",
-            "Run tests to ensure compatibility",
-            "Update documentation if needed"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_context = detect_project_context(str(sample_project_dir))
 
@@ -192,7 +189,7 @@ class TestNLWorkflowIntegration:
         assert context.framework is None
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_high_complexity_workflow(self, mock_anthropic_class, tmp_path):
         """Test workflow with high complexity project."""
         # Create a complex project structure
@@ -228,24 +225,24 @@ dependencies = [
         (complex_project / "packages").mkdir()
 
         # Mock Anthropic responses
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Add real-time collaboration feature",
-            "technical_area": "realtime"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Add real-time collaboration feature",
+                "technical_area": "realtime"
+            },
+            "requirements": [
+                "Implement WebSocket connection",
+                "Add operational transformation",
+                "Create collaborative editing UI"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Implement WebSocket connection",
-            "Add operational transformation",
-            "Create collaborative editing UI"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         # Detect context
         context = detect_project_context(str(complex_project))
@@ -261,10 +258,10 @@ dependencies = [
         assert issue.model_set == "heavy"
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_error_propagation(self, mock_anthropic_class, sample_project_dir):
         """Test that errors propagate correctly through the workflow."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Simulate API error
@@ -319,7 +316,7 @@ dependencies = [
         # This is tested in the full workflow test above
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_workflow_with_missing_api_key(self, mock_anthropic_class, sample_project_dir):
         """Test workflow fails gracefully without API key."""
         project_context = detect_project_context(str(sample_project_dir))
@@ -336,27 +333,21 @@ class TestNLWorkflowFailureScenarios:
     """Test failure scenarios and edge cases in the NL workflow integration."""
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
-    async def test_partial_api_failure_intent_succeeds_requirements_fails(
+    @patch('core.nl_processor.AsyncAnthropic')
+    async def test_partial_api_response_missing_intent(
         self, mock_anthropic_class, tmp_path
     ):
-        """Test partial failure where intent analysis succeeds but requirement extraction fails."""
-        mock_client = MagicMock()
+        """Test partial failure where the analysis reply has requirements but no intent."""
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        # First call succeeds (intent)
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Add feature",
-            "technical_area": "general"
+        # Reply parses, but the intent half is missing
+        partial_response = MagicMock()
+        partial_response.content[0].text = json.dumps({
+            "requirements": ["Requirement 1"]
         })
 
-        # Second call fails (requirements)
-        mock_client.messages.create.side_effect = [
-            intent_response,
-            Exception("Requirements API timeout")
-        ]
+        mock_client.messages.create.return_value = partial_response
 
         # Create project
         project_dir = tmp_path / "project"
@@ -373,14 +364,14 @@ class TestNLWorkflowFailureScenarios:
         with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
             with pytest.raises(Exception) as exc_info:
                 await process_request("Add feature", context)
-            # Should propagate the requirement extraction error
+            # Should propagate the analysis error
             assert "Error processing NL request" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_malformed_api_response_recovery(self, mock_anthropic_class, tmp_path):
         """Test handling of malformed JSON in API responses."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         intent_response = MagicMock()
@@ -404,23 +395,23 @@ class TestNLWorkflowFailureScenarios:
             assert "Error processing NL request" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_empty_requirements_list_handling(self, mock_anthropic_class, tmp_path):
         """Test workflow when API returns empty requirements list."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "chore",
-            "summary": "Simple maintenance task",
-            "technical_area": "maintenance"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "chore",
+                "summary": "Simple maintenance task",
+                "technical_area": "maintenance"
+            },
+            "requirements": []
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
@@ -438,10 +429,10 @@ class TestNLWorkflowFailureScenarios:
             assert "## Requirements" in issue.body
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_api_rate_limit_error(self, mock_anthropic_class, tmp_path):
         """Test handling of API rate limit errors."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Simulate rate limit error
@@ -463,25 +454,25 @@ class TestNLWorkflowFailureScenarios:
             assert "Error processing NL request" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_very_long_input_handling(self, mock_anthropic_class, tmp_path):
         """Test handling of very long NL input."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Complex feature with many requirements",
-            "technical_area": "fullstack"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Complex feature with many requirements",
+                "technical_area": "fullstack"
+            },
+            "requirements": [
+                f"Requirement {i}" for i in range(100)
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            f"Requirement {i}" for i in range(100)
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
@@ -509,27 +500,27 @@ class TestNLWorkflowFailureScenarios:
             detect_project_context(str(non_existent_dir))
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_unicode_in_nl_input(self, mock_anthropic_class, tmp_path):
         """Test workflow with Unicode characters in input."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Add emoji support 🎉 and i18n",
-            "technical_area": "i18n"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Add emoji support 🎉 and i18n",
+                "technical_area": "i18n"
+            },
+            "requirements": [
+                "Support Unicode characters (中文, 日本語)",
+                "Add emoji picker 🎨",
+                "Implement RTL languages"
+            ]
         })
 
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps([
-            "Support Unicode characters (中文, 日本語)",
-            "Add emoji picker 🎨",
-            "Implement RTL languages"
-        ])
-
-        mock_client.messages.create.side_effect = [intent_response, requirements_response]
+        mock_client.messages.create.return_value = analysis_response
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
@@ -548,34 +539,34 @@ class TestNLWorkflowFailureScenarios:
             assert "🎉" in issue.title or "emoji" in issue.title.lower()
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_concurrent_workflow_isolation(self, mock_anthropic_class, tmp_path):
         """Test that concurrent workflows don't interfere with each other."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
         # Setup responses for two different requests
-        intent1 = MagicMock()
-        intent1.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Feature 1",
-            "technical_area": "UI"
+        analysis1 = MagicMock()
+        analysis1.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Feature 1",
+                "technical_area": "UI"
+            },
+            "requirements": ["Requirement 1"]
         })
 
-        req1 = MagicMock()
-        req1.content[0].text = json.dumps(["Requirement 1"])
-
-        intent2 = MagicMock()
-        intent2.content[0].text = json.dumps({
-            "intent_type": "bug",
-            "summary": "Bug 1",
-            "technical_area": "backend"
+        analysis2 = MagicMock()
+        analysis2.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "bug",
+                "summary": "Bug 1",
+                "technical_area": "backend"
+            },
+            "requirements": ["Fix 1"]
         })
 
-        req2 = MagicMock()
-        req2.content[0].text = json.dumps(["Fix 1"])
-
-        mock_client.messages.create.side_effect = [intent1, req1, intent2, req2]
+        mock_client.messages.create.side_effect = [analysis1, analysis2]
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
@@ -597,21 +588,22 @@ class TestNLWorkflowFailureScenarios:
             assert issue1.title != issue2.title
 
     @pytest.mark.asyncio
-    @patch('core.nl_processor.Anthropic')
+    @patch('core.nl_processor.AsyncAnthropic')
     async def test_workflow_with_all_project_types(self, mock_anthropic_class, tmp_path):
         """Test workflow works with all supported project types."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        intent_response = MagicMock()
-        intent_response.content[0].text = json.dumps({
-            "intent_type": "feature",
-            "summary": "Add feature",
-            "technical_area": "general"
+        analysis_response = MagicMock()
+        analysis_response.content[0].text = json.dumps({
+            "intent": {
+                "intent_type": "feature",
+                "summary": "Add feature",
+                "technical_area": "general"
+            },
+            "requirements": ["Requirement 1"]
         })
-
-        requirements_response = MagicMock()
-        requirements_response.content[0].text = json.dumps(["Requirement 1"])
+        mock_client.messages.create.return_value = analysis_response
 
         # Test with various project configurations
         project_configs = [
@@ -624,8 +616,6 @@ class TestNLWorkflowFailureScenarios:
         from core.data_models import ProjectContext
 
         for name, is_new, framework in project_configs:
-            mock_client.messages.create.side_effect = [intent_response, requirements_response]
-
             context = ProjectContext(
                 path=str(tmp_path / name),
                 is_new_project=is_new,